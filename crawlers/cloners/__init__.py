@@ -4,8 +4,13 @@ Cloners Module
 GitHub repository cloning functionality for smart contract security data.
 """
 from cloners.github_cloner import GitHubCloner, RepoInfo
+from cloners.manifest import CloneManifest
+from cloners.runner import clone_sources, run_category
 
 __all__ = [
+    "CloneManifest",
     "GitHubCloner",
     "RepoInfo",
+    "clone_sources",
+    "run_category",
 ]
@@ -11,7 +11,8 @@ from typing import Optional
 # Add crawlers to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from cloners.github_cloner import GitHubCloner
+from cloners.runner import clone_sources
+from config.settings import ensure_output_dirs
 from sources.source_registry import SourceRegistry
 from sources.source_types import Priority
 from utils.logger import log
@@ -23,6 +24,7 @@ def summarize_sources(sources) -> dict:
         "total": len(sources),
         "cloned": 0,
         "updated": 0,
+        "cached": 0,
         "failed": 0,
         "by_category": {},
         "by_priority": {},
@@ -39,7 +41,8 @@ def summarize_sources(sources) -> dict:
 def clone_all_repos(
     categories: Optional[list[str]] = None,
     priority_filter: Optional[Priority] = None,
-    dry_run: bool = False
+    dry_run: bool = False,
+    max_workers: Optional[int] = None,
 ):
     """
     Clone all GitHub repositories from configured sources.
@@ -48,6 +51,7 @@ def clone_all_repos(
         categories: Optional list of categories to clone. If None, clones all.
         priority_filter: Optional priority filter (HIGH, MEDIUM, LOW)
         dry_run: If True, only list what would be cloned without cloning
+        max_workers: Number of concurrent git processes (defaults to CLONE_CONCURRENCY)
     """
     log.info("Starting GitHub repositories cloning")
 
@@ -75,14 +79,10 @@ def clone_all_repos(
 
     log.info(f"Processing categories: {process_categories}")
 
-    # Initialize cloner
-    cloner = GitHubCloner()
-
     # Collect all sources
-    all_sources = []
-    for category in process_categories:
-        sources = registry.get_github_sources(category=category, priority=priority_filter)
-        all_sources.extend(sources)
+    all_sources = list(
+        registry.iter_github_sources(categories=process_categories, priority=priority_filter)
+    )
 
     if not all_sources:
         log.warning("No sources found matching criteria")
@@ -92,64 +92,20 @@ def clone_all_repos(
 
     # Dry run - just list
     if dry_run:
-        print("\n" + "="*60)
-        print("DRY RUN - Would clone the following repositories:")
-        print("="*60)
+        lines = ["", "="*60, "DRY RUN - Would clone the following repositories:", "="*60]
         for source in all_sources:
-            print(f"  [{source.priority.value.upper()}] {source.name} ({source.category})")
-            print(f"    URL: {source.url}")
-        print("="*60 + "\n")
+            lines.append(f"  [{source.priority.value.upper()}] {source.name} ({source.category})")
+            lines.append(f"    URL: {source.url}")
+        lines.extend(["="*60, "", ""])
+        sys.stdout.write("\n".join(lines))
         return [], summarize_sources(all_sources)
 
-    # Clone each repository
-    results = []
-    for idx, source in enumerate(all_sources, 1):
-        log.info(f"[{idx}/{len(all_sources)}] Processing: {source.name}")
-        log.info(f"  Category: {source.category} | Priority: {source.priority.value}")
-
-        result = cloner.clone_repo(
-            url=source.url,
-            category=source.category,
-            priority=source.priority.value
-        )
-        results.append(result)
-
-        # Print status
-        if result.status in ["cloned", "updated"]:
-            log.success(f"✓ {result.name}: {result.status}")
-        else:
-            log.error(f"✗ {result.name}: {result.error}")
-
-    # Print summary
-    summary = cloner.get_status_summary(results)
-    print("\n" + "="*60)
-    print("GITHUB REPOSITORIES CLONING SUMMARY")
-    print("="*60)
-    print(f"Total: {summary['total']}")
-    print(f"Cloned: {summary['cloned']}")
-    print(f"Updated: {summary['updated']}")
-    print(f"Failed: {summary['failed']}")
-
-    print("\nBy Category:")
-    for category, stats in summary['by_category'].items():
-        print(f"  {category}:")
-        print(f"    Success: {stats['success']}")
-        print(f"    Failed: {stats['failed']}")
-
-    print("\nBy Priority:")
-    for priority, stats in summary['by_priority'].items():
-        print(f"  {priority}:")
-        print(f"    Success: {stats['success']}")
-        print(f"    Failed: {stats['failed']}")
-
-    if summary['errors']:
-        print("\nErrors:")
-        for error in summary['errors']:
-            print(f"  - {error['repo']}: {error['error']}")
-
-    print("="*60 + "\n")
-
-    return results, summary
+    return clone_sources(
+        all_sources,
+        title="GITHUB REPOSITORIES CLONING SUMMARY",
+        breakdown=True,
+        max_workers=max_workers,
+    )
 
 
 def main():
@@ -172,6 +128,11 @@ def main():
         action="store_true",
         help="List repositories without cloning"
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        help="Number of concurrent git processes"
+    )
     parser.add_argument(
         "--list-categories",
         action="store_true",
@@ -179,6 +140,7 @@ def main():
     )
 
     args = parser.parse_args()
+    ensure_output_dirs()
 
     # List categories
     if args.list_categories:
@@ -196,7 +158,8 @@ def main():
     clone_all_repos(
         categories=args.categories,
         priority_filter=priority,
-        dry_run=args.dry_run
+        dry_run=args.dry_run,
+        max_workers=args.concurrency,
     )
 
 
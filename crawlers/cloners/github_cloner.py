@@ -3,17 +3,77 @@ GitHub Repository Cloner Module
 
 Handles cloning and updating of GitHub repositories for smart contract security data.
 """
+import asyncio
+import json
+import os
+import re
+import shutil
 import subprocess
+import tarfile
+import threading
+import time
+from collections import Counter, deque
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Literal, Optional, get_args
 from dataclasses import dataclass
 
 from github import Github, GithubException
-from ratelimit import limits, sleep_and_retry
 
-from config.settings import GITHUB_TOKEN, REPOS_DIR, RATE_LIMITS
-from utils.helpers import extract_repo_info, sanitize_filename, ensure_dir
+from config.settings import (
+    CATEGORY_CLONE_POLICY,
+    CLONE_CONCURRENCY,
+    CLONE_MODE,
+    CLONE_REFRESH_TTL,
+    GITHUB_API_CACHE_FILE,
+    GITHUB_TOKEN,
+    GIT_MEM_TUNING,
+    GIT_REFERENCE_CACHE,
+    RATE_LIMITS,
+    REPOS_DIR,
+)
+from cloners.manifest import CloneManifest
+from utils.helpers import extract_repo_info, sanitize_filename, ensure_dir, write_json
 from utils.logger import log
+from utils.rate_limiter import get_rate_limiter
+
+
+CloneMode = Literal["shallow", "partial", "bare", "full"]
+
+# Extra `git clone` flags for each clone mode. Bare repos keep every blob
+# locally so grep/archive never fetch lazily, and are never touched by hand,
+# so automatic gc is disabled to keep fetches from repacking them.
+CLONE_MODE_ARGS: dict[str, list[str]] = {
+    "shallow": ["--depth", "1"],
+    "partial": ["--filter=blob:none"],
+    "bare": ["--bare", "--config", "gc.auto=0"],
+    "full": [],
+}
+
+# Extra `git fetch` flags used to refresh a worktree clone of each mode
+REFRESH_FETCH_ARGS: dict[str, list[str]] = {
+    "shallow": ["--depth=1"],
+    "partial": ["--filter=blob:none"],
+    "full": [],
+}
+
+# Abort transfers that stall below 1 KB/s for 30s instead of waiting out the
+# clone timeout, and fail fast rather than prompting for credentials
+GIT_ENV = {
+    "GIT_HTTP_LOW_SPEED_LIMIT": "1000",
+    "GIT_HTTP_LOW_SPEED_TIME": "30",
+    "GIT_TERMINAL_PROMPT": "0",
+}
+
+# `-c` overrides passed to every git invocation: parallel submodule fetches and
+# protocol v2, which filters the ref advertisement server-side
+GIT_CONFIG = {
+    "submodule.fetchJobs": "8",
+    "protocol.version": "2",
+}
+
+# RepoInfo statuses that count as a successful clone/refresh
+SUCCESS_STATUSES = frozenset({"cloned", "updated", "cached"})
 
 
 @dataclass
@@ -24,62 +84,427 @@ class RepoInfo:
     local_path: Path
     category: str
     priority: str
-    status: str  # 'cloned', 'updated', 'failed'
+    status: str  # 'cloned', 'updated', 'cached', 'failed'
     error: Optional[str] = None
 
 
 class GitHubCloner:
     """Handles cloning and updating GitHub repositories."""
 
-    def __init__(self, output_dir: Optional[Path] = None):
+    SERVICE_NAME = "github"
+
+    # Pause API calls once GitHub reports this many requests left
+    RATE_LIMIT_RESERVE = 10
+
+    # Lines of git stderr kept for error reporting
+    STDERR_TAIL_LINES = 200
+
+    # Above this many repos, clone_many logs periodic progress instead of a line per repo
+    PROGRESS_THRESHOLD = 500
+
+    def __init__(
+        self,
+        output_dir: Optional[Path] = None,
+        clone_mode: Optional[CloneMode] = None,
+        api_cache_file: Optional[Path] = None,
+        reference_cache: Optional[bool] = None,
+        refresh_ttl: Optional[dict[str, float]] = None,
+        clone_policy: Optional[dict[str, CloneMode]] = None,
+    ):
+        """
+        Initialize the cloner.
+
+        Args:
+            output_dir: Root directory for cloned repos. Defaults to settings.REPOS_DIR
+            clone_mode: "partial" fetches blobs lazily (--filter=blob:none),
+                "shallow" keeps only the latest commit (--depth 1), "bare"
+                skips the working tree for repos that are only grepped and
+                "full" is a plain clone. Defaults to settings.CLONE_MODE.
+            api_cache_file: JSON file holding ETags and cached GitHub API
+                responses. Defaults to settings.GITHUB_API_CACHE_FILE.
+            reference_cache: Fetch each upstream into a per-owner bare cache and
+                clone with --reference-if-able/--dissociate, so repos sharing
+                history with an earlier clone reuse local objects.
+                Defaults to settings.GIT_REFERENCE_CACHE.
+            refresh_ttl: Seconds per priority during which an existing clone is
+                reported as "cached" instead of being fetched again.
+                Defaults to settings.CLONE_REFRESH_TTL.
+            clone_policy: Clone mode per category, overriding ``clone_mode``.
+                Defaults to settings.CATEGORY_CLONE_POLICY unless ``clone_mode``
+                is given explicitly, in which case it applies to every category.
+        """
         self.output_dir = output_dir or REPOS_DIR
+        self.clone_mode = clone_mode or CLONE_MODE
+        if clone_policy is None:
+            clone_policy = {} if clone_mode else CATEGORY_CLONE_POLICY
+        self.clone_policy = dict(clone_policy)
+        for mode in [self.clone_mode, *self.clone_policy.values()]:
+            if mode not in get_args(CloneMode):
+                raise ValueError(f"Unknown clone mode: {mode}")
         self.github = Github(GITHUB_TOKEN) if GITHUB_TOKEN else Github()
+        self.rate_limiter = get_rate_limiter()
+        self._catfile_procs: dict[Path, subprocess.Popen] = {}
+        self._catfile_lock = threading.Lock()
+        self.api_cache_file = api_cache_file or GITHUB_API_CACHE_FILE
+        self._api_cache = self._load_api_cache()
+        self._api_cache_lock = threading.Lock()
+        self.reference_cache = GIT_REFERENCE_CACHE if reference_cache is None else reference_cache
+        # The ceiling keeps git from discovering an enclosing repository when a
+        # repo directory under output_dir is empty or not a git checkout
+        self._env = {
+            **os.environ,
+            **GIT_ENV,
+            "GIT_CEILING_DIRECTORIES": str(Path(self.output_dir).resolve()),
+        }
+        self._git_config_args = [
+            *GIT_MEM_TUNING,
+            *(arg for key, value in GIT_CONFIG.items() for arg in ("-c", f"{key}={value}")),
+        ]
+        self.refresh_ttl = CLONE_REFRESH_TTL if refresh_ttl is None else refresh_ttl
+        self._category_dirs: dict[str, Path] = {}
         ensure_dir(self.output_dir)
+        self.manifest = CloneManifest(self.output_dir / ".manifest.sqlite")
+
+    def _category_dir(self, category: str) -> Path:
+        """Create a category directory once per cloner and return it."""
+        category_dir = self._category_dirs.get(category)
+        if category_dir is None:
+            category_dir = ensure_dir(self.output_dir / sanitize_filename(category))
+            self._category_dirs[category] = category_dir
+        return category_dir
+
+    def _mode_for(self, category: str) -> CloneMode:
+        """Clone mode used for a category."""
+        return self.clone_policy.get(category, self.clone_mode)
+
+    def _local_path(self, repo_name: str, category: str) -> Path:
+        """Resolve where a repository lives on disk; bare repos get a .git suffix."""
+        name = sanitize_filename(repo_name)
+        if self._mode_for(category) == "bare":
+            name += ".git"
+        return self.output_dir / sanitize_filename(category) / name
 
-    @sleep_and_retry
-    @limits(calls=RATE_LIMITS["github"]["calls"], period=RATE_LIMITS["github"]["period"])
     def _rate_limited_call(self, func, *args, **kwargs):
-        """Wrapper for rate-limited GitHub API calls."""
-        return func(*args, **kwargs)
+        """Wrapper for rate-limited GitHub API calls, shared across threads."""
+        with self.rate_limiter.limit(self.SERVICE_NAME):
+            return func(*args, **kwargs)
+
+    def _respect_rate_limit_headers(self, headers: dict) -> None:
+        """Back off until the reset time when GitHub reports a nearly exhausted budget."""
+        headers = {k.lower(): v for k, v in headers.items()}
+        try:
+            remaining = int(headers["x-ratelimit-remaining"])
+            reset_at = int(headers["x-ratelimit-reset"])
+        except (KeyError, ValueError):
+            return
+
+        if remaining > self.RATE_LIMIT_RESERVE:
+            return
+
+        wait = max(0.0, reset_at - time.time())
+        if wait > 0:
+            log.warning(f"GitHub API budget low ({remaining} left), waiting {wait:.0f}s for reset")
+            time.sleep(wait)
+
+    def get_repo_info(self, url: str, category: Optional[str] = None) -> dict:
+        """
+        Get repository information.
+
+        When ``category`` is given and the repo is already cloned, metadata is
+        read from the local clone and the GitHub API is skipped entirely.
+        """
+        owner, repo_name = extract_repo_info(url)
+        full_name = f"{owner}/{repo_name}"
+        if category:
+            local_path = self._local_path(repo_name, category)
+            if local_path.exists():
+                info = self._local_repo_info(local_path)
+                if info:
+                    return {"name": repo_name, "full_name": full_name, **info}
+
+        cached = self._api_cache.get(full_name)
+        headers = {"If-None-Match": cached["etag"]} if cached else None
 
-    def get_repo_info(self, url: str) -> dict:
-        """Get repository information from GitHub API."""
         try:
-            owner, repo_name = extract_repo_info(url)
-            repo = self._rate_limited_call(self.github.get_repo, f"{owner}/{repo_name}")
-            return {
-                "name": repo.name,
-                "full_name": repo.full_name,
-                "description": repo.description,
-                "stars": repo.stargazers_count,
-                "last_updated": repo.updated_at.isoformat(),
-                "default_branch": repo.default_branch,
-                "size_kb": repo.size,
-            }
+            response_headers, data = self._rate_limited_call(
+                self.github.requester.requestJsonAndCheck,
+                "GET",
+                f"/repos/{full_name}",
+                headers=headers,
+            )
         except GithubException as e:
             log.error(f"Failed to get repo info for {url}: {e}")
             return {}
 
+        self._respect_rate_limit_headers(response_headers)
+
+        # 304 Not Modified has an empty body and does not count against the API quota
+        if data is None:
+            log.debug("GitHub API cache hit: {}", full_name)
+            return dict(cached["info"]) if cached else {}
+
+        info = {
+            "name": data["name"],
+            "full_name": data["full_name"],
+            "description": data.get("description"),
+            "stars": data.get("stargazers_count"),
+            "last_updated": datetime.fromisoformat(data["updated_at"]).isoformat(),
+            "default_branch": data.get("default_branch"),
+            "size_kb": data.get("size"),
+        }
+
+        etag = next((v for k, v in response_headers.items() if k.lower() == "etag"), None)
+        if etag:
+            with self._api_cache_lock:
+                self._api_cache[full_name] = {"etag": etag, "info": info}
+                self._save_api_cache()
+        return info
+
+    def _load_api_cache(self) -> dict:
+        """Load cached GitHub API responses keyed by owner/repo."""
+        try:
+            with open(self.api_cache_file, "r") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            log.warning(f"Ignoring unreadable GitHub API cache {self.api_cache_file}: {e}")
+            return {}
+
+    def _save_api_cache(self) -> None:
+        """Persist cached GitHub API responses."""
+        try:
+            ensure_dir(self.api_cache_file.parent)
+            write_json(self.api_cache_file, self._api_cache)
+        except OSError as e:
+            log.warning(f"Failed to save GitHub API cache: {e}")
+
+    def _catfile_pipe(self, local_path: Path) -> subprocess.Popen:
+        """Return a long-lived `git cat-file --batch` process for a repo."""
+        proc = self._catfile_procs.get(local_path)
+        if proc is None or proc.poll() is not None:
+            proc = subprocess.Popen(
+                ["git", *self._git_config_args, "-C", str(local_path), "cat-file", "--batch"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                env=self._env,
+            )
+            self._catfile_procs[local_path] = proc
+        return proc
+
+    def _local_repo_info(self, local_path: Path) -> dict:
+        """Read HEAD metadata from a local clone via a pooled cat-file pipe."""
+        try:
+            with self._catfile_lock:
+                proc = self._catfile_pipe(local_path)
+                proc.stdin.write(b"HEAD\n")
+                proc.stdin.flush()
+                header = proc.stdout.readline().decode().split()
+                # "<sha> commit <size>" on success, "HEAD missing" otherwise
+                if len(header) != 3 or header[1] != "commit":
+                    return {}
+                body = proc.stdout.read(int(header[2]) + 1).decode(errors="replace")
+
+            info = {"head_sha": header[0], "local_path": str(local_path)}
+            for line in body.splitlines():
+                if line.startswith("committer "):
+                    timestamp = int(line.rsplit(" ", 2)[-2])
+                    info["last_updated"] = datetime.fromtimestamp(timestamp, timezone.utc).isoformat()
+                    break
+
+            # A gitfile .git (worktree, submodule) or corrupt HEAD fails here
+            git_dir = local_path / ".git" if (local_path / ".git").is_dir() else local_path
+            head_ref = (git_dir / "HEAD").read_text().strip()
+        except (OSError, ValueError) as e:
+            log.warning(f"Failed to read local repo info for {local_path}: {e}")
+            return {}
+
+        if head_ref.startswith("ref: refs/heads/"):
+            info["default_branch"] = head_ref.removeprefix("ref: refs/heads/")
+        return info
+
+    def export_worktree(self, local_path: Path, dest: Path, ref: str = "HEAD") -> Path:
+        """
+        Materialize the files of a (bare) clone on demand.
+
+        Streams `git archive` of ``ref`` into ``dest``, the equivalent of
+        `git archive HEAD | tar x` without needing a checkout.
+        """
+        ensure_dir(dest)
+        proc = subprocess.Popen(
+            ["git", *self._git_config_args, "-C", str(local_path), "archive", "--format=tar", ref],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            env=self._env,
+        )
+        try:
+            with tarfile.open(fileobj=proc.stdout, mode="r|") as archive:
+                archive.extractall(dest, filter="data")
+        except tarfile.ReadError:
+            # Empty stream: git failed before writing anything; report its error below
+            pass
+        finally:
+            proc.stdout.close()
+            stderr = proc.stderr.read().decode(errors="replace")
+            proc.stderr.close()
+            proc.wait()
+
+        if proc.returncode != 0:
+            raise RuntimeError(f"git archive failed for {local_path}: {stderr.strip()}")
+        return dest
+
+    def close(self) -> None:
+        """Terminate pooled git cat-file processes and close the clone manifest."""
+        with self._catfile_lock:
+            for proc in self._catfile_procs.values():
+                if proc.stdin:
+                    proc.stdin.close()
+                proc.wait()
+                if proc.stdout:
+                    proc.stdout.close()
+            self._catfile_procs.clear()
+        self.manifest.close()
+
+    async def _run_git(
+        self,
+        args: list[str],
+        timeout: float,
+        capture_stdout: bool = False,
+    ) -> subprocess.CompletedProcess:
+        """
+        Run a git command without blocking the event loop.
+
+        stderr is streamed and only its last STDERR_TAIL_LINES lines are kept,
+        so chatty clones of large repos can't grow memory without bound.
+        stdout is discarded unless ``capture_stdout`` is set.
+        """
+        cmd = ["git", *self._git_config_args, *args]
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE if capture_stdout else asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE,
+            env=self._env,
+        )
+        stderr_tail: deque[str] = deque(maxlen=self.STDERR_TAIL_LINES)
+
+        async def collect() -> bytes:
+            reads = [self._drain_stderr(proc.stderr, stderr_tail)]
+            if capture_stdout:
+                reads.append(proc.stdout.read())
+            outputs = await asyncio.gather(*reads)
+            await proc.wait()
+            return outputs[1] if capture_stdout else b""
+
+        try:
+            stdout = await asyncio.wait_for(collect(), timeout=timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise subprocess.TimeoutExpired(cmd, timeout)
+
+        return subprocess.CompletedProcess(
+            cmd,
+            proc.returncode,
+            stdout.decode(errors="replace"),
+            "\n".join(stderr_tail),
+        )
+
+    @staticmethod
+    async def _drain_stderr(stream: asyncio.StreamReader, tail: deque) -> None:
+        """Read git stderr incrementally, keeping only the most recent lines."""
+        pending = b""
+        while chunk := await stream.read(65536):
+            # Progress output is separated by carriage returns rather than newlines
+            *lines, pending = re.split(rb"[\r\n]", pending + chunk)
+            for line in lines:
+                if line.strip():
+                    text = line.decode(errors="replace")
+                    tail.append(text)
+                    log.debug("git: {}", text)
+        if pending.strip():
+            tail.append(pending.decode(errors="replace"))
+
+    def _reference_cache_path(self, owner: str) -> Path:
+        """Bare object cache shared by all repos of one owner."""
+        return self.output_dir / ".cache" / f"{sanitize_filename(owner)}.git"
+
+    async def _warm_reference_cache(self, owner: str, repo_name: str, url: str) -> Optional[Path]:
+        """Fetch an upstream into its owner's reference cache; returns the cache path."""
+        cache_path = self._reference_cache_path(owner)
+        try:
+            if not cache_path.exists():
+                result = await self._run_git(["init", "--quiet", "--bare", str(cache_path)], timeout=60)
+                if result.returncode != 0:
+                    raise RuntimeError(result.stderr.strip())
+
+            # Fetch by URL into a per-repo ref namespace: no remote config is written,
+            # so concurrent clones of the same owner don't contend on the config lock
+            refspec = f"+refs/heads/*:refs/remotes/{sanitize_filename(repo_name)}/*"
+            result = await self._run_git(
+                ["-C", str(cache_path), "fetch", "--quiet", "--no-tags", "--prune", url, refspec],
+                timeout=300,
+            )
+            if result.returncode != 0:
+                raise RuntimeError(result.stderr.strip())
+            return cache_path
+        except Exception as e:
+            log.warning(f"Reference cache unavailable for {owner}/{repo_name}: {e}")
+            return None
+
     def clone_repo(self, url: str, category: str = "general", priority: str = "medium") -> RepoInfo:
         """Clone a repository to the local filesystem."""
+        return asyncio.run(self.clone_repo_async(url, category, priority))
+
+    def update_repo(self, url: str, category: str = "general", priority: str = "medium") -> RepoInfo:
+        """Update an existing repository."""
+        return asyncio.run(self.update_repo_async(url, category, priority))
+
+    async def clone_repo_async(
+        self,
+        url: str,
+        category: str = "general",
+        priority: str = "medium",
+        exists: Optional[bool] = None,
+    ) -> RepoInfo:
+        """
+        Clone a repository to the local filesystem.
+
+        ``exists`` lets batch callers pass a precomputed existence check
+        (see clone_many); when None the local path is stat()ed.
+        """
         owner, repo_name = extract_repo_info(url)
-        category_dir = ensure_dir(self.output_dir / sanitize_filename(category))
-        local_path = category_dir / sanitize_filename(repo_name)
+        self._category_dir(category)
+        local_path = self._local_path(repo_name, category)
 
-        if local_path.exists():
-            return self.update_repo(url, category, priority)
+        if exists is None:
+            exists = local_path.exists()
+
+        if exists:
+            if self.manifest.is_fresh(url, self.refresh_ttl.get(priority, 0)):
+                log.info("Skipping {}, fetched recently", repo_name)
+                return RepoInfo(
+                    name=repo_name,
+                    url=url,
+                    local_path=local_path,
+                    category=category,
+                    priority=priority,
+                    status="cached",
+                )
+            return await self.update_repo_async(url, category, priority, exists=True)
 
         try:
-            log.info(f"Cloning {url} to {local_path}")
-            result = subprocess.run(
-                ["git", "clone", "--depth", "1", url, str(local_path)],
-                capture_output=True,
-                text=True,
-                timeout=300,
-            )
+            log.info("Cloning {} to {}", url, local_path)
+            args = ["clone", *CLONE_MODE_ARGS[self._mode_for(category)]]
+            if self.reference_cache:
+                cache_path = await self._warm_reference_cache(owner, repo_name, url)
+                if cache_path:
+                    args.extend(["--reference-if-able", str(cache_path), "--dissociate"])
+            result = await self._run_git([*args, url, str(local_path)], timeout=300)
 
             if result.returncode == 0:
-                log.success(f"Successfully cloned {repo_name}")
+                log.success("Successfully cloned {}", repo_name)
+                await self._record_fetch(url, local_path, "cloned")
                 return RepoInfo(
                     name=repo_name,
                     url=url,
@@ -124,26 +549,77 @@ class GitHubCloner:
                 error=str(e),
             )
 
-    def update_repo(self, url: str, category: str = "general", priority: str = "medium") -> RepoInfo:
+    async def _refresh_repo(self, local_path: Path, mode: CloneMode) -> subprocess.CompletedProcess:
+        """
+        Bring an existing clone up to date with its upstream branch.
+
+        Fetches only the current branch tip and hard-resets onto it, which
+        skips the merge machinery of `git pull` and keeps shallow/partial
+        clones in their original shape.
+        """
+        git_dir = ["-C", str(local_path)]
+
+        if mode == "bare":
+            # Bare repos have no worktree to reset; refresh branch refs directly
+            return await self._run_git(
+                [*git_dir, "fetch", "--prune", "origin", "+refs/heads/*:refs/heads/*"],
+                timeout=120,
+            )
+
+        result = await self._run_git(
+            [*git_dir, "rev-parse", "--abbrev-ref", "HEAD"],
+            timeout=30,
+            capture_stdout=True,
+        )
+        branch = result.stdout.strip()
+        if result.returncode != 0:
+            return result
+        if branch in ("", "HEAD"):
+            return subprocess.CompletedProcess(result.args, 1, result.stdout, "HEAD is detached")
+
+        result = await self._run_git(
+            [*git_dir, "fetch", *REFRESH_FETCH_ARGS[mode], "origin", branch],
+            timeout=120,
+        )
+        if result.returncode != 0:
+            return result
+
+        return await self._run_git([*git_dir, "reset", "--quiet", "--hard", "FETCH_HEAD"], timeout=120)
+
+    async def _record_fetch(self, url: str, local_path: Path, status: str) -> None:
+        """Store the fetch time and HEAD sha of a freshly cloned/updated repo."""
+        result = await self._run_git(
+            ["-C", str(local_path), "rev-parse", "HEAD"],
+            timeout=30,
+            capture_stdout=True,
+        )
+        sha = (result.stdout.strip() or None) if result.returncode == 0 else None
+        self.manifest.record(url, sha, status)
+
+    async def update_repo_async(
+        self,
+        url: str,
+        category: str = "general",
+        priority: str = "medium",
+        exists: Optional[bool] = None,
+    ) -> RepoInfo:
         """Update an existing repository."""
         owner, repo_name = extract_repo_info(url)
-        category_dir = self.output_dir / sanitize_filename(category)
-        local_path = category_dir / sanitize_filename(repo_name)
+        local_path = self._local_path(repo_name, category)
+
+        if exists is None:
+            exists = local_path.exists()
 
-        if not local_path.exists():
-            return self.clone_repo(url, category, priority)
+        if not exists:
+            return await self.clone_repo_async(url, category, priority, exists=False)
 
         try:
-            log.info(f"Updating {repo_name}")
-            result = subprocess.run(
-                ["git", "-C", str(local_path), "pull", "--ff-only"],
-                capture_output=True,
-                text=True,
-                timeout=120,
-            )
+            log.info("Updating {}", repo_name)
+            result = await self._refresh_repo(local_path, self._mode_for(category))
 
             if result.returncode == 0:
-                log.success(f"Successfully updated {repo_name}")
+                log.success("Successfully updated {}", repo_name)
+                await self._record_fetch(url, local_path, "updated")
                 return RepoInfo(
                     name=repo_name,
                     url=url,
@@ -153,11 +629,10 @@ class GitHubCloner:
                     status="updated",
                 )
             else:
-                # Try a fresh clone if pull fails
-                log.warning(f"Pull failed for {repo_name}, attempting fresh clone")
-                import shutil
+                # Try a fresh clone if the refresh fails
+                log.warning(f"Refresh failed for {repo_name}, attempting fresh clone")
                 shutil.rmtree(local_path)
-                return self.clone_repo(url, category, priority)
+                return await self.clone_repo_async(url, category, priority, exists=False)
 
         except Exception as e:
             log.error(f"Error updating {repo_name}: {e}")
@@ -171,57 +646,123 @@ class GitHubCloner:
                 error=str(e),
             )
 
+    def clone_many(
+        self,
+        repos: list[tuple[str, str, str]],
+        max_workers: Optional[int] = None,
+    ) -> list[RepoInfo]:
+        """
+        Clone or update many repositories concurrently.
+
+        Args:
+            repos: List of (url, category, priority) tuples
+            max_workers: Number of concurrent git processes. Defaults to
+                CLONE_CONCURRENCY, capped by the GitHub rate limit.
+
+        Returns:
+            RepoInfo results in the same order as ``repos``
+        """
+        if not repos:
+            return []
+
+        workers = max_workers or min(CLONE_CONCURRENCY, RATE_LIMITS["github"]["calls"])
+        return asyncio.run(self._clone_many_async(repos, max(1, workers)))
+
+    def _existing_repo_dirs(self, category: str) -> frozenset[str]:
+        """List the repo directories of a category with a single directory read."""
+        try:
+            with os.scandir(self.output_dir / sanitize_filename(category)) as entries:
+                return frozenset(e.name for e in entries if e.is_dir(follow_symlinks=False))
+        except FileNotFoundError:
+            return frozenset()
+
+    async def _clone_many_async(
+        self, repos: list[tuple[str, str, str]], workers: int
+    ) -> list[RepoInfo]:
+        """Run clone tasks on one event loop, bounded by a semaphore."""
+        semaphore = asyncio.Semaphore(workers)
+        total = len(repos)
+        per_repo_lines = total <= self.PROGRESS_THRESHOLD
+        progress_every = max(1, total // 20)
+        done = failed = 0
+        existing = {
+            category: self._existing_repo_dirs(category)
+            for category in dict.fromkeys(category for _, category, _ in repos)
+        }
+
+        async def run(url: str, category: str, priority: str) -> RepoInfo:
+            nonlocal done, failed
+            try:
+                exists = self._local_path(extract_repo_info(url)[1], category).name in existing[category]
+            except ValueError:
+                exists = None
+
+            async with semaphore:
+                result = await self.clone_repo_async(url, category, priority, exists=exists)
+
+            done += 1
+            if result.status in SUCCESS_STATUSES:
+                if per_repo_lines:
+                    log.success("✓ {}: {}", result.name, result.status)
+            else:
+                failed += 1
+                log.error("✗ {}: {}", result.name, result.error)
+
+            if not per_repo_lines and (done % progress_every == 0 or done == total):
+                log.info("Progress: {}/{} repositories ({} failed)", done, total, failed)
+            return result
+
+        return list(await asyncio.gather(*(run(*repo) for repo in repos)))
+
     def clone_all_from_config(self, config: dict) -> list[RepoInfo]:
         """Clone all repositories defined in the configuration."""
-        results = []
-
-        # Process each category of repos
-        for category, repos in config.get("github_repos", {}).items():
-            log.info(f"Processing category: {category}")
-            for repo in repos:
-                result = self.clone_repo(
-                    url=repo["url"],
-                    category=category,
-                    priority=repo.get("priority", "medium"),
-                )
-                results.append(result)
-
-        return results
+        repos = [
+            (repo["url"], category, repo.get("priority", "medium"))
+            for category, category_repos in config.get("github_repos", {}).items()
+            for repo in category_repos
+        ]
+        return self.clone_many(repos)
 
     def get_status_summary(self, results: list[RepoInfo]) -> dict:
         """Generate a summary of cloning operations."""
-        summary = {
-            "total": len(results),
-            "cloned": sum(1 for r in results if r.status == "cloned"),
-            "updated": sum(1 for r in results if r.status == "updated"),
-            "failed": sum(1 for r in results if r.status == "failed"),
-            "by_category": {},
-            "by_priority": {},
-            "errors": [],
-        }
+        status_counts: Counter = Counter()
+        category_counts: Counter = Counter()
+        priority_counts: Counter = Counter()
+        errors = []
 
         for result in results:
-            # By category
-            if result.category not in summary["by_category"]:
-                summary["by_category"][result.category] = {"success": 0, "failed": 0}
-            if result.status in ["cloned", "updated"]:
-                summary["by_category"][result.category]["success"] += 1
-            else:
-                summary["by_category"][result.category]["failed"] += 1
-
-            # By priority
-            if result.priority not in summary["by_priority"]:
-                summary["by_priority"][result.priority] = {"success": 0, "failed": 0}
-            if result.status in ["cloned", "updated"]:
-                summary["by_priority"][result.priority]["success"] += 1
-            else:
-                summary["by_priority"][result.priority]["failed"] += 1
+            outcome = "success" if result.status in SUCCESS_STATUSES else "failed"
+            status_counts[result.status] += 1
+            category_counts[result.category, outcome] += 1
+            priority_counts[result.priority, outcome] += 1
 
             # Collect errors
             if result.error:
-                summary["errors"].append({
+                errors.append({
                     "repo": result.name,
                     "error": result.error,
                 })
 
-        return summary
+        # dict.fromkeys keeps categories/priorities in first-seen order
+        return {
+            "total": len(results),
+            "cloned": status_counts["cloned"],
+            "updated": status_counts["updated"],
+            "cached": status_counts["cached"],
+            "failed": status_counts["failed"],
+            "by_category": {
+                category: {
+                    "success": category_counts[category, "success"],
+                    "failed": category_counts[category, "failed"],
+                }
+                for category in dict.fromkeys(r.category for r in results)
+            },
+            "by_priority": {
+                priority: {
+                    "success": priority_counts[priority, "success"],
+                    "failed": priority_counts[priority, "failed"],
+                }
+                for priority in dict.fromkeys(r.priority for r in results)
+            },
+            "errors": errors,
+        }
@@ -0,0 +1,64 @@
+"""
+Clone Manifest
+
+SQLite record of when each repository was last fetched and at which commit,
+used to skip refreshing clones that were updated recently.
+"""
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from utils.helpers import ensure_dir
+
+
+class CloneManifest:
+    """Tracks (url, last fetch time, HEAD sha, status) for cloned repositories."""
+
+    def __init__(self, db_path: Path):
+        """
+        Open (or create) the manifest database.
+
+        Args:
+            db_path: SQLite file, usually REPOS_DIR/.manifest.sqlite
+        """
+        self.db_path = db_path
+        ensure_dir(db_path.parent)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS clones("
+                "url TEXT PRIMARY KEY, ts INTEGER, sha TEXT, status TEXT)"
+            )
+
+    def get(self, url: str) -> Optional[dict]:
+        """Return the manifest entry for a URL, or None if it was never recorded."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT ts, sha, status FROM clones WHERE url = ?", (url,)
+            ).fetchone()
+        if row is None:
+            return None
+        return {"ts": row[0], "sha": row[1], "status": row[2]}
+
+    def is_fresh(self, url: str, ttl: float) -> bool:
+        """Check whether a URL was fetched less than ``ttl`` seconds ago."""
+        entry = self.get(url)
+        return entry is not None and time.time() - entry["ts"] < ttl
+
+    def record(self, url: str, sha: Optional[str], status: str) -> None:
+        """Store a successful fetch of a URL at the current time."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO clones(url, ts, sha, status) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(url) DO UPDATE SET ts = excluded.ts, sha = excluded.sha, "
+                "status = excluded.status",
+                (url, int(time.time()), sha, status),
+            )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,144 @@
+"""
+Shared Clone Runner
+
+Common clone loop used by the per-category cloner scripts and clone_all:
+resolve sources, clone them concurrently and print a summary.
+"""
+import sys
+from typing import Optional
+
+from cloners.github_cloner import GitHubCloner, RepoInfo
+from config.settings import ensure_output_dirs
+from sources.source_registry import SourceRegistry
+from sources.source_types import GitHubSource, Priority
+from utils.logger import log
+
+
+def format_clone_summary(summary: dict, title: str, breakdown: bool = False) -> str:
+    """Render a cloning summary, optionally broken down by category and priority."""
+    lines = [
+        "",
+        "="*60,
+        title,
+        "="*60,
+        f"Total: {summary['total']}",
+        f"Cloned: {summary['cloned']}",
+        f"Updated: {summary['updated']}",
+        f"Cached: {summary['cached']}",
+        f"Failed: {summary['failed']}",
+    ]
+
+    if breakdown:
+        for heading, key in (("By Category:", "by_category"), ("By Priority:", "by_priority")):
+            lines.extend(["", heading])
+            for name, stats in summary[key].items():
+                lines.append(f"  {name}:")
+                lines.append(f"    Success: {stats['success']}")
+                lines.append(f"    Failed: {stats['failed']}")
+
+    if summary['errors']:
+        lines.extend(["", "Errors:"])
+        lines.extend(f"  - {error['repo']}: {error['error']}" for error in summary['errors'])
+
+    lines.extend(["="*60, "", ""])
+    return "\n".join(lines)
+
+
+def print_clone_summary(summary: dict, title: str, breakdown: bool = False) -> None:
+    """Write a cloning summary to stdout in a single call."""
+    sys.stdout.write(format_clone_summary(summary, title, breakdown=breakdown))
+    sys.stdout.flush()
+
+
+def clone_sources(
+    sources: list[GitHubSource],
+    title: str,
+    breakdown: bool = False,
+    max_workers: Optional[int] = None,
+) -> tuple[list[RepoInfo], dict]:
+    """
+    Clone a list of GitHub sources concurrently and print a summary.
+
+    Args:
+        sources: Sources to clone
+        title: Heading for the printed summary
+        breakdown: Include per-category and per-priority stats in the summary
+        max_workers: Number of concurrent git processes (defaults to CLONE_CONCURRENCY)
+
+    Returns:
+        Tuple of (results, summary)
+    """
+    cloner = GitHubCloner()
+
+    for source in sources:
+        if source.stats:
+            log.info("{} stats: {}", source.name, source.stats)
+
+    results = cloner.clone_many(
+        [(source.url, source.category, source.priority.value) for source in sources],
+        max_workers=max_workers,
+    )
+
+    summary = cloner.get_status_summary(results)
+    print_clone_summary(summary, title, breakdown=breakdown)
+    return results, summary
+
+
+def run_category(
+    category: str,
+    label: str,
+    priority_filter: Optional[Priority] = None,
+    max_workers: Optional[int] = None,
+):
+    """
+    Clone all sources of one GitHub category.
+
+    Args:
+        category: Category key in sources.yaml (e.g. "audit_repos")
+        label: Human readable name used in logs and the summary title
+        priority_filter: Optional priority filter (HIGH, MEDIUM, LOW)
+        max_workers: Number of concurrent git processes
+
+    Returns:
+        Tuple of (results, summary), or None if no sources matched
+    """
+    log.info(f"Starting {label} cloning")
+
+    registry = SourceRegistry()
+    sources = registry.get_github_sources(category=category, priority=priority_filter)
+
+    if not sources:
+        log.warning(f"No {label} sources found")
+        return
+
+    log.info(f"Found {len(sources)} {label} to clone")
+
+    return clone_sources(
+        sources,
+        title=f"{label.upper()} CLONING SUMMARY",
+        max_workers=max_workers,
+    )
+
+
+def run_category_cli(category: str, label: str) -> None:
+    """Command line entry point shared by the per-category cloner scripts."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description=f"Clone {label} from GitHub")
+    parser.add_argument(
+        "--priority",
+        choices=["high", "medium", "low"],
+        help="Filter by priority level"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        help="Number of concurrent git processes"
+    )
+
+    args = parser.parse_args()
+    ensure_output_dirs()
+
+    priority = Priority(args.priority.lower()) if args.priority else None
+
+    run_category(category, label, priority_filter=priority, max_workers=args.concurrency)
@@ -26,9 +26,15 @@ REPORTS_DIR = OUTPUT_DIR / "reports"
 DATASETS_DIR = OUTPUT_DIR / "datasets"
 EXPLOITS_DIR = OUTPUT_DIR / "exploits"
 
-# Ensure directories exist
-for dir_path in [REPOS_DIR, REPORTS_DIR, DATASETS_DIR, EXPLOITS_DIR]:
-    dir_path.mkdir(parents=True, exist_ok=True)
+# Conditional-request (ETag) cache for GitHub API metadata
+GITHUB_API_CACHE_FILE = OUTPUT_DIR / ".gh_cache.json"
+
+
+def ensure_output_dirs() -> None:
+    """Create the output directories; called by entry points rather than at import."""
+    for dir_path in [REPOS_DIR, REPORTS_DIR, DATASETS_DIR, EXPLOITS_DIR]:
+        dir_path.mkdir(parents=True, exist_ok=True)
+
 
 # API Keys (from environment)
 GITHUB_TOKEN = _env_value("GITHUB_TOKEN")
@@ -38,12 +44,72 @@ HUGGINGFACE_TOKEN = _env_value("HUGGINGFACE_TOKEN")
 
 # Rate limiting settings
 RATE_LIMITS = {
-    "github": {"calls": 30, "period": 60},  # 30 calls per minute
+    # Core REST API budget: 5000/hour authenticated, 60/hour anonymous
+    "github": {"calls": 5000 if GITHUB_TOKEN else 60, "period": 3600},
     "web_scraper": {"calls": 10, "period": 60},  # 10 calls per minute
     "kaggle": {"calls": 5, "period": 60},
     "huggingface": {"calls": 10, "period": 60},
 }
 
+# Concurrent git processes per clone run (bounded further by the GitHub rate limit)
+CLONE_CONCURRENCY = int(os.getenv("CLONE_CONCURRENCY", "16"))
+
+# Default clone mode: "partial" (blobless), "shallow" (--depth 1), "bare" or "full"
+CLONE_MODE = os.getenv("CLONE_MODE", "partial")
+
+# Skip refreshing a clone fetched less than this many seconds ago, per priority
+CLONE_REFRESH_TTL = {
+    "high": 6 * 3600,
+    "medium": 24 * 3600,
+    "low": 7 * 24 * 3600,
+}
+
+# Per-category clone mode (falls back to CLONE_MODE). Categories that are only
+# read and grepped are kept bare; "full" keeps a complete, editable worktree.
+CATEGORY_CLONE_POLICY = {
+    "vulnerability_datasets": "bare",
+    "aggregators": "bare",
+    "audit_repos": "partial",
+    "educational": "full",
+}
+
+# Share objects between repos of the same owner through REPOS_DIR/.cache/<owner>.git
+GIT_REFERENCE_CACHE = os.getenv("GIT_REFERENCE_CACHE", "false").lower() in ("1", "true", "yes")
+
+# `-c` flags passed to every git process to bound its memory: a smaller delta
+# window and mmap limits cost some compression speed but give each concurrent
+# clone a predictable RSS ceiling. Override with a comma-separated env value.
+GIT_MEM_TUNING = [
+    arg
+    for setting in os.getenv(
+        "GIT_MEM_TUNING",
+        "pack.windowMemory=64m,pack.packSizeLimit=64m,"
+        "core.packedGitLimit=128m,core.packedGitWindowSize=32m",
+    ).split(",")
+    if setting.strip()
+    for arg in ("-c", setting.strip())
+]
+
+# Concurrent file downloads (snapshot_download max_workers) in HuggingFaceDownloader
+HF_DOWNLOAD_WORKERS = int(os.getenv("HF_PARALLEL_DOWNLOADING_WORKERS", "8"))
+
+# Worker processes used by datasets' save_to_disk when converting large splits to Arrow
+HF_SAVE_NUM_PROC = int(os.getenv("HF_SAVE_NUM_PROC", str(min(8, os.cpu_count() or 1))))
+
+# Upper bound for each Arrow shard written by save_to_disk; fewer, larger files load faster
+HF_MAX_SHARD_SIZE = os.getenv("HF_MAX_SHARD_SIZE", "2GB")
+
+# Seconds a cached HuggingFace dataset_info response is trusted before revalidating its sha
+HF_INFO_CACHE_TTL = int(os.getenv("HF_INFO_CACHE_TTL", str(24 * 3600)))
+
+# Worker processes used to extract large Kaggle archives
+KAGGLE_EXTRACT_WORKERS = int(os.getenv("KAGGLE_EXTRACT_WORKERS", str(min(8, os.cpu_count() or 1))))
+
+# Seconds a scraped page is reused from the on-disk cache (0 disables): listings
+# change as contests are added, report/detail pages rarely change once published
+SCRAPER_LISTING_CACHE_TTL = int(os.getenv("SCRAPER_LISTING_CACHE_TTL", str(7 * 24 * 3600)))
+SCRAPER_DETAIL_CACHE_TTL = int(os.getenv("SCRAPER_DETAIL_CACHE_TTL", str(365 * 24 * 3600)))
+
 # Retry settings
 RETRY_CONFIG = {
     "max_attempts": 3,
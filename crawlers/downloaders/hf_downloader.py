@@ -6,19 +6,87 @@ Optionally uses HUGGINGFACE_TOKEN for private datasets.
 """
 from __future__ import annotations
 
+import importlib.util
 import json
 import os
 import shutil
 import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Optional, Union
-
-from config.settings import DATASETS_DIR, HUGGINGFACE_TOKEN
-from utils.helpers import ensure_dir, sanitize_filename, load_sources_config
+from typing import Literal, Optional, Union
+
+from config.settings import (
+    DATASETS_DIR,
+    HF_DOWNLOAD_WORKERS,
+    HF_INFO_CACHE_TTL,
+    HF_MAX_SHARD_SIZE,
+    HF_SAVE_NUM_PROC,
+    HUGGINGFACE_TOKEN,
+)
+from utils.helpers import (
+    advise_page_cache,
+    compile_globs,
+    dataset_file_stats,
+    dir_size,
+    discard_dir,
+    ensure_dir,
+    iter_files,
+    load_sources_config,
+    read_completion_marker,
+    sanitize_filename,
+    subdir_names,
+    write_completion_marker,
+    write_json,
+)
 from utils.logger import log
 from utils.rate_limiter import get_rate_limiter
 
 
+@lru_cache(maxsize=1)
+def _import_datasets():
+    """Import the datasets library once per process."""
+    import datasets
+    return datasets
+
+
+@lru_cache(maxsize=1)
+def _import_hub():
+    """Import the huggingface_hub entry points once per process."""
+    from huggingface_hub import HfApi, snapshot_download
+    return HfApi, snapshot_download
+
+
+@lru_cache(maxsize=1)
+def _import_pyarrow():
+    """Import pyarrow and its parquet writer once per process."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    return pa, pq
+
+
+@lru_cache(maxsize=1)
+def _locate_hf_cli() -> Optional[str]:
+    """Find the HuggingFace CLI on PATH once per process."""
+    return shutil.which("hf") or shutil.which("huggingface-cli")
+
+
+@lru_cache(maxsize=4)
+def _probe_symlinks_flag(cli_path: str) -> bool:
+    """Check once per CLI binary whether `download` accepts --local-dir-use-symlinks."""
+    try:
+        result = subprocess.run(
+            [cli_path, "download", "--help"],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+    except OSError:
+        return False
+    return "--local-dir-use-symlinks" in (result.stdout or "") + (result.stderr or "")
+
+
 class HuggingFaceDownloader:
     """
     Download datasets from HuggingFace Hub.
@@ -29,6 +97,18 @@ class HuggingFaceDownloader:
 
     SERVICE_NAME = "huggingface"
 
+    # Files fetched by raw downloads: the parquet shards plus dataset card/config
+    RAW_PATTERNS = ["*.parquet", "*.json", "README*"]
+
+    # Rows per record batch when streaming a config/split selection to parquet
+    STREAM_BATCH_SIZE = 1000
+
+    # Datasets downloaded at once by download_all_defaults
+    MAX_PARALLEL_DATASETS = 4
+
+    # Splits with at least this many rows are written by HF_SAVE_NUM_PROC processes
+    PARALLEL_SAVE_MIN_ROWS = 100_000
+
     # Target datasets for this project
     DEFAULT_DATASETS = [
         {
@@ -45,6 +125,9 @@ class HuggingFaceDownloader:
         output_dir: Optional[Path] = None,
         token: Optional[str] = None,
         datasets: Optional[list[dict]] = None,
+        enable_hf_transfer: bool = True,
+        download_workers: Optional[int] = None,
+        info_cache_dir: Optional[Path] = None,
     ):
         """
         Initialize HuggingFace downloader.
@@ -53,12 +136,22 @@ class HuggingFaceDownloader:
             output_dir: Directory to save datasets. Defaults to settings.DATASETS_DIR/huggingface
             token: HuggingFace API token. Defaults to HUGGINGFACE_TOKEN env var.
             datasets: Optional list of dataset configs overriding defaults.
+            enable_hf_transfer: Split large file downloads into parallel range
+                requests via the optional `hf_transfer` package (and hf_xet's
+                high-performance mode) when available.
+            download_workers: Concurrent file downloads (snapshot_download max_workers)
+                in download_dataset_files.
+                Defaults to settings.HF_DOWNLOAD_WORKERS.
+            info_cache_dir: Directory caching get_dataset_info responses.
+                Defaults to <output_dir>/.info_cache.
         """
         self.output_dir = ensure_dir(output_dir or DATASETS_DIR / "huggingface")
         self.token = token or HUGGINGFACE_TOKEN
         self.rate_limiter = get_rate_limiter()
+        self.download_workers = max(1, download_workers or HF_DOWNLOAD_WORKERS)
+        self.info_cache_dir = info_cache_dir or self.output_dir / ".info_cache"
         self.default_datasets = datasets or self._load_default_datasets()
-        self.hf_cli = shutil.which("hf") or shutil.which("huggingface-cli")
+        self.hf_cli = _locate_hf_cli()
         self.cli_available = self.hf_cli is not None
 
         if not self.cli_available:
@@ -70,6 +163,31 @@ class HuggingFaceDownloader:
             os.environ["HF_TOKEN"] = self.token
             log.debug("HuggingFace token configured")
 
+        if enable_hf_transfer:
+            self._enable_fast_transfer()
+
+    def _enable_fast_transfer(self) -> None:
+        """
+        Turn on multi-connection downloads for the hub client and the CLI.
+
+        huggingface_hub reads these variables when it is first imported, which
+        happens lazily in _get_hub_library, and `hf` subprocesses inherit them.
+        Values already set by the user are left alone, except that a request
+        for hf_transfer without the package installed is dropped (older hub
+        versions fail every download in that case) so we fall back to the
+        default client.
+        """
+        os.environ.setdefault("HF_XET_HIGH_PERFORMANCE", "1")
+        if importlib.util.find_spec("hf_transfer") is not None:
+            os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+            log.debug("hf_transfer enabled for HuggingFace downloads")
+        elif os.environ.get("HF_HUB_ENABLE_HF_TRANSFER", "0").lower() in ("1", "true", "yes"):
+            log.warning(
+                "HF_HUB_ENABLE_HF_TRANSFER is set but hf_transfer is not installed; "
+                "using the default downloader. Run: pip install hf_transfer"
+            )
+            os.environ.pop("HF_HUB_ENABLE_HF_TRANSFER")
+
     def _ensure_cli(self) -> str:
         """Ensure the HuggingFace CLI is available."""
         if not self.hf_cli:
@@ -86,12 +204,16 @@ class HuggingFaceDownloader:
     ) -> subprocess.CompletedProcess:
         """Run a HuggingFace CLI command."""
         cmd = [self._ensure_cli(), *args]
-        env = os.environ.copy()
+        updates = {}
         if self.token:
-            env.setdefault("HF_TOKEN", self.token)
-            env.setdefault("HUGGINGFACE_HUB_TOKEN", self.token)
+            for key in ("HF_TOKEN", "HUGGINGFACE_HUB_TOKEN"):
+                if key not in os.environ:
+                    updates[key] = self.token
         if extra_env:
-            env.update(extra_env)
+            updates.update(extra_env)
+        # Only build a separate environment when something differs; os.environ
+        # is never patched in place since downloads may run on several threads
+        env = {**os.environ, **updates} if updates else None
         try:
             return subprocess.run(
                 cmd,
@@ -109,8 +231,7 @@ class HuggingFaceDownloader:
     def _get_datasets_library(self):
         """Import and return the datasets library."""
         try:
-            import datasets
-            return datasets
+            return _import_datasets()
         except ImportError as exc:
             log.error("datasets package not installed. Run: pip install datasets")
             raise RuntimeError("datasets package required") from exc
@@ -118,12 +239,23 @@ class HuggingFaceDownloader:
     def _get_hub_library(self):
         """Import and return the huggingface_hub library."""
         try:
-            from huggingface_hub import HfApi, hf_hub_download
-            return HfApi, hf_hub_download
+            return _import_hub()
         except ImportError as exc:
             log.error("huggingface_hub not installed. Run: pip install huggingface-hub")
             raise RuntimeError("huggingface_hub package required") from exc
 
+    @cached_property
+    def _api(self):
+        """
+        HfApi client shared by every metadata call of this downloader.
+
+        Reusing one client keeps its HTTP session (and pooled keep-alive
+        connections) across get_dataset_info/list_dataset_files calls, e.g.
+        for all datasets in download_all_defaults.
+        """
+        HfApi, _ = self._get_hub_library()
+        return HfApi(token=self.token)
+
     def _load_default_datasets(self) -> list[dict]:
         """Load default datasets from config/sources.yaml, with fallback defaults."""
         try:
@@ -148,31 +280,51 @@ class HuggingFaceDownloader:
 
         return datasets or self.DEFAULT_DATASETS
 
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _safe_name(dataset_id: str) -> str:
+        """Directory name for a dataset id (org/name -> org_name, sanitized)."""
+        return sanitize_filename(dataset_id.replace("/", "_"))
+
     def _dataset_dir(self, dataset_id: str, force: bool = False) -> Path:
         """Resolve the output directory for a dataset."""
-        safe_name = sanitize_filename(dataset_id.replace("/", "_"))
-        dataset_dir = self.output_dir / safe_name
+        dataset_dir = self.output_dir / self._safe_name(dataset_id)
         if force and dataset_dir.exists():
-            shutil.rmtree(dataset_dir)
+            discard_dir(dataset_dir)
         return ensure_dir(dataset_dir)
 
     def get_dataset_info(self, dataset_id: str) -> dict:
         """
         Get info about a dataset from HuggingFace Hub.
 
+        Responses are cached on disk per dataset. Within HF_INFO_CACHE_TTL the
+        cached copy is returned without any request; after that a sha-only
+        request revalidates it and the full metadata is fetched again only
+        when the repo has changed.
+
         Args:
             dataset_id: Dataset identifier (org/name or name)
 
         Returns:
             Dataset metadata dict
         """
-        HfApi, _ = self._get_hub_library()
-        api = HfApi(token=self.token)
+        cache_path = self._info_cache_path(dataset_id)
+        cached = self._load_info_cache(cache_path)
+        if cached:
+            if time.time() - cached["fetched_at"] < HF_INFO_CACHE_TTL:
+                return dict(cached["info"])
+
+            with self.rate_limiter.limit(self.SERVICE_NAME):
+                sha = self._dataset_sha(dataset_id)
+            if sha == cached["info"].get("sha"):
+                log.debug(f"HuggingFace info cache revalidated: {dataset_id}")
+                self._save_info_cache(cache_path, cached["info"])
+                return dict(cached["info"])
 
         with self.rate_limiter.limit(self.SERVICE_NAME):
-            info = api.dataset_info(dataset_id)
+            info = self._api.dataset_info(dataset_id)
 
-        return {
+        result = {
             "id": info.id,
             "author": info.author,
             "sha": info.sha,
@@ -180,11 +332,58 @@ class HuggingFaceDownloader:
             "private": info.private,
             "downloads": info.downloads,
             "likes": info.likes,
-            "tags": info.tags,
-            "card_data": info.card_data.__dict__ if info.card_data else None,
+            "tags": list(info.tags or []),
+            "card_data": info.card_data.to_dict() if info.card_data else None,
         }
+        self._save_info_cache(cache_path, result)
+        return result
+
+    def _dataset_sha(self, dataset_id: str) -> Optional[str]:
+        """Fetch a dataset repo's current sha, asking for only that field when the hub supports it."""
+        try:
+            return self._api.dataset_info(dataset_id, expand=["sha"]).sha
+        except TypeError:
+            # huggingface_hub < 0.23 has no expand argument
+            return self._api.dataset_info(dataset_id).sha
+
+    def _info_cache_path(self, dataset_id: str) -> Path:
+        """Cache file holding the dataset_info response for a dataset."""
+        return self.info_cache_dir / f"{self._safe_name(dataset_id)}.json"
+
+    def invalidate_info_cache(self, dataset_id: Optional[str] = None) -> None:
+        """
+        Drop cached dataset_info responses so the next lookup hits the Hub.
+
+        Args:
+            dataset_id: Dataset to invalidate, or None to clear the whole cache
+        """
+        if dataset_id is not None:
+            self._info_cache_path(dataset_id).unlink(missing_ok=True)
+        elif self.info_cache_dir.exists():
+            shutil.rmtree(self.info_cache_dir)
 
-    def list_dataset_files(self, dataset_id: str) -> list[dict]:
+    def _load_info_cache(self, cache_path: Path) -> Optional[dict]:
+        """Load a cached dataset_info entry, or None if missing/unreadable."""
+        try:
+            with open(cache_path, "r") as f:
+                cached = json.load(f)
+            if isinstance(cached.get("info"), dict) and "fetched_at" in cached:
+                return cached
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exc:
+            log.warning(f"Ignoring unreadable HuggingFace info cache {cache_path}: {exc}")
+        return None
+
+    def _save_info_cache(self, cache_path: Path, info: dict) -> None:
+        """Persist a dataset_info entry stamped with the current time."""
+        try:
+            ensure_dir(cache_path.parent)
+            write_json(cache_path, {"fetched_at": time.time(), "info": info})
+        except OSError as exc:
+            log.warning(f"Failed to save HuggingFace info cache: {exc}")
+
+    def list_dataset_files(self, dataset_id: str) -> list[str]:
         """
         List files in a dataset repository.
 
@@ -192,15 +391,32 @@ class HuggingFaceDownloader:
             dataset_id: Dataset identifier
 
         Returns:
-            List of file info dicts
+            Repo-relative file paths
         """
-        HfApi, _ = self._get_hub_library()
-        api = HfApi(token=self.token)
+        return list(self.list_dataset_file_sizes(dataset_id))
 
-        with self.rate_limiter.limit(self.SERVICE_NAME):
-            files = api.list_repo_files(dataset_id, repo_type="dataset")
+    def list_dataset_file_sizes(self, dataset_id: str) -> dict[str, int]:
+        """
+        Map each file in a dataset repository to its size in bytes.
 
-        return [{"path": f} for f in files]
+        A single recursive tree listing returns paths and sizes together, so
+        callers can pick parquet shards without going through load_dataset's
+        data-file resolution.
+
+        Args:
+            dataset_id: Dataset identifier
+
+        Returns:
+            Dict of repo-relative path -> size
+        """
+        with self.rate_limiter.limit(self.SERVICE_NAME):
+            entries = self._api.list_repo_tree(dataset_id, recursive=True, repo_type="dataset")
+            # Folders carry no size; only files are returned
+            return {
+                entry.path: entry.size
+                for entry in entries
+                if getattr(entry, "size", None) is not None
+            }
 
     def _download_via_cli(
         self,
@@ -219,6 +435,8 @@ class HuggingFaceDownloader:
                 "dataset",
                 "--local-dir",
                 str(dataset_dir),
+                "--max-workers",
+                str(self.download_workers),
             ]
             extra_env = None
             if self._cli_supports_local_dir_use_symlinks():
@@ -227,15 +445,23 @@ class HuggingFaceDownloader:
                 extra_env = {"HF_HUB_DISABLE_SYMLINKS": "1"}
             self._run_hf(cmd, capture_output=False, extra_env=extra_env)
 
-        # Create completion marker
-        marker_file = dataset_dir / ".download_complete"
-        marker_file.touch()
+        return self._finish_download(dataset_id, dataset_dir, config, split)
 
-        # Save metadata
-        self._save_metadata(dataset_id, dataset_dir, config, split)
+    def _download_raw(self, dataset_id: str, dataset_dir: Path, force: bool) -> Path:
+        """Download the raw parquet shards of a dataset repo, skipping Arrow conversion."""
+        log.info(f"Downloading raw files for: {dataset_id}")
+        self.download_dataset_files(dataset_id, patterns=self.RAW_PATTERNS, force=force)
 
-        log.info(f"Successfully downloaded: {dataset_id} -> {dataset_dir}")
-        return dataset_dir
+        # Without a marker the next run retries, instead of skipping a repo
+        # that published no parquet shards (e.g. only raw source files)
+        if not any(
+            entry.name.endswith(".parquet")
+            and ".cache" not in Path(entry.path).relative_to(dataset_dir).parts
+            for entry in iter_files(dataset_dir)
+        ):
+            raise RuntimeError(f"No parquet files published for {dataset_id}; retry with raw=False")
+
+        return self._finish_download(dataset_id, dataset_dir, None, None)
 
     def _download_via_datasets(
         self,
@@ -263,19 +489,116 @@ class HuggingFaceDownloader:
             return dataset_dir
 
         if isinstance(dataset, datasets.DatasetDict):
-            for split_name, split_data in dataset.items():
-                split_path = dataset_dir / split_name
-                log.info(f"Saving {split_name} split: {len(split_data)} examples")
-                split_data.save_to_disk(str(split_path))
+            # Splits are independent, so write them concurrently. Threads share the
+            # Arrow tables without pickling them, and Arrow releases the GIL while
+            # writing; large splits still fan out to processes in _save_to_disk.
+            # The HF_SAVE_NUM_PROC process budget is shared between the splits
+            # being written at once instead of each split claiming all of it.
+            splits = list(dataset.items())
+            workers = min(len(splits), max(1, HF_SAVE_NUM_PROC))
+            proc_per_split = max(1, HF_SAVE_NUM_PROC // workers)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = []
+                for split_name, split_data in splits:
+                    log.info(f"Saving {split_name} split: {len(split_data)} examples")
+                    futures.append(
+                        executor.submit(
+                            self._save_to_disk, split_data, dataset_dir / split_name, proc_per_split
+                        )
+                    )
+                for future in futures:
+                    future.result()
         else:
             log.info(f"Saving dataset: {len(dataset)} examples")
-            dataset.save_to_disk(str(dataset_dir / "data"))
+            self._save_to_disk(dataset, dataset_dir / "data")
 
-        marker_file = dataset_dir / ".download_complete"
-        marker_file.touch()
-        self._save_metadata(dataset_id, dataset_dir, config, split)
-        log.info(f"Successfully downloaded: {dataset_id} -> {dataset_dir}")
-        return dataset_dir
+        return self._finish_download(dataset_id, dataset_dir, config, split)
+
+    def _download_via_streaming(
+        self,
+        dataset_id: str,
+        dataset_dir: Path,
+        config: Optional[str],
+        split: Optional[str],
+    ) -> Path:
+        """Stream a config/split selection into parquet files without materializing it."""
+        datasets = self._get_datasets_library()
+
+        with self.rate_limiter.limit(self.SERVICE_NAME):
+            dataset = datasets.load_dataset(
+                dataset_id,
+                name=config,
+                split=split,
+                token=self.token,
+                streaming=True,
+                trust_remote_code=True,
+            )
+
+        if isinstance(dataset, datasets.IterableDatasetDict):
+            splits = list(dataset.items())
+        else:
+            splits = [(split or "data", dataset)]
+
+        for split_name, split_data in splits:
+            split_path = dataset_dir / f"{sanitize_filename(split_name)}.parquet"
+            rows = self._write_parquet_stream(split_data, split_path)
+            log.info(f"Saved {split_name} split: {rows} examples")
+
+        return self._finish_download(dataset_id, dataset_dir, config, split)
+
+    def _write_parquet_stream(self, iterable_dataset, path: Path) -> int:
+        """
+        Write an IterableDataset to a parquet file batch by batch.
+
+        Memory stays bounded by STREAM_BATCH_SIZE rows, and network reads
+        overlap with encoding/writes. The schema comes from the dataset
+        features when known, otherwise from the first batch. The file is
+        written under a temporary name and renamed once complete.
+        """
+        pa, pq = _import_pyarrow()
+
+        features = getattr(iterable_dataset, "features", None)
+        schema = features.arrow_schema if features is not None else None
+        partial_path = path.with_name(path.name + ".partial")
+        writer = None
+        rows = 0
+        try:
+            for batch in iterable_dataset.iter(batch_size=self.STREAM_BATCH_SIZE):
+                record_batch = pa.RecordBatch.from_pydict(batch, schema=schema)
+                if writer is None:
+                    schema = record_batch.schema
+                    writer = pq.ParquetWriter(str(partial_path), schema)
+                writer.write_batch(record_batch)
+                rows += record_batch.num_rows
+        finally:
+            if writer is not None:
+                writer.close()
+
+        if writer is None:
+            log.warning(f"No rows to write for {path.name}")
+            return 0
+        partial_path.replace(path)
+        return rows
+
+    def _save_to_disk(self, dataset, path: Path, max_proc: Optional[int] = None) -> None:
+        """
+        Write an Arrow dataset, sharding large ones across worker processes.
+
+        Shards are capped at HF_MAX_SHARD_SIZE rather than the 500MB default,
+        so small and medium splits land in a single file and load_from_disk
+        has fewer files to open and map.
+
+        Args:
+            dataset: datasets.Dataset to write
+            path: Output directory
+            max_proc: Processes this write may use (defaults to HF_SAVE_NUM_PROC)
+        """
+        if max_proc is None:
+            max_proc = HF_SAVE_NUM_PROC
+        num_proc = max_proc if len(dataset) >= self.PARALLEL_SAVE_MIN_ROWS else None
+        if num_proc is not None and num_proc <= 1:
+            num_proc = None
+        dataset.save_to_disk(str(path), max_shard_size=HF_MAX_SHARD_SIZE, num_proc=num_proc)
 
     def download_dataset(
         self,
@@ -284,6 +607,8 @@ class HuggingFaceDownloader:
         split: Optional[str] = None,
         streaming: bool = False,
         force: bool = False,
+        raw: bool = True,
+        cache_hint: Literal["willneed", "dontneed", "none"] = "dontneed",
     ) -> Path:
         """
         Download a dataset from HuggingFace.
@@ -294,19 +619,28 @@ class HuggingFaceDownloader:
             split: Specific split to download (train, test, etc.)
             streaming: Use streaming mode (doesn't download full dataset)
             force: Force re-download even if exists
+            raw: Keep the data as parquet instead of decoding it with `datasets`
+                and re-serializing via save_to_disk. Whole repos are fetched as
+                published (RAW_PATTERNS); a config/split selection is streamed
+                into one parquet file per split in constant memory.
+            cache_hint: Page cache advice for the written files once the
+                download completes: "dontneed" evicts them (archival),
+                "willneed" prefetches them for an immediate reader, "none"
+                leaves the page cache alone.
 
         Returns:
             Path to downloaded dataset directory
         """
-        # Create dataset directory
-        dataset_dir = self._dataset_dir(dataset_id, force=force)
-
-        # Check if already downloaded
-        marker_file = dataset_dir / ".download_complete"
-        if marker_file.exists() and not force:
+        # Check if already downloaded before touching the directory, so the
+        # common "nothing to do" call costs a single stat
+        dataset_dir = self.output_dir / self._safe_name(dataset_id)
+        if not force and (dataset_dir / ".download_complete").exists():
             log.info(f"Dataset already downloaded: {dataset_id}")
             return dataset_dir
 
+        # Create (or, with force, recreate) the dataset directory
+        dataset_dir = self._dataset_dir(dataset_id, force=force)
+
         log.info(f"Downloading dataset: {dataset_id}")
 
         try:
@@ -319,31 +653,39 @@ class HuggingFaceDownloader:
                     streaming=True,
                 )
 
-            if self.cli_available and not config and not split:
-                return self._download_via_cli(dataset_id, dataset_dir, config, split)
-
-            if not self.cli_available:
-                log.warning("HuggingFace CLI not available; falling back to datasets.")
-            elif config or split:
-                log.info("Dataset config/split requested; using datasets library.")
+            if raw and not config and not split:
+                dataset_dir = self._download_raw(dataset_id, dataset_dir, force)
+            elif raw:
+                dataset_dir = self._download_via_streaming(dataset_id, dataset_dir, config, split)
+            elif self.cli_available and not config and not split:
+                dataset_dir = self._download_via_cli(dataset_id, dataset_dir, config, split)
+            else:
+                if not self.cli_available:
+                    log.warning("HuggingFace CLI not available; falling back to datasets.")
+                elif config or split:
+                    log.info("Dataset config/split requested; using datasets library.")
 
-            return self._download_via_datasets(
-                dataset_id,
-                dataset_dir,
-                config,
-                split,
-                streaming=False,
-            )
+                dataset_dir = self._download_via_datasets(
+                    dataset_id,
+                    dataset_dir,
+                    config,
+                    split,
+                    streaming=False,
+                )
 
         except Exception as exc:
             log.error(f"Failed to download {dataset_id}: {exc}")
             raise
 
+        advise_page_cache(dataset_dir, cache_hint)
+        return dataset_dir
+
     def download_dataset_files(
         self,
         dataset_id: str,
         patterns: Optional[list[str]] = None,
         force: bool = False,
+        max_workers: Optional[int] = None,
     ) -> Path:
         """
         Download specific files from a dataset repository.
@@ -354,56 +696,56 @@ class HuggingFaceDownloader:
             dataset_id: Dataset identifier
             patterns: File patterns to download (e.g., ["*.json", "data/*.parquet"])
             force: Force re-download
+            max_workers: Files fetched concurrently; raise it for repos made of
+                many small files (defaults to the downloader's download_workers)
 
         Returns:
             Path to downloaded files directory
         """
-        HfApi, hf_hub_download = self._get_hub_library()
-        api = HfApi(token=self.token)
+        _, snapshot_download = self._get_hub_library()
 
         dataset_dir = self._dataset_dir(dataset_id, force=False)
 
-        # Get file list
-        files = self.list_dataset_files(dataset_id)
-
-        # Filter by patterns if specified
-        if patterns:
-            import fnmatch
-
-            filtered_files = []
-            for f in files:
-                path = f["path"]
-                if any(fnmatch.fnmatch(path, p) for p in patterns):
-                    filtered_files.append(f)
-            files = filtered_files
-
-        log.info(f"Downloading {len(files)} files from {dataset_id}")
-
-        downloaded = []
-        for file_info in files:
-            file_path = file_info["path"]
-            local_path = dataset_dir / file_path
+        log.info(f"Downloading files from {dataset_id} matching {patterns or 'all'}")
+
+        # One snapshot call lists the repo once and fetches matching files on its
+        # own worker pool; files already present in local_dir are skipped
+        self.rate_limiter.acquire(self.SERVICE_NAME)
+        snapshot_download(
+            repo_id=dataset_id,
+            repo_type="dataset",
+            allow_patterns=patterns,
+            local_dir=str(dataset_dir),
+            max_workers=max_workers or self.download_workers,
+            force_download=force,
+            token=self.token,
+        )
 
-            if local_path.exists() and not force:
-                log.debug(f"File exists: {file_path}")
-                downloaded.append(local_path)
+        # Count only files matching the requested patterns, not earlier downloads
+        matcher = compile_globs(patterns) if patterns else None
+        prefix_len = len(str(dataset_dir)) + 1
+        downloaded = 0
+        for entry in iter_files(dataset_dir):
+            relative = entry.path[prefix_len:].replace(os.sep, "/")
+            if ".cache" in relative.split("/"):
                 continue
+            if matcher is None or matcher.match(relative):
+                downloaded += 1
+        log.info(f"Downloaded {downloaded} files to {dataset_dir}")
+        return dataset_dir
 
-            try:
-                with self.rate_limiter.limit(self.SERVICE_NAME):
-                    hf_hub_download(
-                        repo_id=dataset_id,
-                        filename=file_path,
-                        repo_type="dataset",
-                        local_dir=str(dataset_dir),
-                        token=self.token,
-                    )
-                downloaded.append(local_path)
-                log.debug(f"Downloaded: {file_path}")
-            except Exception as exc:
-                log.warning(f"Failed to download {file_path}: {exc}")
-
-        log.info(f"Downloaded {len(downloaded)} files to {dataset_dir}")
+    def _finish_download(
+        self,
+        dataset_id: str,
+        dataset_dir: Path,
+        config: Optional[str],
+        split: Optional[str],
+    ) -> Path:
+        """Write metadata, then the completion marker (with file stats), for a download."""
+        stats = dataset_file_stats(dataset_dir)
+        self._save_metadata(dataset_id, dataset_dir, config, split, total_bytes=stats["total_size"])
+        write_completion_marker(dataset_dir, stats)
+        log.info(f"Successfully downloaded: {dataset_id} -> {dataset_dir}")
         return dataset_dir
 
     def _save_metadata(
@@ -412,52 +754,102 @@ class HuggingFaceDownloader:
         dataset_dir: Path,
         config: Optional[str],
         split: Optional[str],
+        total_bytes: Optional[int] = None,
     ) -> None:
-        """Save dataset metadata."""
+        """
+        Save dataset metadata.
+
+        Also records the on-disk size as ``total_bytes``; pass it when already
+        known to skip walking the dataset tree again.
+        """
         try:
             info = self.get_dataset_info(dataset_id)
-            info["download_config"] = {
-                "config": config,
-                "split": split,
-            }
-            metadata_path = dataset_dir / "metadata.json"
-            with open(metadata_path, "w") as f:
-                json.dump(info, f, indent=2, default=str)
+        except Exception as exc:
+            log.warning(f"Failed to fetch metadata for {dataset_id}: {exc}")
+            info = {"id": dataset_id}
+
+        info["download_config"] = {
+            "config": config,
+            "split": split,
+        }
+        info["total_bytes"] = dir_size(dataset_dir) if total_bytes is None else total_bytes
+
+        metadata_path = dataset_dir / "metadata.json"
+        try:
+            write_json(metadata_path, info)
             log.debug(f"Saved metadata: {metadata_path}")
         except Exception as exc:
             log.warning(f"Failed to save metadata for {dataset_id}: {exc}")
 
-    def download_all_defaults(self, force: bool = False) -> dict[str, Path]:
+    def _cached_size(self, dataset_dir: Path, marker_mtime: Optional[float] = None) -> Optional[int]:
+        """
+        Return the size recorded in metadata.json for a completed download.
+
+        The cached value is ignored when the completion marker is newer than
+        the metadata, i.e. the dataset was re-downloaded since it was written.
+        Pass ``marker_mtime`` when the marker has already been stat'ed.
+        """
+        metadata_path = dataset_dir / "metadata.json"
+        try:
+            if marker_mtime is None:
+                marker_mtime = (dataset_dir / ".download_complete").stat().st_mtime
+            if metadata_path.stat().st_mtime < marker_mtime:
+                return None
+            with open(metadata_path, "r") as f:
+                total_bytes = json.load(f).get("total_bytes")
+        except (OSError, ValueError):
+            return None
+        return total_bytes if isinstance(total_bytes, int) else None
+
+    def download_all_defaults(
+        self,
+        force: bool = False,
+        max_workers: Optional[int] = None,
+    ) -> dict[str, Path]:
         """
         Download all default datasets for this project.
 
+        Up to max_workers datasets download at once; a failure is
+        logged and recorded as None without affecting the others.
+
         Args:
             force: Force re-download
+            max_workers: Datasets downloaded at once (defaults to MAX_PARALLEL_DATASETS)
 
         Returns:
             Dict mapping dataset_id to download path
         """
-        results = {}
-
-        for dataset_info in self.default_datasets:
-            dataset_id = dataset_info["dataset_id"]
-            config = dataset_info.get("config")
-            split = dataset_info.get("split")
-
-            try:
-                path = self.download_dataset(
-                    dataset_id,
-                    config=config,
-                    split=split,
+        # Keep the configured order in the result regardless of completion order
+        results = {dataset_info["dataset_id"]: None for dataset_info in self.default_datasets}
+        if not results:
+            return results
+
+        max_workers = min(max_workers or self.MAX_PARALLEL_DATASETS, len(self.default_datasets))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(
+                    self.download_dataset,
+                    dataset_info["dataset_id"],
+                    config=dataset_info.get("config"),
+                    split=dataset_info.get("split"),
                     force=force,
-                )
-                results[dataset_id] = path
-            except Exception as exc:
-                log.error(f"Failed to download {dataset_id}: {exc}")
-                results[dataset_id] = None
+                ): dataset_info["dataset_id"]
+                for dataset_info in self.default_datasets
+            }
+            for future in as_completed(futures):
+                dataset_id = futures[future]
+                try:
+                    results[dataset_id] = future.result()
+                except Exception as exc:
+                    log.error(f"Failed to download {dataset_id}: {exc}")
 
         return results
 
+    @staticmethod
+    def _is_saved_dataset(path: Path) -> bool:
+        """Check whether a directory holds save_to_disk output (a Dataset or DatasetDict)."""
+        return (path / "state.json").exists() or (path / "dataset_dict.json").exists()
+
     def load_dataset(
         self,
         dataset_id: str,
@@ -477,18 +869,18 @@ class HuggingFaceDownloader:
         """
         datasets = self._get_datasets_library()
 
-        safe_name = sanitize_filename(dataset_id.replace("/", "_"))
-        dataset_dir = self.output_dir / safe_name
+        dataset_dir = self.output_dir / self._safe_name(dataset_id)
 
         if not dataset_dir.exists():
             raise FileNotFoundError(f"Dataset not downloaded: {dataset_id}")
 
-        # Try to load from disk
-        if (dataset_dir / "data").exists():
+        # Try to load from disk. Raw repo snapshots also keep their parquet
+        # shards under data/, which only load_dataset below can read
+        if self._is_saved_dataset(dataset_dir / "data"):
             return datasets.load_from_disk(str(dataset_dir / "data"))
 
         # Check for split directories
-        split_dirs = [d for d in dataset_dir.iterdir() if d.is_dir() and d.name != "raw"]
+        split_dirs = [d for d in dataset_dir.iterdir() if d.is_dir() and self._is_saved_dataset(d)]
         if split_dirs:
             dataset_dict = {}
             for split_dir in split_dirs:
@@ -516,25 +908,33 @@ class HuggingFaceDownloader:
             Dict with status info for each dataset
         """
         status = {}
+        # One directory listing tells which datasets have a directory at all
+        present = subdir_names(self.output_dir)
 
         for dataset_info in self.default_datasets:
             dataset_id = dataset_info["dataset_id"]
-            safe_name = sanitize_filename(dataset_id.replace("/", "_"))
+            safe_name = self._safe_name(dataset_id)
             dataset_dir = self.output_dir / safe_name
-            marker_file = dataset_dir / ".download_complete"
+
+            # The marker answers "downloaded" and carries the dataset size for
+            # downloads made by this version
+            marker = read_completion_marker(dataset_dir) if safe_name in present else None
+            downloaded = marker is not None
 
             status[dataset_id] = {
                 "description": dataset_info["description"],
                 "priority": dataset_info["priority"],
-                "downloaded": marker_file.exists(),
-                "path": str(dataset_dir) if dataset_dir.exists() else None,
+                "downloaded": downloaded,
+                "path": str(dataset_dir) if downloaded else None,
             }
 
             # Get size if downloaded
-            if dataset_dir.exists():
-                total_size = sum(
-                    f.stat().st_size for f in dataset_dir.rglob("*") if f.is_file()
-                )
+            if downloaded:
+                total_size = marker.get("total_size")
+                if total_size is None:
+                    total_size = self._cached_size(dataset_dir)
+                if total_size is None:
+                    total_size = dir_size(dataset_dir)
                 status[dataset_id]["size_bytes"] = total_size
                 status[dataset_id]["size_mb"] = round(total_size / (1024 * 1024), 2)
 
@@ -542,29 +942,24 @@ class HuggingFaceDownloader:
 
     def _cli_supports_local_dir_use_symlinks(self) -> bool:
         """Check if the HuggingFace CLI supports --local-dir-use-symlinks."""
-        cached = getattr(self, "_supports_local_dir_use_symlinks", None)
-        if cached is not None:
-            return cached
-        try:
-            result = self._run_hf(["download", "--help"], capture_output=True)
-        except Exception:
-            self._supports_local_dir_use_symlinks = False
+        if not self.hf_cli:
             return False
-        output = "\n".join([result.stdout or "", result.stderr or ""])
-        supported = "--local-dir-use-symlinks" in output
-        self._supports_local_dir_use_symlinks = supported
-        return supported
+        return _probe_symlinks_flag(self.hf_cli)
 
 
-def download_huggingface_datasets(force: bool = False) -> dict[str, Path]:
+def download_huggingface_datasets(
+    force: bool = False,
+    max_workers: Optional[int] = None,
+) -> dict[str, Path]:
     """
     Convenience function to download all HuggingFace datasets.
 
     Args:
         force: Force re-download
+        max_workers: Datasets downloaded at once
 
     Returns:
         Dict mapping dataset_id to path
     """
     downloader = HuggingFaceDownloader()
-    return downloader.download_all_defaults(force=force)
+    return downloader.download_all_defaults(force=force, max_workers=max_workers)
@@ -2,23 +2,179 @@
 Kaggle dataset downloader.
 
 Downloads datasets from Kaggle for smart contract vulnerability analysis.
-Uses the Kaggle CLI, which reads credentials from ~/.kaggle/kaggle.json
-or KAGGLE_USERNAME/KAGGLE_KEY environment variables.
+Uses the kaggle package's API in-process when it is installed, falling back
+to the Kaggle CLI otherwise. Both read credentials from kaggle.json or the
+KAGGLE_USERNAME/KAGGLE_KEY environment variables.
 """
 from __future__ import annotations
 
-import json
 import os
 import shutil
+import struct
 import subprocess
+import tempfile
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Optional
-
-from config.settings import DATASETS_DIR, KAGGLE_USERNAME, KAGGLE_KEY
-from utils.helpers import ensure_dir, sanitize_filename, load_sources_config
+from typing import Iterator, Optional
+
+from config.settings import DATASETS_DIR, KAGGLE_EXTRACT_WORKERS, KAGGLE_USERNAME, KAGGLE_KEY
+from utils.helpers import (
+    BOOKKEEPING_FILES,
+    COMPLETION_MARKER,
+    dataset_file_stats,
+    discard_dir,
+    ensure_dir,
+    iter_dataset_files,
+    load_sources_config,
+    read_completion_marker,
+    sanitize_filename,
+    subdir_names,
+    write_completion_marker,
+    write_json,
+)
 from utils.logger import log
 from utils.rate_limiter import get_rate_limiter
 
+# Read size for zip extraction; larger reads mean far fewer Python-level
+# read() round trips than shutil's 64 KiB default
+EXTRACT_BUFFER_SIZE = 1024 * 1024
+
+# Size of a zip local file header before its name and extra fields
+ZIP_LOCAL_HEADER_SIZE = 30
+
+
+@lru_cache(maxsize=1)
+def _locate_kaggle_cli() -> Optional[str]:
+    """Find the Kaggle CLI on PATH once per process."""
+    return shutil.which("kaggle")
+
+
+def _cli_env() -> Optional[dict]:
+    """Environment for Kaggle CLI runs: inherit the parent's unless credentials need adding."""
+    updates = {}
+    if KAGGLE_USERNAME and KAGGLE_KEY:
+        for key, value in (("KAGGLE_USERNAME", KAGGLE_USERNAME), ("KAGGLE_KEY", KAGGLE_KEY)):
+            if key not in os.environ:
+                updates[key] = value
+    return {**os.environ, **updates} if updates else None
+
+
+@lru_cache(maxsize=1)
+def _kaggle_api():
+    """
+    Build one authenticated KaggleApi client per process.
+
+    Returns None when the kaggle package is missing or cannot authenticate,
+    in which case the downloader falls back to the CLI.
+    """
+    # The kaggle package authenticates on import and reads credentials from the environment
+    if KAGGLE_USERNAME and KAGGLE_KEY:
+        os.environ.setdefault("KAGGLE_USERNAME", KAGGLE_USERNAME)
+        os.environ.setdefault("KAGGLE_KEY", KAGGLE_KEY)
+    try:
+        from kaggle.api.kaggle_api_extended import KaggleApi
+    except ImportError:
+        return None
+    except Exception as exc:
+        log.warning(f"Kaggle API unavailable, falling back to the CLI: {exc}")
+        return None
+
+    api = KaggleApi()
+    try:
+        api.authenticate()
+    except Exception as exc:
+        log.warning(f"Kaggle API authentication failed, falling back to the CLI: {exc}")
+        return None
+    return api
+
+
+def _list_files(dataset_dir: str) -> tuple[tuple[str, int], ...]:
+    """(relative path, size) of every file of a dataset, from one walk."""
+    return tuple(
+        (os.path.relpath(entry.path, dataset_dir), entry.stat().st_size)
+        for entry in iter_dataset_files(Path(dataset_dir))
+    )
+
+
+@lru_cache(maxsize=64)
+def _list_completed_files(dataset_dir: str, marker_mtime_ns: int) -> tuple[tuple[str, int], ...]:
+    """
+    Cached _list_files for a completed dataset.
+
+    A completed dataset does not change until it is downloaded again, which
+    rewrites the marker, so the marker's mtime keys the cache.
+    """
+    return _list_files(dataset_dir)
+
+
+def _copy_stored_member(archive, info: zipfile.ZipInfo, target: Path) -> None:
+    """
+    Copy an uncompressed zip member to target with os.copy_file_range.
+
+    The kernel moves the bytes from the archive to the new file in a few
+    large calls, without them passing through Python buffers.
+    """
+    src_fd = archive.fileno()
+    header = os.pread(src_fd, ZIP_LOCAL_HEADER_SIZE, info.header_offset)
+    if len(header) != ZIP_LOCAL_HEADER_SIZE or header[:4] != b"PK\x03\x04":
+        raise zipfile.BadZipFile(f"Bad local header for {info.filename}")
+    name_length, extra_length = struct.unpack("<HH", header[26:30])
+    offset = info.header_offset + ZIP_LOCAL_HEADER_SIZE + name_length + extra_length
+
+    remaining = info.file_size
+    with open(target, "wb") as dst:
+        while remaining:
+            copied = os.copy_file_range(src_fd, dst.fileno(), remaining, offset_src=offset)
+            if copied == 0:
+                raise zipfile.BadZipFile(f"Truncated member {info.filename}")
+            offset += copied
+            remaining -= copied
+
+
+def _extract_members(zip_path: Path, names: list[str], dest_dir: Path) -> list[tuple[str, int]]:
+    """
+    Extract the named members of a zip archive into dest_dir.
+
+    Members that would land outside dest_dir (absolute paths, "..") are
+    skipped. Stored (uncompressed) members are copied with
+    copy_file_range where the platform has it.
+
+    Returns:
+        (path relative to dest_dir, size) of every file extracted
+    """
+    root = dest_dir.resolve()
+    extracted = []
+    with zipfile.ZipFile(zip_path) as zf, open(zip_path, "rb") as archive:
+        for name in names:
+            info = zf.getinfo(name)
+            target = (root / info.filename).resolve()
+            if not target.is_relative_to(root):
+                log.warning(f"Skipping unsafe archive member: {info.filename}")
+                continue
+            if info.is_dir():
+                target.mkdir(parents=True, exist_ok=True)
+                continue
+            target.parent.mkdir(parents=True, exist_ok=True)
+            if (
+                info.compress_type == zipfile.ZIP_STORED
+                and not info.flag_bits & 0x1  # encrypted
+                and hasattr(os, "copy_file_range")
+            ):
+                try:
+                    _copy_stored_member(archive, info, target)
+                    extracted.append((os.path.relpath(target, root), info.file_size))
+                    continue
+                except OSError:
+                    # e.g. unsupported by the filesystem; fall back to a buffered copy
+                    pass
+            with zf.open(info) as src, open(target, "wb") as dst:
+                shutil.copyfileobj(src, dst, length=EXTRACT_BUFFER_SIZE)
+            extracted.append((os.path.relpath(target, root), info.file_size))
+    return extracted
+
 
 class KaggleDownloader:
     """
@@ -31,6 +187,14 @@ class KaggleDownloader:
 
     SERVICE_NAME = "kaggle"
 
+    # Datasets downloaded at once by download_all_defaults
+    MAX_PARALLEL_DATASETS = 4
+
+    # Archives with at least this many members, or this many uncompressed bytes,
+    # are extracted by KAGGLE_EXTRACT_WORKERS processes
+    PARALLEL_EXTRACT_MIN_MEMBERS = 1000
+    PARALLEL_EXTRACT_MIN_BYTES = 100 * 1024 * 1024
+
     # Target datasets for this project
     DEFAULT_DATASETS = [
         {
@@ -60,10 +224,13 @@ class KaggleDownloader:
         self.output_dir = ensure_dir(output_dir or DATASETS_DIR / "kaggle")
         self.rate_limiter = get_rate_limiter()
         self.default_datasets = datasets or self._load_default_datasets()
-        self.kaggle_cli = shutil.which("kaggle")
+        self.api = _kaggle_api()
+        self.kaggle_cli = _locate_kaggle_cli()
         self.cli_available = self.kaggle_cli is not None
+        # Built once and shared by every CLI run of this downloader
+        self._env = _cli_env()
 
-        if not self.cli_available:
+        if self.api is None and not self.cli_available:
             log.warning("Kaggle CLI not found in PATH. Install `kaggle` to enable downloads.")
 
         if not self._has_credentials():
@@ -84,26 +251,53 @@ class KaggleDownloader:
             raise RuntimeError("kaggle CLI not found. Install `kaggle` and ensure it is in PATH.")
         return self.kaggle_cli
 
+    @staticmethod
+    def _cli_failed(cmd: list[str], exc: subprocess.CalledProcessError) -> RuntimeError:
+        """Log a failed Kaggle CLI run and build the error to raise from it."""
+        stderr = exc.stderr.strip() if exc.stderr else ""
+        if stderr:
+            log.error(f"Kaggle CLI error: {stderr}")
+        return RuntimeError(f"Kaggle CLI command failed: {' '.join(cmd)}")
+
     def _run_kaggle(self, args: list[str], capture_output: bool = True) -> subprocess.CompletedProcess:
         """Run a Kaggle CLI command."""
         cmd = [self._ensure_cli(), *args]
-        env = os.environ.copy()
-        if KAGGLE_USERNAME and KAGGLE_KEY:
-            env.setdefault("KAGGLE_USERNAME", KAGGLE_USERNAME)
-            env.setdefault("KAGGLE_KEY", KAGGLE_KEY)
         try:
             return subprocess.run(
                 cmd,
                 check=True,
                 text=True,
                 capture_output=capture_output,
-                env=env,
+                env=self._env,
             )
         except subprocess.CalledProcessError as exc:
-            stderr = exc.stderr.strip() if exc.stderr else ""
-            if stderr:
-                log.error(f"Kaggle CLI error: {stderr}")
-            raise RuntimeError(f"Kaggle CLI command failed: {' '.join(cmd)}") from exc
+            raise self._cli_failed(cmd, exc) from exc
+
+    def _iter_kaggle(self, args: list[str]) -> Iterator[str]:
+        """
+        Run a Kaggle CLI command, yielding its stdout lines as they arrive.
+
+        The process is killed if the caller stops iterating early. Stderr
+        goes to a temporary file rather than a pipe, so a CLI writing more
+        than a pipe buffer of warnings can't block while stdout is read.
+        """
+        cmd = [self._ensure_cli(), *args]
+        with tempfile.TemporaryFile(mode="w+") as stderr_file, subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=stderr_file,
+            text=True,
+            env=self._env,
+        ) as proc:
+            try:
+                yield from proc.stdout
+                if proc.wait() != 0:
+                    stderr_file.seek(0)
+                    exc = subprocess.CalledProcessError(proc.returncode, cmd, stderr=stderr_file.read())
+                    raise self._cli_failed(cmd, exc) from exc
+            finally:
+                if proc.poll() is None:
+                    proc.kill()
 
     def _load_default_datasets(self) -> list[dict]:
         """Load default datasets from config/sources.yaml, with fallback defaults."""
@@ -127,20 +321,29 @@ class KaggleDownloader:
 
         return datasets or self.DEFAULT_DATASETS
 
-    def list_datasets(self, search_term: str = "smart contract") -> list[dict]:
+    def list_datasets(
+        self,
+        search_term: str = "smart contract",
+        max_results: Optional[int] = None,
+    ) -> list[dict]:
         """
         Search for datasets on Kaggle.
 
         Args:
             search_term: Search query
+            max_results: Stop after this many datasets
 
         Returns:
             List of dataset metadata dicts
         """
         with self.rate_limiter.limit(self.SERVICE_NAME):
-            result = self._run_kaggle(["datasets", "list", "-s", search_term])
-
-        datasets = self._parse_dataset_list_output(result.stdout)
+            if self.api is not None:
+                found = map(self._dataset_from_api, self.api.dataset_list(search=search_term))
+            else:
+                # Parse CLI rows as they are printed rather than buffering the whole table
+                lines = self._iter_kaggle(["datasets", "list", "-s", search_term])
+                found = filter(None, map(self._parse_dataset_row, lines))
+            datasets = list(islice(found, max_results))
 
         log.info(f"Found {len(datasets)} datasets matching '{search_term}'")
         return datasets
@@ -159,21 +362,20 @@ class KaggleDownloader:
         if not dataset_dir.exists():
             return {"id": dataset_id, "files": [], "file_count": 0, "total_size": 0}
 
-        file_list = []
-        total_size = 0
-        for file_path in dataset_dir.rglob("*"):
-            if not file_path.is_file():
-                continue
-            if file_path.name == ".download_complete":
-                continue
-            size = file_path.stat().st_size
-            file_list.append(
-                {
-                    "name": str(file_path.relative_to(dataset_dir)),
-                    "size": size,
-                }
-            )
-            total_size += size
+        try:
+            marker_mtime_ns = (dataset_dir / COMPLETION_MARKER).stat().st_mtime_ns
+        except FileNotFoundError:
+            files = _list_files(str(dataset_dir))
+        else:
+            files = _list_completed_files(str(dataset_dir), marker_mtime_ns)
+
+        return self._build_info(dataset_id, files)
+
+    @staticmethod
+    def _build_info(dataset_id: str, files) -> dict:
+        """Build the dataset metadata dict from (relative path, size) pairs."""
+        file_list = [{"name": name, "size": size} for name, size in files]
+        total_size = sum(size for _, size in files)
 
         return {
             "id": dataset_id,
@@ -188,28 +390,43 @@ class KaggleDownloader:
         return self.output_dir / safe_name
 
     @staticmethod
-    def _parse_dataset_list_output(output: str) -> list[dict]:
-        """Parse `kaggle datasets list` output into minimal metadata."""
-        lines = [line.strip() for line in output.splitlines() if line.strip()]
-        if not lines:
-            return []
-        if lines[0].lower().startswith("ref"):
-            lines = lines[1:]
-        datasets = []
-        for line in lines:
-            parts = line.split()
-            if not parts:
-                continue
-            datasets.append(
-                {
-                    "id": parts[0],
-                    "title": None,
-                    "size": None,
-                    "last_updated": None,
-                    "download_count": None,
-                }
-            )
-        return datasets
+    def _dataset_from_api(dataset) -> dict:
+        """Convert a KaggleApi dataset object into the list_datasets metadata dict."""
+        def attr(*names):
+            # Older kaggle releases use camelCase attribute names
+            for name in names:
+                value = getattr(dataset, name, None)
+                if value is not None:
+                    return value
+            return None
+
+        last_updated = attr("last_updated", "lastUpdated")
+        return {
+            "id": attr("ref"),
+            "title": attr("title"),
+            "size": attr("total_bytes", "totalBytes"),
+            "last_updated": str(last_updated) if last_updated is not None else None,
+            "download_count": attr("download_count", "downloadCount"),
+        }
+
+    @staticmethod
+    def _parse_dataset_row(line: str) -> Optional[dict]:
+        """
+        Parse one row of `kaggle datasets list` output into minimal metadata.
+
+        Returns None for the header, the dashed separator and blank lines,
+        none of which start with an owner/dataset reference.
+        """
+        parts = line.split(maxsplit=1)
+        if not parts or "/" not in parts[0]:
+            return None
+        return {
+            "id": parts[0],
+            "title": None,
+            "size": None,
+            "last_updated": None,
+            "download_count": None,
+        }
 
     def download_dataset(
         self,
@@ -231,29 +448,49 @@ class KaggleDownloader:
         # Create dataset directory
         dataset_dir = self._dataset_dir(dataset_id)
         if force and dataset_dir.exists():
-            shutil.rmtree(dataset_dir)
+            discard_dir(dataset_dir)
         dataset_dir = ensure_dir(dataset_dir)
 
         # Check if already downloaded
-        marker_file = dataset_dir / ".download_complete"
+        marker_file = dataset_dir / COMPLETION_MARKER
         if marker_file.exists() and not force:
             log.info(f"Dataset already downloaded: {dataset_id}")
             return dataset_dir
 
         log.info(f"Downloading dataset: {dataset_id}")
+        with os.scandir(dataset_dir) as entries:
+            # Leftovers from an interrupted attempt would be missing from the extraction listing
+            fresh = next(entries, None) is None
 
         try:
             with self.rate_limiter.limit(self.SERVICE_NAME):
-                cmd = ["datasets", "download", "-d", dataset_id, "-p", str(dataset_dir)]
-                if unzip:
-                    cmd.append("--unzip")
-                self._run_kaggle(cmd, capture_output=False)
-
-            # Create completion marker
-            marker_file.touch()
-
-            # Save metadata
-            self._save_metadata(dataset_id, dataset_dir)
+                if self.api is not None:
+                    self.api.dataset_download_files(
+                        dataset_id, path=str(dataset_dir), unzip=False, quiet=True
+                    )
+                else:
+                    cmd = ["datasets", "download", "-d", dataset_id, "-p", str(dataset_dir)]
+                    self._run_kaggle(cmd, capture_output=False)
+
+            # Extract ourselves rather than with --unzip, using large read buffers
+            files = None
+            if unzip:
+                archives_only = fresh and all(name.endswith(".zip") for name in os.listdir(dataset_dir))
+                extracted = self._extract_archives(dataset_dir)
+                if archives_only:
+                    # The extracted files are then the whole dataset; no need to walk it again
+                    files = sorted(
+                        (name, size) for name, size in extracted.items()
+                        if name not in BOOKKEEPING_FILES
+                    )
+
+            # Save metadata, then mark complete with the file count and size it
+            # already gathered; the marker goes last so it implies the metadata
+            info = self._save_metadata(dataset_id, dataset_dir, files)
+            stats = None
+            if info:
+                stats = {"file_count": info["file_count"], "total_size": info["total_size"]}
+            write_completion_marker(dataset_dir, stats)
 
             log.info(f"Successfully downloaded: {dataset_id} -> {dataset_dir}")
             return dataset_dir
@@ -262,37 +499,111 @@ class KaggleDownloader:
             log.error(f"Failed to download {dataset_id}: {exc}")
             raise
 
-    def _save_metadata(self, dataset_id: str, dataset_dir: Path) -> None:
-        """Save dataset metadata to JSON file."""
+    def _extract_archives(self, dataset_dir: Path) -> dict[str, int]:
+        """
+        Extract every zip archive in dataset_dir in place, then delete it.
+
+        Inflating is CPU-bound, so large archives (many members or many
+        bytes) are split into one shard of members per worker process; each
+        worker opens its own ZipFile handle on the archive.
+
+        Returns:
+            Size of every extracted file, keyed by its path relative to dataset_dir
+        """
+        extracted = {}
+        for zip_path in sorted(dataset_dir.glob("*.zip")):
+            with zipfile.ZipFile(zip_path) as zf:
+                infos = zf.infolist()
+
+            workers = min(KAGGLE_EXTRACT_WORKERS, len(infos))
+            large = (
+                len(infos) >= self.PARALLEL_EXTRACT_MIN_MEMBERS
+                or sum(info.file_size for info in infos) >= self.PARALLEL_EXTRACT_MIN_BYTES
+            )
+            if workers > 1 and large:
+                # Deal members largest-first across shards to even out the work
+                infos.sort(key=lambda info: info.file_size, reverse=True)
+                shards = [[info.filename for info in infos[i::workers]] for i in range(workers)]
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    for shard_files in executor.map(
+                        _extract_members,
+                        [zip_path] * workers,
+                        shards,
+                        [dataset_dir] * workers,
+                    ):
+                        extracted.update(shard_files)
+            else:
+                extracted.update(
+                    _extract_members(zip_path, [info.filename for info in infos], dataset_dir)
+                )
+            zip_path.unlink()
+            log.debug(f"Extracted {zip_path.name}")
+        return extracted
+
+    def _save_metadata(
+        self,
+        dataset_id: str,
+        dataset_dir: Path,
+        files: Optional[list[tuple[str, int]]] = None,
+    ) -> Optional[dict]:
+        """
+        Save dataset metadata to JSON file, returning it (None on failure).
+
+        Args:
+            dataset_id: Dataset identifier
+            dataset_dir: Dataset directory
+            files: (relative path, size) of every dataset file, if already
+                known; otherwise the directory is walked
+        """
         try:
-            info = self.get_dataset_info(dataset_id)
+            if files is None:
+                info = self.get_dataset_info(dataset_id)
+            else:
+                info = self._build_info(dataset_id, files)
             metadata_path = dataset_dir / "metadata.json"
-            with open(metadata_path, "w") as f:
-                json.dump(info, f, indent=2)
+            write_json(metadata_path, info)
             log.debug(f"Saved metadata: {metadata_path}")
+            return info
         except Exception as exc:
             log.warning(f"Failed to save metadata for {dataset_id}: {exc}")
+            return None
 
-    def download_all_defaults(self, force: bool = False) -> dict[str, Path]:
+    def download_all_defaults(
+        self,
+        force: bool = False,
+        max_workers: Optional[int] = None,
+    ) -> dict[str, Path]:
         """
         Download all default datasets for this project.
 
+        Up to max_workers datasets download at once; a failure is
+        logged and recorded as None without affecting the others.
+
         Args:
             force: Force re-download even if exists
+            max_workers: Datasets downloaded at once (defaults to MAX_PARALLEL_DATASETS)
 
         Returns:
             Dict mapping dataset_id to download path
         """
-        results = {}
-
-        for dataset_info in self.default_datasets:
-            dataset_id = dataset_info["dataset_id"]
-            try:
-                path = self.download_dataset(dataset_id, force=force)
-                results[dataset_id] = path
-            except Exception as exc:
-                log.error(f"Failed to download {dataset_id}: {exc}")
-                results[dataset_id] = None
+        # Keep the configured order in the result regardless of completion order
+        results = {dataset_info["dataset_id"]: None for dataset_info in self.default_datasets}
+        if not results:
+            return results
+
+        max_workers = min(max_workers or self.MAX_PARALLEL_DATASETS, len(self.default_datasets))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.download_dataset, dataset_info["dataset_id"], force=force):
+                    dataset_info["dataset_id"]
+                for dataset_info in self.default_datasets
+            }
+            for future in as_completed(futures):
+                dataset_id = futures[future]
+                try:
+                    results[dataset_id] = future.result()
+                except Exception as exc:
+                    log.error(f"Failed to download {dataset_id}: {exc}")
 
         return results
 
@@ -304,37 +615,44 @@ class KaggleDownloader:
             Dict with status info for each dataset
         """
         status = {}
+        # One directory listing tells which datasets have a directory at all
+        present = subdir_names(self.output_dir)
 
         for dataset_info in self.default_datasets:
             dataset_id = dataset_info["dataset_id"]
-            safe_name = sanitize_filename(dataset_id.replace("/", "_"))
-            dataset_dir = self.output_dir / safe_name
-            marker_file = dataset_dir / ".download_complete"
+            dataset_dir = self._dataset_dir(dataset_id)
+            exists = dataset_dir.name in present
+            marker = read_completion_marker(dataset_dir) if exists else None
 
             status[dataset_id] = {
                 "description": dataset_info["description"],
                 "priority": dataset_info["priority"],
-                "downloaded": marker_file.exists(),
-                "path": str(dataset_dir) if dataset_dir.exists() else None,
+                "downloaded": marker is not None,
+                "path": str(dataset_dir) if exists else None,
             }
 
-            # Count files if downloaded
-            if dataset_dir.exists():
-                files = list(dataset_dir.rglob("*"))
-                status[dataset_id]["file_count"] = len([f for f in files if f.is_file()])
+            # Count files if downloaded; completed downloads store the count in the marker
+            if marker and "file_count" in marker:
+                status[dataset_id]["file_count"] = marker["file_count"]
+            elif exists:
+                status[dataset_id]["file_count"] = dataset_file_stats(dataset_dir)["file_count"]
 
         return status
 
 
-def download_kaggle_datasets(force: bool = False) -> dict[str, Path]:
+def download_kaggle_datasets(
+    force: bool = False,
+    max_workers: Optional[int] = None,
+) -> dict[str, Path]:
     """
     Convenience function to download all Kaggle datasets.
 
     Args:
         force: Force re-download
+        max_workers: Datasets downloaded at once
 
     Returns:
         Dict mapping dataset_id to path
     """
     downloader = KaggleDownloader()
-    return downloader.download_all_defaults(force=force)
+    return downloader.download_all_defaults(force=force, max_workers=max_workers)
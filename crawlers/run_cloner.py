@@ -13,6 +13,7 @@ from pathlib import Path
 # Add crawlers to path
 sys.path.insert(0, str(Path(__file__).parent))
 
+from config.settings import ensure_output_dirs
 from sources.source_registry import SourceRegistry
 from sources.source_types import Priority
 from utils.logger import log
@@ -129,6 +130,7 @@ Examples:
     # TODO: Add scrapers and downloaders subcommands
 
     args = parser.parse_args()
+    ensure_output_dirs()
 
     # Handle global options
     if args.summary:
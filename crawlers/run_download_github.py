@@ -10,6 +10,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from cloners.clone_all import clone_all_repos
+from config.settings import ensure_output_dirs
 from sources.source_types import Priority
 from utils.logger import log
 
@@ -63,6 +64,7 @@ Examples:
     )
 
     args = parser.parse_args()
+    ensure_output_dirs()
 
     # List categories
     if args.list_categories:
@@ -99,11 +101,10 @@ Examples:
 
     if not args.dry_run:
         # Save summary to file
-        import json
         from config.settings import OUTPUT_DIR
+        from utils.helpers import write_json
         summary_file = OUTPUT_DIR / "github_download_summary.json"
-        with open(summary_file, "w") as f:
-            json.dump(summary, f, indent=2)
+        write_json(summary_file, summary)
         log.success(f"Summary saved to: {summary_file}")
 
 
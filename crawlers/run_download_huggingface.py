@@ -9,6 +9,7 @@ from pathlib import Path
 # Add crawlers to path
 sys.path.insert(0, str(Path(__file__).parent))
 
+from config.settings import ensure_output_dirs
 from downloaders.hf_downloader import HuggingFaceDownloader
 from utils.logger import log
 
@@ -23,6 +24,7 @@ def main():
         epilog="""
 IMPORTANT: Before running this script:
   1. Install required packages: pip install datasets huggingface-hub
+     Optional, for much faster large-file downloads: pip install hf_transfer
   2. Optional: Set HUGGINGFACE_TOKEN environment variable for private datasets
      (Get token from https://huggingface.co/settings/tokens)
 
@@ -47,6 +49,9 @@ Examples:
 
   # Use streaming mode (doesn't download full dataset)
   python run_download_huggingface.py --dataset Zellic/smart-contract-fiesta --streaming
+
+  # Convert to the datasets Arrow format instead of keeping raw parquet shards
+  python run_download_huggingface.py --dataset Zellic/smart-contract-fiesta --arrow
         """
     )
 
@@ -65,6 +70,11 @@ Examples:
         action="store_true",
         help="Show download status and exit"
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        help="Number of default datasets downloaded at once"
+    )
     parser.add_argument(
         "--streaming",
         action="store_true",
@@ -80,8 +90,20 @@ Examples:
         type=str,
         help="Specific split to download (train, test, etc.)"
     )
+    parser.add_argument(
+        "--arrow",
+        action="store_true",
+        help="Convert to the datasets Arrow format instead of keeping raw parquet shards"
+    )
+    parser.add_argument(
+        "--cache-hint",
+        choices=["willneed", "dontneed", "none"],
+        default="dontneed",
+        help="Page cache advice for downloaded files (default: dontneed)"
+    )
 
     args = parser.parse_args()
+    ensure_output_dirs()
 
     # Initialize downloader
     downloader = HuggingFaceDownloader()
@@ -118,7 +140,9 @@ Examples:
                 config=args.config,
                 split=args.split,
                 streaming=args.streaming,
-                force=args.force
+                force=args.force,
+                raw=not args.arrow,
+                cache_hint=args.cache_hint,
             )
             log.success(f"Downloaded to: {path}")
         except Exception as e:
@@ -131,7 +155,10 @@ Examples:
     log.warning("The Zellic dataset is VERY LARGE (~50GB+)")
     log.info("This will take a significant amount of time...")
 
-    results = downloader.download_all_defaults(force=args.force)
+    results = downloader.download_all_defaults(
+        force=args.force,
+        max_workers=args.concurrency,
+    )
 
     # Print summary
     print("\n" + "="*60)
@@ -161,8 +188,8 @@ Examples:
     print("="*60 + "\n")
 
     # Save summary
-    import json
     from config.settings import OUTPUT_DIR
+    from utils.helpers import write_json
     summary_file = OUTPUT_DIR / "huggingface_download_summary.json"
     summary_data = {
         "total": len(results),
@@ -170,8 +197,7 @@ Examples:
         "failed": failed,
         "datasets": {k: str(v) if v else None for k, v in results.items()}
     }
-    with open(summary_file, "w") as f:
-        json.dump(summary_data, f, indent=2)
+    write_json(summary_file, summary_data)
     log.success(f"Summary saved to: {summary_file}")
 
 
@@ -9,6 +9,7 @@ from pathlib import Path
 # Add crawlers to path
 sys.path.insert(0, str(Path(__file__).parent))
 
+from config.settings import ensure_output_dirs
 from downloaders.kaggle_downloader import KaggleDownloader
 from utils.logger import log
 
@@ -61,8 +62,14 @@ Examples:
         action="store_true",
         help="Show download status and exit"
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        help="Number of default datasets downloaded at once"
+    )
 
     args = parser.parse_args()
+    ensure_output_dirs()
 
     # Initialize downloader
     downloader = KaggleDownloader()
@@ -100,7 +107,10 @@ Examples:
     log.info("Downloading all default Kaggle datasets")
     log.info("This may take a while depending on dataset sizes...")
 
-    results = downloader.download_all_defaults(force=args.force)
+    results = downloader.download_all_defaults(
+        force=args.force,
+        max_workers=args.concurrency,
+    )
 
     # Print summary
     print("\n" + "="*60)
@@ -130,8 +140,8 @@ Examples:
     print("="*60 + "\n")
 
     # Save summary
-    import json
     from config.settings import OUTPUT_DIR
+    from utils.helpers import write_json
     summary_file = OUTPUT_DIR / "kaggle_download_summary.json"
     summary_data = {
         "total": len(results),
@@ -139,8 +149,7 @@ Examples:
         "failed": failed,
         "datasets": {k: str(v) if v else None for k, v in results.items()}
     }
-    with open(summary_file, "w") as f:
-        json.dump(summary_data, f, indent=2)
+    write_json(summary_file, summary_data)
     log.success(f"Summary saved to: {summary_file}")
 
 
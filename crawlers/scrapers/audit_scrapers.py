@@ -9,50 +9,66 @@ Per scraper.md requirements:
 from __future__ import annotations
 
 import re
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
 from typing import Optional
-from urllib.parse import urljoin, urlparse
 
 from config.settings import REPORTS_DIR
 from utils.helpers import ensure_dir
 from utils.logger import log
 
-from .base_scraper import BaseScraper
+from .base_scraper import (
+    BaseScraper,
+    create_session,
+    iter_anchors,
+    resolve_href,
+    substring_pattern,
+    url_host,
+)
+
+
+@lru_cache(maxsize=32)
+def _base_prefix_and_host(base_url: str) -> tuple[str, str]:
+    """The prefix of links resolved under base_url, and base_url's host."""
+    return f"{base_url}/", url_host(base_url)
 
 
 def _is_same_host(url: str, base_url: str) -> bool:
     """Check if URL belongs to the same host as base_url."""
-    base_host = urlparse(base_url).netloc
-    host = urlparse(url).netloc
+    prefix, base_host = _base_prefix_and_host(base_url)
+    # Relative hrefs resolve under base_url, so most links match the prefix
+    if url.startswith(prefix):
+        return True
+    host = url_host(url)
     return not host or host == base_host
 
 
 def _extract_links(
-    soup,
+    html: str,
     base_url: str,
     include_substrings: Optional[list[str]] = None,
     exclude_substrings: Optional[list[str]] = None,
 ) -> list[dict]:
-    """Extract links matching criteria from parsed HTML."""
+    """Extract links matching criteria from a page's HTML."""
     items = []
     seen_urls = set()
-    exclude_substrings = exclude_substrings or []
+    include = substring_pattern(tuple(include_substrings or ()))
+    exclude = substring_pattern(tuple(exclude_substrings or ()))
 
-    for link in soup.select("a[href]"):
-        href = link.get("href", "").strip()
+    for link in iter_anchors(html, href_contains=tuple(include_substrings or ())):
+        href = link.href.strip()
         if not href or href.startswith(("#", "mailto:", "javascript:")):
             continue
 
-        href_lower = href.lower()
-
         # Check inclusion
-        if include_substrings and not any(sub in href_lower for sub in include_substrings):
+        if include and not include.search(href):
             continue
 
         # Check exclusion
-        if any(sub in href_lower for sub in exclude_substrings):
+        if exclude and exclude.search(href):
             continue
 
-        url = urljoin(f"{base_url}/", href)
+        url = resolve_href(href, base_url)
         if url in seen_urls:
             continue
         seen_urls.add(url)
@@ -60,7 +76,7 @@ def _extract_links(
         if not _is_same_host(url, base_url):
             continue
 
-        title = link.get_text(strip=True) or link.get("aria-label") or link.get("title")
+        title = link.text or link.aria_label or link.title
         if not title:
             continue
 
@@ -81,62 +97,34 @@ class Code4renaScraper(BaseScraper):
     ENDPOINTS = ["/reports"]
     REPORT_PATTERN = re.compile(r"/reports/[\w\-]+")
 
-    def __init__(self, output_dir=None):
+    def __init__(self, output_dir=None, session=None):
         output_dir = output_dir or ensure_dir(REPORTS_DIR / "audits" / self.SOURCE)
-        super().__init__(base_url="https://code4rena.com", output_dir=output_dir, requires_js=False)
-
-    def _get_report_links(self, soup) -> list[dict]:
+        super().__init__(
+            base_url="https://code4rena.com",
+            output_dir=output_dir,
+            requires_js=False,
+            session=session,
+        )
+
+    def _get_report_links(self, html: str) -> list[dict]:
         """Extract report links from the reports page."""
         links = []
-        for link in soup.select("a[href]"):
-            href = link.get("href", "")
+        seen_urls = set()
+        for link in iter_anchors(html, href_contains=("/reports/",)):
+            href = link.href
             if self.REPORT_PATTERN.search(href):
-                url = urljoin(f"{self.base_url}/", href)
-                title = link.get_text(strip=True)
-                if title and url not in [l["url"] for l in links]:
+                url = resolve_href(href, self.base_url)
+                title = link.text
+                if title and url not in seen_urls:
+                    seen_urls.add(url)
                     links.append({"title": title, "url": url})
         return links
 
     def scrape(self) -> list[dict]:
         """Scrape all Code4rena reports with full content."""
-        items: list[dict] = []
-
-        for endpoint in self.ENDPOINTS:
-            url = self.build_url(endpoint)
-            log.info(f"{self.SOURCE}: Fetching {url}")
-
-            try:
-                html = self.fetch(url)
-                self.save_raw_html(html, url, prefix="listing")
-            except Exception as exc:
-                log.warning(f"{self.SOURCE}: failed to fetch {url}: {exc}")
-                continue
-
-            soup = self.parse_html(html)
-            links = self._get_report_links(soup)
-            log.info(f"{self.SOURCE}: Found {len(links)} report links")
-
-            # Scrape each report detail page
-            for link_info in links:
-                detail = self.scrape_detail_page(link_info["url"])
-                detail.update({
-                    "source": self.SOURCE,
-                    "category": "audit",
-                    "listing_title": link_info["title"],
-                })
-
-                # Download any PDFs found
-                for pdf_url in detail.get("pdf_links", []):
-                    pdf_path = self.download_pdf(pdf_url)
-                    if pdf_path:
-                        detail.setdefault("downloaded_pdfs", []).append(str(pdf_path))
-
-                items.append(detail)
-
-        items = self.dedupe_items(items)
-        self.save_report(self.build_payload(self.SOURCE, items), f"{self.SOURCE}_audits")
-        log.info(f"{self.SOURCE}: Scraped {len(items)} reports")
-        return items
+        return self.run_listing_scrape(
+            self.ENDPOINTS, self._get_report_links, category="audit", report_name=f"{self.SOURCE}_audits"
+        )
 
 
 class SherlockScraper(BaseScraper):
@@ -150,62 +138,34 @@ class SherlockScraper(BaseScraper):
     SOURCE = "sherlock"
     ENDPOINTS = ["/contests"]
 
-    def __init__(self, output_dir=None):
+    def __init__(self, output_dir=None, session=None):
         output_dir = output_dir or ensure_dir(REPORTS_DIR / "audits" / self.SOURCE)
-        super().__init__(base_url="https://audits.sherlock.xyz", output_dir=output_dir, requires_js=True)
-
-    def _get_contest_links(self, soup) -> list[dict]:
+        super().__init__(
+            base_url="https://audits.sherlock.xyz",
+            output_dir=output_dir,
+            requires_js=True,
+            session=session,
+        )
+
+    def _get_contest_links(self, html: str) -> list[dict]:
         """Extract contest links from the listing page."""
         links = []
-        for link in soup.select("a[href]"):
-            href = link.get("href", "")
+        seen_urls = set()
+        for link in iter_anchors(html, href_contains=("/contests/",)):
+            href = link.href
             if "/contests/" in href and href != "/contests/":
-                url = urljoin(f"{self.base_url}/", href)
-                title = link.get_text(strip=True)
-                if title and len(title) > 2 and url not in [l["url"] for l in links]:
+                url = resolve_href(href, self.base_url)
+                title = link.text
+                if title and len(title) > 2 and url not in seen_urls:
+                    seen_urls.add(url)
                     links.append({"title": title, "url": url})
         return links
 
     def scrape(self) -> list[dict]:
         """Scrape all Sherlock contest reports with full content."""
-        items: list[dict] = []
-
-        for endpoint in self.ENDPOINTS:
-            url = self.build_url(endpoint)
-            log.info(f"{self.SOURCE}: Fetching {url}")
-
-            try:
-                html = self.fetch(url)
-                self.save_raw_html(html, url, prefix="listing")
-            except Exception as exc:
-                log.warning(f"{self.SOURCE}: failed to fetch {url}: {exc}")
-                continue
-
-            soup = self.parse_html(html)
-            links = self._get_contest_links(soup)
-            log.info(f"{self.SOURCE}: Found {len(links)} contest links")
-
-            # Scrape each contest detail page
-            for link_info in links:
-                detail = self.scrape_detail_page(link_info["url"])
-                detail.update({
-                    "source": self.SOURCE,
-                    "category": "audit",
-                    "listing_title": link_info["title"],
-                })
-
-                # Download any PDFs found
-                for pdf_url in detail.get("pdf_links", []):
-                    pdf_path = self.download_pdf(pdf_url)
-                    if pdf_path:
-                        detail.setdefault("downloaded_pdfs", []).append(str(pdf_path))
-
-                items.append(detail)
-
-        items = self.dedupe_items(items)
-        self.save_report(self.build_payload(self.SOURCE, items), f"{self.SOURCE}_audits")
-        log.info(f"{self.SOURCE}: Scraped {len(items)} contests")
-        return items
+        return self.run_listing_scrape(
+            self.ENDPOINTS, self._get_contest_links, category="audit", report_name=f"{self.SOURCE}_audits"
+        )
 
 
 class CodeHawksScraper(BaseScraper):
@@ -217,65 +177,38 @@ class CodeHawksScraper(BaseScraper):
     """
 
     SOURCE = "codehawks"
+    ENDPOINTS = ["/contests"]
     CONTEST_PATTERN = re.compile(r"/contests/[\w\-]+")
 
-    def __init__(self, output_dir=None):
+    def __init__(self, output_dir=None, session=None):
         output_dir = output_dir or ensure_dir(REPORTS_DIR / "audits" / self.SOURCE)
-        super().__init__(base_url="https://codehawks.cyfrin.io", output_dir=output_dir, requires_js=True)
-
-    def _get_contest_links(self, soup) -> list[dict]:
+        super().__init__(
+            base_url="https://codehawks.cyfrin.io",
+            output_dir=output_dir,
+            requires_js=True,
+            session=session,
+        )
+
+    def _get_contest_links(self, html: str) -> list[dict]:
         """Extract contest links from the listing page."""
         links = []
-        for link in soup.select("a[href]"):
-            href = link.get("href", "")
+        seen_urls = set()
+        for link in iter_anchors(html, href_contains=("/contests/", "/c/")):
+            href = link.href
             if self.CONTEST_PATTERN.search(href) or "/c/" in href:
-                url = urljoin(f"{self.base_url}/", href)
-                title = link.get_text(strip=True)
+                url = resolve_href(href, self.base_url)
+                title = link.text
                 # Skip navigation links
-                if title and len(title) > 2 and url not in [l["url"] for l in links]:
+                if title and len(title) > 2 and url not in seen_urls:
+                    seen_urls.add(url)
                     links.append({"title": title, "url": url})
         return links
 
     def scrape(self) -> list[dict]:
         """Scrape all CodeHawks contest listings with full content."""
-        items: list[dict] = []
-
-        # Main contests page
-        url = self.build_url("/contests")
-        log.info(f"{self.SOURCE}: Fetching {url}")
-
-        try:
-            html = self.fetch(url)
-            self.save_raw_html(html, url, prefix="listing")
-        except Exception as exc:
-            log.warning(f"{self.SOURCE}: failed to fetch {url}: {exc}")
-            return items
-
-        soup = self.parse_html(html)
-        links = self._get_contest_links(soup)
-        log.info(f"{self.SOURCE}: Found {len(links)} contest links")
-
-        # Scrape each contest detail page
-        for link_info in links:
-            detail = self.scrape_detail_page(link_info["url"])
-            detail.update({
-                "source": self.SOURCE,
-                "category": "audit",
-                "listing_title": link_info["title"],
-            })
-
-            # Download any PDFs found
-            for pdf_url in detail.get("pdf_links", []):
-                pdf_path = self.download_pdf(pdf_url)
-                if pdf_path:
-                    detail.setdefault("downloaded_pdfs", []).append(str(pdf_path))
-
-            items.append(detail)
-
-        items = self.dedupe_items(items)
-        self.save_report(self.build_payload(self.SOURCE, items), f"{self.SOURCE}_audits")
-        log.info(f"{self.SOURCE}: Scraped {len(items)} contests")
-        return items
+        return self.run_listing_scrape(
+            self.ENDPOINTS, self._get_contest_links, category="audit", report_name=f"{self.SOURCE}_audits"
+        )
 
 
 class SoloditScraper(BaseScraper):
@@ -287,92 +220,86 @@ class SoloditScraper(BaseScraper):
     """
 
     SOURCE = "solodit"
-    FINDING_PATTERN = re.compile(r"/(issues|findings|checklist)/")
+    ENDPOINTS = ["/"]
+    # Only the first findings for now; the site has 49k+ results
+    LISTING_LIMIT = 100
+    FINDING_PATTERN = re.compile(r"/(issues|findings|checklist|report)/", re.IGNORECASE)
+    FINDING_HREFS = ("/issues/", "/findings/", "/checklist/", "/report/")
 
-    def __init__(self, output_dir=None):
+    def __init__(self, output_dir=None, session=None):
         output_dir = output_dir or ensure_dir(REPORTS_DIR / "audits" / self.SOURCE)
-        super().__init__(base_url="https://solodit.xyz", output_dir=output_dir, requires_js=True)
-
-    def _get_finding_links(self, soup) -> list[dict]:
+        super().__init__(
+            base_url="https://solodit.xyz",
+            output_dir=output_dir,
+            requires_js=True,
+            session=session,
+        )
+
+    def _get_finding_links(self, html: str) -> list[dict]:
         """Extract finding/issue links from the page."""
         links = []
-        include_terms = ["/issues/", "/findings/", "/checklist/", "/report/"]
+        seen_urls = set()
 
-        for link in soup.select("a[href]"):
-            href = link.get("href", "").lower()
-            if not any(term in href for term in include_terms):
+        # Most of a findings page's anchors are dropped before their text is read
+        for link in iter_anchors(html, href_contains=self.FINDING_HREFS):
+            if not self.FINDING_PATTERN.search(link.href):
                 continue
 
-            url = urljoin(f"{self.base_url}/", link.get("href", ""))
-            title = link.get_text(strip=True)
+            url = resolve_href(link.href, self.base_url)
+            title = link.text
 
-            if title and len(title) > 2 and url not in [l["url"] for l in links]:
+            if title and len(title) > 2 and url not in seen_urls:
+                seen_urls.add(url)
                 links.append({"title": title, "url": url})
 
         return links
 
     def scrape(self) -> list[dict]:
         """Scrape Solodit findings with full content."""
-        items: list[dict] = []
+        return self.run_listing_scrape(
+            self.ENDPOINTS,
+            self._get_finding_links,
+            category="audit",
+            report_name=f"{self.SOURCE}_audits",
+            limit=self.LISTING_LIMIT,
+        )
 
-        # Main page
-        url = self.base_url
-        log.info(f"{self.SOURCE}: Fetching {url}")
 
-        try:
-            html = self.fetch(url)
-            self.save_raw_html(html, url, prefix="listing")
-        except Exception as exc:
-            log.warning(f"{self.SOURCE}: failed to fetch {url}: {exc}")
-            return items
+AUDIT_SCRAPERS = (Code4renaScraper, SherlockScraper, CodeHawksScraper, SoloditScraper)
 
-        soup = self.parse_html(html)
-        links = self._get_finding_links(soup)
-        log.info(f"{self.SOURCE}: Found {len(links)} finding links")
 
-        # Limit to first 100 for initial scrape (site has 49k+ results)
-        links = links[:100]
-
-        # Scrape each finding detail page
-        for link_info in links:
-            detail = self.scrape_detail_page(link_info["url"])
-            detail.update({
-                "source": self.SOURCE,
-                "category": "audit",
-                "listing_title": link_info["title"],
-            })
-
-            # Download any PDFs found
-            for pdf_url in detail.get("pdf_links", []):
-                pdf_path = self.download_pdf(pdf_url)
-                if pdf_path:
-                    detail.setdefault("downloaded_pdfs", []).append(str(pdf_path))
-
-            items.append(detail)
-
-        items = self.dedupe_items(items)
-        self.save_report(self.build_payload(self.SOURCE, items), f"{self.SOURCE}_audits")
-        log.info(f"{self.SOURCE}: Scraped {len(items)} findings")
-        return items
+def _run_scraper(scraper_cls: type[BaseScraper], session=None) -> list[dict]:
+    """Build and run one scraper, returning [] if it fails."""
+    try:
+        log.info(f"Running {scraper_cls.SOURCE} scraper...")
+        return scraper_cls(session=session).scrape()
+    except Exception as exc:
+        log.error(f"Failed to run {scraper_cls.SOURCE} scraper: {exc}")
+        return []
 
 
 # Convenience function to run all audit scrapers
-def scrape_all_audits() -> dict[str, list[dict]]:
-    """Run all audit platform scrapers and return combined results."""
-    scrapers = [
-        Code4renaScraper(),
-        SherlockScraper(),
-        CodeHawksScraper(),
-        SoloditScraper(),
-    ]
-
-    results = {}
-    for scraper in scrapers:
-        try:
-            log.info(f"Running {scraper.SOURCE} scraper...")
-            results[scraper.SOURCE] = scraper.scrape()
-        except Exception as exc:
-            log.error(f"Failed to run {scraper.SOURCE} scraper: {exc}")
-            results[scraper.SOURCE] = []
-
-    return results
+def scrape_all_audits(processes: bool = True) -> dict[str, list[dict]]:
+    """
+    Run all audit platform scrapers concurrently and return combined results.
+
+    Args:
+        processes: Run each scraper in its own process, so their HTML parsing
+            is not serialized by the GIL. With False they run on threads
+            sharing one pooled session.
+    """
+    sources = [scraper_cls.SOURCE for scraper_cls in AUDIT_SCRAPERS]
+
+    if processes:
+        # Every platform is a different host, so a per-process session loses
+        # no connection reuse; each scraper writes only its own output dir
+        with ProcessPoolExecutor(max_workers=len(AUDIT_SCRAPERS)) as executor:
+            return dict(zip(sources, executor.map(_run_scraper, AUDIT_SCRAPERS)))
+
+    # One pooled session, so connections are reused across scrapers
+    session = create_session()
+    with ThreadPoolExecutor(max_workers=len(AUDIT_SCRAPERS)) as executor:
+        return dict(zip(
+            sources,
+            executor.map(_run_scraper, AUDIT_SCRAPERS, [session] * len(AUDIT_SCRAPERS)),
+        ))
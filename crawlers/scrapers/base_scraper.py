@@ -10,34 +10,216 @@ from __future__ import annotations
 
 import hashlib
 import json
+import os
 import re
+import tempfile
+import threading
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterator, NamedTuple, Optional
 from urllib.parse import urljoin, urlparse
 
 import requests
 from bs4 import BeautifulSoup
-from ratelimit import limits, sleep_and_retry
-
-from config.settings import HEADERS, REQUEST_TIMEOUT, RATE_LIMITS
-from utils.helpers import create_retry_decorator, ensure_dir, sanitize_filename
+from requests.adapters import HTTPAdapter
+
+from config.settings import (
+    HEADERS,
+    REQUEST_TIMEOUT,
+    SCRAPER_DETAIL_CACHE_TTL,
+    SCRAPER_LISTING_CACHE_TTL,
+)
+from utils.helpers import create_retry_decorator, ensure_dir, sanitize_filename, write_bytes_atomic
 from utils.logger import log
+from utils.rate_limiter import exhausted_budget_wait, get_rate_limiter
+
+try:
+    import lxml.etree
+    import lxml.html
+    HTML_PARSER = "lxml"  # C parser, several times faster than html.parser
+except ImportError:
+    lxml = None
+    HTML_PARSER = "html.parser"
+
+# Elements whose text BeautifulSoup's get_text() leaves out
+_NON_TEXT_TAGS = frozenset({"script", "style", "template"})
+
+# Host of an http(s) URL without the cost of a full urlparse
+_NETLOC_PATTERN = re.compile(r"https?://([^/?#\s]*)(?=[/?#]|$)")
+
+# Pages without this anywhere in their HTML cannot link a .pdf file;
+# "pdf" rather than ".pdf" so an entity-encoded dot still matches
+_PDF_HINT = re.compile("pdf", re.IGNORECASE)
+
+# href shapes urljoin rewrites: dot segments, ;params, empty queries or
+# fragments, and surrounding whitespace (it also collapses empty segments)
+_URLJOIN_REWRITES = re.compile(r"/\.|;|\?#|[?#]$|^\s|\s$")
+
+
+class Anchor(NamedTuple):
+    """An <a href> element of a page, reduced to what link extraction reads."""
+
+    href: str
+    text: str  # Same as BeautifulSoup's get_text(strip=True)
+    aria_label: Optional[str]
+    title: Optional[str]
+
+
+def _lxml_text(element) -> str:
+    """Concatenate the stripped text pieces of an lxml element, like get_text(strip=True)."""
+    pieces = []
+
+    def collect(node) -> None:
+        if node.text:
+            pieces.append(node.text)
+        for child in node:
+            # Comments and processing instructions have a non-string tag
+            if isinstance(child.tag, str) and child.tag not in _NON_TEXT_TAGS:
+                collect(child)
+            if child.tail:
+                pieces.append(child.tail)
+
+    collect(element)
+    return "".join(piece.strip() for piece in pieces)
+
+
+@lru_cache(maxsize=32)
+def substring_pattern(substrings: tuple[str, ...]) -> Optional[re.Pattern]:
+    """
+    Compile substrings into one case-insensitive alternation regex.
+
+    A single search tests them all against the original string, without
+    allocating a lowercased copy of it first.
+    """
+    if not substrings:
+        return None
+    return re.compile("|".join(map(re.escape, substrings)), re.IGNORECASE)
+
+
+def iter_anchors(html: str, href_contains: tuple[str, ...] = ()) -> Iterator[Anchor]:
+    """
+    Yield every <a href> of a page, in document order.
+
+    Link extraction only reads anchor attributes and text, so with lxml
+    installed this queries lxml's C tree directly instead of building a
+    BeautifulSoup tree.
+
+    Args:
+        html: Page HTML
+        href_contains: If given, only yield anchors whose href contains one
+            of these substrings, ignoring case. The href is tested before
+            the anchor's text is collected, which is the costly part of
+            yielding an anchor.
+    """
+    pattern = substring_pattern(tuple(href_contains))
+
+    def wanted(href: str) -> bool:
+        return pattern is None or pattern.search(href) is not None
+
+    if lxml is None:
+        for link in BeautifulSoup(html, HTML_PARSER).select("a[href]"):
+            if wanted(link["href"]):
+                yield Anchor(link["href"], link.get_text(strip=True), link.get("aria-label"), link.get("title"))
+        return
+
+    if not html.strip():
+        return
+    parser = lxml.html.HTMLParser(encoding="utf-8")
+    try:
+        root = lxml.html.fromstring(html.encode("utf-8"), parser=parser)
+    except lxml.etree.ParserError:
+        # "Document is empty": only comments, an XML declaration and the like
+        return
+    for link in root.iter("a"):
+        href = link.get("href")
+        if href is not None and wanted(href):
+            yield Anchor(href, _lxml_text(link), link.get("aria-label"), link.get("title"))
+
+
+@lru_cache(maxsize=64)
+def _base_parts(base_url: str) -> tuple[str, str]:
+    """Split a base URL into the prefix relative hrefs join onto and its scheme://host root."""
+    parsed = urlparse(base_url)
+    return f"{base_url}/", f"{parsed.scheme}://{parsed.netloc}"
+
+
+def resolve_href(href: str, base_url: str) -> str:
+    """
+    Resolve an href against a base URL, same as ``urljoin(f"{base_url}/", href)``.
+
+    Plain absolute URLs, root-relative paths and simple relative paths are
+    joined by string concatenation; anything urljoin would rewrite, and
+    protocol-relative or other-scheme hrefs, goes through urljoin.
+    """
+    if href.startswith(("https://", "http://")):
+        rest = href[href.index("//") + 2:]
+        simple = rest[:1] not in ("", "/", "?", "#")
+    else:
+        rest = href
+        simple = rest[:1] != "." and ":" not in rest
+    if not simple or "//" in rest or _URLJOIN_REWRITES.search(rest) or not rest.isprintable():
+        return urljoin(f"{base_url}/", href)
+
+    if rest is not href:
+        return href
+    prefix, root = _base_parts(base_url)
+    return root + href if href[:1] == "/" else prefix + href
+
+
+def url_host(url: str) -> str:
+    """Return a URL's netloc, as ``urlparse(url).netloc`` does."""
+    match = _NETLOC_PATTERN.match(url)
+    return match.group(1) if match else urlparse(url).netloc
+
+
+def create_session(pool_size: int = 32) -> requests.Session:
+    """
+    Create an HTTP session with the scraper headers.
+
+    Its connection pool is sized for concurrent detail and PDF fetches, so
+    keep-alive connections are reused instead of discarded. One session
+    can be shared by several scrapers.
+    """
+    session = requests.Session()
+    session.headers.update(HEADERS)
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
 
 
 class BaseScraper(ABC):
     """Base class for web scrapers with shared utilities."""
 
-    def __init__(self, base_url: str, output_dir: Path, requires_js: bool = False):
+    # Detail pages fetched at once by scrape_details; each JS page runs its own browser
+    DETAIL_WORKERS = 8
+    JS_DETAIL_WORKERS = 2
+
+    # PDFs of one detail page downloaded at once
+    PDF_WORKERS = 4
+
+    def __init__(
+        self,
+        base_url: str,
+        output_dir: Path,
+        requires_js: bool = False,
+        session: Optional[requests.Session] = None,
+    ):
         self.base_url = base_url.rstrip("/")
         self.output_dir = ensure_dir(output_dir)
         self.raw_dir = ensure_dir(output_dir / "raw")  # Store raw HTML/JSON
         self.pdf_dir = ensure_dir(output_dir / "pdfs")  # Store downloaded PDFs
+        self.cache_dir = output_dir / ".http_cache"  # Fetched pages reused across runs
         self.requires_js = requires_js
-        self.session = requests.Session()
-        self.session.headers.update(HEADERS)
+        self.session = session or create_session()
         self._playwright_browser = None
+        # PDF filename -> URL it was downloaded from, so distinct URLs never share a file
+        self._pdf_names: dict[str, str] = {}
+        self._pdf_names_lock = threading.Lock()
 
     @abstractmethod
     def scrape(self) -> list[dict]:
@@ -48,10 +230,26 @@ class BaseScraper(ABC):
         """Join the base URL with an endpoint."""
         return urljoin(f"{self.base_url}/", endpoint.lstrip("/"))
 
-    @sleep_and_retry
-    @limits(calls=RATE_LIMITS["web_scraper"]["calls"], period=RATE_LIMITS["web_scraper"]["period"])
     def _rate_limited_get(self, url: str, headers: Optional[dict] = None, stream: bool = False) -> requests.Response:
-        return self.session.get(url, headers=headers, timeout=REQUEST_TIMEOUT, stream=stream)
+        """
+        GET a URL within its host's web_scraper budget.
+
+        Every host has its own budget, so scrapers of different platforms
+        don't hold each other up. A 429 (or 503 with Retry-After) pauses
+        further requests to that host for as long as the server asked, and
+        so does an X-RateLimit-Remaining of 0 until X-RateLimit-Reset.
+        """
+        limiter = get_rate_limiter()
+        service = f"web_scraper:{url_host(url)}"
+        with limiter.limit(service):
+            response = self.session.get(url, headers=headers, timeout=REQUEST_TIMEOUT, stream=stream)
+            if response.status_code in (429, 503):
+                response.raise_for_status()
+
+        wait = exhausted_budget_wait(response.headers)
+        if wait:
+            limiter.back_off(service, wait)
+        return response
 
     @create_retry_decorator("web_scraper")
     def fetch_page(self, url: str, headers: Optional[dict] = None) -> str:
@@ -65,7 +263,12 @@ class BaseScraper(ABC):
             raise
 
     def fetch_page_js(self, url: str, wait_for_selector: Optional[str] = None) -> str:
-        """Fetch a page that requires JavaScript rendering using Playwright."""
+        """
+        Fetch a page that requires JavaScript rendering using Playwright.
+
+        Raises RuntimeError when navigation gets no response or an HTTP error
+        status, so error and challenge pages never reach the page cache.
+        """
         try:
             from playwright.sync_api import sync_playwright
         except ImportError as exc:
@@ -78,7 +281,10 @@ class BaseScraper(ABC):
             context = browser.new_context(user_agent=HEADERS.get("User-Agent"))
             page = context.new_page()
             try:
-                page.goto(url, wait_until="networkidle", timeout=timeout_ms)
+                response = page.goto(url, wait_until="networkidle", timeout=timeout_ms)
+                if response is None or response.status >= 400:
+                    status = "no response" if response is None else f"HTTP {response.status}"
+                    raise RuntimeError(f"Failed to render {url}: {status}")
                 if wait_for_selector:
                     page.wait_for_selector(wait_for_selector, timeout=timeout_ms // 2)
                 # Extra wait for dynamic content
@@ -89,24 +295,114 @@ class BaseScraper(ABC):
                 browser.close()
         return html
 
-    def fetch(self, url: str, headers: Optional[dict] = None) -> str:
-        """Fetch a page using the appropriate transport."""
+    def fetch(self, url: str, headers: Optional[dict] = None, max_age: Optional[float] = None) -> str:
+        """
+        Fetch a page using the appropriate transport, through the on-disk cache.
+
+        Args:
+            url: Page URL
+            headers: Extra request headers (plain HTTP only)
+            max_age: Seconds a cached copy stays valid; defaults to
+                SCRAPER_DETAIL_CACHE_TTL, 0 bypasses the cache
+
+        Returns:
+            Page HTML
+        """
+        if max_age is None:
+            max_age = SCRAPER_DETAIL_CACHE_TTL
+        cache_path = self._cache_path(url)
+        if max_age > 0:
+            try:
+                if time.time() - cache_path.stat().st_mtime < max_age:
+                    log.debug(f"Using cached page for {url}")
+                    return cache_path.read_text(encoding="utf-8")
+            except FileNotFoundError:
+                pass
+
         if self.requires_js:
-            return self.fetch_page_js(url)
-        return self.fetch_page(url, headers=headers)
+            html = self.fetch_page_js(url)
+        else:
+            html = self.fetch_page(url, headers=headers)
+
+        if max_age > 0:
+            ensure_dir(self.cache_dir)
+            write_bytes_atomic(cache_path, html.encode("utf-8"))
+        return html
+
+    def fetch_listing(self, url: str, raw_prefix: Optional[str] = None) -> str:
+        """
+        Fetch a listing page, whose cached copy expires sooner than detail pages.
+
+        Args:
+            url: Listing URL
+            raw_prefix: If given, also keep a raw copy of the page under this
+                prefix. The copy is a hard link to the cached file, so the
+                page is encoded and written to disk once.
+
+        Returns:
+            Page HTML
+        """
+        html = self.fetch(url, max_age=SCRAPER_LISTING_CACHE_TTL)
+        if raw_prefix is not None:
+            self._save_cached_raw_html(html, url, raw_prefix, max_age=SCRAPER_LISTING_CACHE_TTL)
+        return html
+
+    def _save_cached_raw_html(self, html: str, url: str, prefix: str, max_age: float) -> Path:
+        """
+        Link a page's cached file into raw_dir, writing it out only if linking fails.
+
+        An unchanged page costs a stat: its raw copy already is the cached file.
+        ``max_age`` is the one the page was fetched with; 0 means it has no
+        cached file.
+        """
+        path = self._raw_html_path(url, prefix)
+        if max_age > 0:
+            cache_path = self._cache_path(url)
+            tmp_path = path.with_name(path.name + ".tmp")
+            try:
+                # rename() is a no-op between two links to one file, so skip
+                # relinking when the raw copy already is the cached file
+                if path.exists() and path.samefile(cache_path):
+                    return path
+                tmp_path.unlink(missing_ok=True)
+                os.link(cache_path, tmp_path)
+                os.replace(tmp_path, path)
+                log.debug(f"Linked raw HTML: {path}")
+                return path
+            except OSError:
+                # No cached copy, or the cache sits on another filesystem
+                pass
+        return self.save_raw_html(html, url, prefix=prefix)
+
+    def _cache_path(self, url: str) -> Path:
+        """Cache file for a URL."""
+        return self.cache_dir / f"{hashlib.blake2b(url.encode(), digest_size=16).hexdigest()}.html"
 
     def parse_html(self, html: str) -> BeautifulSoup:
-        """Parse HTML into BeautifulSoup."""
-        return BeautifulSoup(html, "lxml")
+        """Parse HTML into BeautifulSoup, with lxml when it is installed."""
+        return BeautifulSoup(html, HTML_PARSER)
 
-    def save_raw_html(self, html: str, url: str, prefix: str = "") -> Path:
-        """Save raw HTML for traceability."""
+    def _raw_html_path(self, url: str, prefix: str = "") -> Path:
+        """Raw HTML file for a URL."""
         url_hash = hashlib.md5(url.encode()).hexdigest()[:12]
         filename = f"{prefix}_{url_hash}.html" if prefix else f"{url_hash}.html"
-        safe_name = sanitize_filename(filename)
-        path = self.raw_dir / safe_name
-        with open(path, "w", encoding="utf-8") as f:
-            f.write(html)
+        return self.raw_dir / sanitize_filename(filename)
+
+    def save_raw_html(self, html: str, url: str, prefix: str = "") -> Path:
+        """Save raw HTML for traceability, leaving an identical earlier copy untouched."""
+        path = self._raw_html_path(url, prefix)
+        payload = html.encode("utf-8")
+        try:
+            unchanged = path.stat().st_size == len(payload) and path.read_bytes() == payload
+        except FileNotFoundError:
+            unchanged = False
+        if unchanged:
+            log.debug(f"Raw HTML unchanged: {path}")
+            return path
+
+        # The old copy may be a hard link to a cached page; don't write through it
+        path.unlink(missing_ok=True)
+        path.write_bytes(payload)
         log.debug(f"Saved raw HTML: {path}")
         return path
 
@@ -141,12 +437,20 @@ class BaseScraper(ABC):
                     url_hash = hashlib.md5(url.encode()).hexdigest()[:12]
                     filename = f"document_{url_hash}.pdf"
 
-            safe_name = sanitize_filename(filename)
-            path = self.pdf_dir / safe_name
+            path = self.pdf_dir / self._claim_pdf_name(url, sanitize_filename(filename))
 
-            with open(path, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            # Stream to a private temp file and rename it into place, so
+            # concurrent downloads of the same PDF never interleave writes
+            fd, tmp_name = tempfile.mkstemp(dir=self.pdf_dir, prefix=f".{path.name}.", suffix=".part")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    for chunk in response.iter_content(chunk_size=8192):
+                        f.write(chunk)
+                os.chmod(tmp_name, 0o644)
+                os.replace(tmp_name, path)
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
 
             log.info(f"Downloaded PDF: {path}")
             return path
@@ -155,6 +459,17 @@ class BaseScraper(ABC):
             log.warning(f"Failed to download PDF from {url}: {exc}")
             return None
 
+    def _claim_pdf_name(self, url: str, name: str) -> str:
+        """Reserve a PDF filename for url, adding the URL hash if another URL already took it."""
+        with self._pdf_names_lock:
+            if self._pdf_names.setdefault(name, url) == url:
+                return name
+            stem, suffix = os.path.splitext(name)
+            url_hash = hashlib.md5(url.encode()).hexdigest()[:12]
+            name = f"{stem}_{url_hash}{suffix}"
+            self._pdf_names.setdefault(name, url)
+            return name
+
     def extract_text_content(self, soup: BeautifulSoup) -> str:
         """Extract all meaningful text content from a page."""
         # Remove script and style elements
@@ -237,7 +552,7 @@ class BaseScraper(ABC):
         for link in soup.find_all("a", href=True):
             href = link["href"]
             if href.lower().endswith(".pdf"):
-                full_url = urljoin(f"{self.base_url}/", href)
+                full_url = resolve_href(href, self.base_url)
                 pdf_links.append(full_url)
         return list(set(pdf_links))
 
@@ -265,28 +580,75 @@ class BaseScraper(ABC):
                 break
             urls.append(next_url)
             try:
-                html = self.fetch(next_url)
+                html = self.fetch_listing(next_url)
             except Exception:
                 break
-            soup = self.parse_html(html)
-            next_anchor = (
-                soup.find("a", rel="next")
-                or soup.select_one("a.next")
-                or soup.select_one("a[aria-label='Next']")
-                or soup.select_one("a:contains('Next')")
-                or soup.select_one("a:contains('→')")
-            )
-            next_link = soup.find("link", rel="next")
-            next_href = None
-            if next_anchor and next_anchor.get("href"):
-                next_href = next_anchor["href"]
-            elif next_link and next_link.get("href"):
-                next_href = next_link["href"]
+            next_href = self._find_next_href(self.parse_html(html))
             if not next_href:
                 break
             next_url = urljoin(f"{self.base_url}/", next_href)
         return urls
 
+    def iter_listing_pages(self, base_url: str, max_pages: int = 100) -> Iterator[tuple[str, BeautifulSoup]]:
+        """
+        Fetch, save and parse each page of a paginated listing exactly once.
+
+        The soup used to find the next link is the one yielded to the caller,
+        so listing pages are not fetched and parsed a second time for their
+        links. Pages that fail to fetch are skipped; when following next
+        links, a failed page ends the walk.
+
+        Yields:
+            Tuples of (page URL, parsed page)
+        """
+        if "{page}" in base_url:
+            for page_url in self.handle_pagination(base_url, max_pages):
+                soup = self._fetch_listing_soup(page_url)
+                if soup is not None:
+                    yield page_url, soup
+            return
+
+        seen: set[str] = set()
+        next_url = base_url
+        for _ in range(max_pages):
+            if not next_url or next_url in seen:
+                break
+            seen.add(next_url)
+            soup = self._fetch_listing_soup(next_url)
+            if soup is None:
+                break
+            yield next_url, soup
+            next_href = self._find_next_href(soup)
+            if not next_href:
+                break
+            next_url = urljoin(f"{self.base_url}/", next_href)
+
+    def _fetch_listing_soup(self, url: str) -> Optional[BeautifulSoup]:
+        """Fetch and save a listing page, returning its parsed tree or None on failure."""
+        try:
+            html = self.fetch_listing(url, raw_prefix="listing")
+        except Exception as exc:
+            log.warning(f"{self.SOURCE}: failed to fetch {url}: {exc}")
+            return None
+        return self.parse_html(html)
+
+    @staticmethod
+    def _find_next_href(soup: BeautifulSoup) -> Optional[str]:
+        """Return the href of a listing page's "next page" link, if any."""
+        next_anchor = (
+            soup.find("a", rel="next")
+            or soup.select_one("a.next")
+            or soup.select_one("a[aria-label='Next']")
+            or soup.select_one("a:contains('Next')")
+            or soup.select_one("a:contains('→')")
+        )
+        if next_anchor and next_anchor.get("href"):
+            return next_anchor["href"]
+        next_link = soup.find("link", rel="next")
+        if next_link and next_link.get("href"):
+            return next_link["href"]
+        return None
+
     def build_payload(self, source: str, items: list[dict]) -> dict:
         """Standard payload envelope for saved reports."""
         return {
@@ -332,8 +694,9 @@ class BaseScraper(ABC):
             content = self.extract_text_content(soup)
             markdown = self.extract_markdown_content(soup)
 
-            # Find PDF links
-            pdf_links = self.find_pdf_links(soup)
+            # Find PDF links. Most pages have none, and scanning the HTML
+            # text is much cheaper than walking every anchor of the tree
+            pdf_links = self.find_pdf_links(soup) if _PDF_HINT.search(html) else []
 
             result = {
                 "url": url,
@@ -345,7 +708,7 @@ class BaseScraper(ABC):
 
             # Save raw HTML for traceability
             if save_raw:
-                raw_path = self.save_raw_html(html, url)
+                raw_path = self._save_cached_raw_html(html, url, "", max_age=SCRAPER_DETAIL_CACHE_TTL)
                 result["raw_html_path"] = str(raw_path)
 
             return result
@@ -353,3 +716,136 @@ class BaseScraper(ABC):
         except Exception as exc:
             log.error(f"Failed to scrape detail page {url}: {exc}")
             return {"url": url, "error": str(exc)}
+
+    def download_pdfs(self, urls: list[str]) -> list[Optional[Path]]:
+        """
+        Download several PDFs at once (see download_pdf).
+
+        A URL listed more than once is downloaded once.
+
+        Returns:
+            Local path or None for each URL, in order
+        """
+        unique = list(dict.fromkeys(urls))
+        workers = min(self.PDF_WORKERS, len(unique))
+        if workers <= 1:
+            paths = dict(zip(unique, map(self.download_pdf, unique)))
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                paths = dict(zip(unique, executor.map(self.download_pdf, unique)))
+        return [paths[url] for url in urls]
+
+    def scrape_details(self, links: list[dict], category: str) -> list[dict]:
+        """
+        Scrape the detail page of every listing link, several at a time.
+
+        Fetches are I/O-bound, so they overlap on a thread pool; requests
+        still go through the shared web_scraper rate limit. Each detail is
+        tagged with the scraper's SOURCE, the category and the listing
+        title, and any PDFs it links are downloaded. A PDF linked from
+        several details is downloaded once and shared between them.
+
+        Args:
+            links: Listing links ({"title", "url"})
+            category: Category recorded on each detail (e.g. "audit")
+
+        Returns:
+            Details in the same order as links
+        """
+        pdf_downloads: dict[str, Future] = {}
+        pdf_lock = threading.Lock()
+
+        def download_shared(urls: list[str]) -> list[Optional[Path]]:
+            # Download the PDFs no other detail has claimed, then wait for the rest
+            owned: dict[str, Future] = {}
+            with pdf_lock:
+                for url in urls:
+                    if url not in pdf_downloads:
+                        owned[url] = pdf_downloads[url] = Future()
+                futures = [pdf_downloads[url] for url in urls]
+            try:
+                paths = self.download_pdfs(list(owned))
+            except BaseException as exc:
+                for future in owned.values():
+                    future.set_exception(exc)
+                raise
+            for future, path in zip(owned.values(), paths):
+                future.set_result(path)
+            return [future.result() for future in futures]
+
+        def scrape_one(link_info: dict) -> dict:
+            detail = self.scrape_detail_page(link_info["url"])
+            detail.update({
+                "source": self.SOURCE,
+                "category": category,
+                "listing_title": link_info["title"],
+            })
+
+            # Download any PDFs found
+            downloaded = [str(path) for path in download_shared(detail.get("pdf_links", [])) if path]
+            if downloaded:
+                detail["downloaded_pdfs"] = downloaded
+
+            return detail
+
+        workers = self.JS_DETAIL_WORKERS if self.requires_js else self.DETAIL_WORKERS
+        workers = min(workers, len(links))
+        if workers <= 1:
+            return [scrape_one(link_info) for link_info in links]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(scrape_one, links))
+
+    def run_listing_scrape(
+        self,
+        endpoints: list[str],
+        link_extractor: Callable[[str], list[dict]],
+        category: str,
+        report_name: str,
+        limit: Optional[int] = None,
+    ) -> list[dict]:
+        """
+        Scrape every detail page linked from a set of listing pages.
+
+        Fetches and saves each listing, extracts its links, scrapes the
+        linked pages (with their PDFs) concurrently, then dedupes and saves
+        the combined report. Nothing is saved when no listing could be
+        fetched, so a failed run does not overwrite an earlier report.
+
+        Args:
+            endpoints: Listing endpoints relative to base_url
+            link_extractor: Maps listing HTML to links ({"title", "url"})
+            category: Category recorded on each detail (e.g. "audit")
+            report_name: Report filename, without extension
+            limit: Maximum number of links to follow per listing
+
+        Returns:
+            Deduped details
+        """
+        items: list[dict] = []
+        fetched_any = False
+
+        for endpoint in endpoints:
+            url = self.build_url(endpoint)
+            log.info(f"{self.SOURCE}: Fetching {url}")
+
+            try:
+                html = self.fetch_listing(url, raw_prefix="listing")
+            except Exception as exc:
+                log.warning(f"{self.SOURCE}: failed to fetch {url}: {exc}")
+                continue
+            fetched_any = True
+
+            links = link_extractor(html)
+            log.info(f"{self.SOURCE}: Found {len(links)} links on {url}")
+            if limit is not None:
+                links = links[:limit]
+
+            items.extend(self.scrape_details(links, category=category))
+
+        if not fetched_any:
+            return []
+
+        items = self.dedupe_items(items)
+        self.save_report(self.build_payload(self.SOURCE, items), report_name)
+        log.info(f"{self.SOURCE}: Scraped {len(items)} pages")
+        return items
@@ -138,8 +138,7 @@ class SWCRegistryScraper(BaseScraper):
             log.info(f"{self.SOURCE}: Fetching {url}")
 
             try:
-                html = self.fetch(url)
-                self.save_raw_html(html, url, prefix="listing")
+                html = self.fetch_listing(url, raw_prefix="listing")
             except Exception as exc:
                 log.warning(f"{self.SOURCE}: failed to fetch {url}: {exc}")
                 continue
@@ -249,8 +248,7 @@ class OWASPScraper(BaseScraper):
             log.info(f"{self.SOURCE}: Fetching {url}")
 
             try:
-                html = self.fetch(url)
-                self.save_raw_html(html, url, prefix="main")
+                html = self.fetch_listing(url, raw_prefix="main")
             except Exception as exc:
                 log.warning(f"{self.SOURCE}: failed to fetch {url}: {exc}")
                 continue
@@ -331,8 +329,7 @@ class ConsensusBestPracticesScraper(BaseScraper):
         log.info(f"{self.SOURCE}: Fetching {url}")
 
         try:
-            html = self.fetch(url)
-            self.save_raw_html(html, url, prefix="main")
+            html = self.fetch_listing(url, raw_prefix="main")
         except Exception as exc:
             log.warning(f"{self.SOURCE}: failed to fetch {url}: {exc}")
             return items
@@ -122,21 +122,12 @@ class RektNewsScraper(BaseScraper):
         start_url = self.base_url
         log.info(f"{self.SOURCE}: Starting pagination from {start_url}")
 
-        page_urls = self.handle_pagination(start_url, max_pages=20)
-        log.info(f"{self.SOURCE}: Found {len(page_urls)} pages")
-
         all_links = []
-        for page_url in page_urls:
-            try:
-                html = self.fetch(page_url)
-                self.save_raw_html(html, page_url, prefix="listing")
-            except Exception as exc:
-                log.warning(f"{self.SOURCE}: failed to fetch {page_url}: {exc}")
-                continue
-
-            soup = self.parse_html(html)
-            links = self._get_article_links(soup)
-            all_links.extend(links)
+        page_count = 0
+        for _, soup in self.iter_listing_pages(start_url, max_pages=20):
+            page_count += 1
+            all_links.extend(self._get_article_links(soup))
+        log.info(f"{self.SOURCE}: Found {page_count} pages")
 
         # Dedupe links
         seen_urls = set()
@@ -227,19 +218,11 @@ class TrailOfBitsScraper(BaseScraper):
 
         for endpoint in self.ENDPOINTS:
             start_url = self.build_url(endpoint)
+            # Built once per endpoint, so every post of the category shares one string
+            blog_category = endpoint.strip("/").replace("category/", "")
             log.info(f"{self.SOURCE}: Starting pagination from {start_url}")
 
-            page_urls = self.handle_pagination(start_url, max_pages=10)
-
-            for page_url in page_urls:
-                try:
-                    html = self.fetch(page_url)
-                    self.save_raw_html(html, page_url, prefix="listing")
-                except Exception as exc:
-                    log.warning(f"{self.SOURCE}: failed to fetch {page_url}: {exc}")
-                    continue
-
-                soup = self.parse_html(html)
+            for _, soup in self.iter_listing_pages(start_url, max_pages=10):
                 links = self._get_post_links(soup)
 
                 for link_info in links:
@@ -248,7 +231,7 @@ class TrailOfBitsScraper(BaseScraper):
                         "source": self.SOURCE,
                         "category": "exploit",
                         "listing_title": link_info["title"],
-                        "blog_category": endpoint.strip("/").replace("category/", ""),
+                        "blog_category": blog_category,
                     })
 
                     # Download any PDFs found
@@ -320,8 +303,7 @@ class ImmunefiScraper(BaseScraper):
             log.info(f"{self.SOURCE}: Fetching {url}")
 
             try:
-                html = self.fetch(url)
-                self.save_raw_html(html, url, prefix="listing")
+                html = self.fetch_listing(url, raw_prefix="listing")
             except Exception as exc:
                 log.warning(f"{self.SOURCE}: failed to fetch {url}: {exc}")
                 continue
@@ -4,7 +4,7 @@ Source Registry
 Loads and manages all data sources from configuration.
 """
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 
 from sources.source_types import (
     GitHubSource,
@@ -122,6 +122,30 @@ class SourceRegistry:
 
         return sources
 
+    def iter_github_sources(
+        self,
+        categories: Optional[Iterable[str]] = None,
+        priority: Optional[Priority] = None,
+    ) -> Iterator[GitHubSource]:
+        """
+        Yield GitHub sources across several categories in one pass.
+
+        Sources come in the order of ``categories`` (unknown or repeated
+        categories are skipped), or in registry order when it is None.
+        """
+        if categories is None:
+            selected = self._github_sources.values()
+        else:
+            selected = [
+                self._github_sources[category]
+                for category in dict.fromkeys(categories)
+                if category in self._github_sources
+            ]
+        for sources in selected:
+            for source in sources:
+                if priority is None or source.priority == priority:
+                    yield source
+
     def get_github_categories(self) -> list[str]:
         """Get all GitHub source categories."""
         return list(self._github_sources.keys())
@@ -1,10 +1,18 @@
 """
 Helper utilities for the crawler system.
 """
+import copy
+import fnmatch
 import hashlib
+import json
+import os
 import re
+import shutil
+import threading
+import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 from urllib.parse import urlparse
 
 import yaml
@@ -12,14 +20,32 @@ from tenacity import retry, stop_after_attempt, wait_exponential
 
 from config.settings import RETRY_CONFIG, BASE_DIR
 
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON serialization
+    orjson = None
+
+
+@lru_cache(maxsize=8)
+def _parse_sources_config(path: str, mtime_ns: int, size: int):
+    """Parse a sources YAML file; keyed on mtime/size so edits are picked up."""
+    with open(path, "r") as f:
+        return yaml.safe_load(f)
+
 
 def load_sources_config(config_path: Optional[Path] = None) -> dict:
-    """Load the sources configuration from YAML."""
+    """
+    Load the sources configuration from YAML.
+
+    The parsed file is cached per process until it changes on disk; callers
+    get their own deep copy, so mutating the result never affects the cache.
+    """
     config_path = Path(config_path) if config_path else BASE_DIR / "config" / "sources.yaml"
-    with open(config_path, "r") as f:
-        return yaml.safe_load(f)
+    stat = os.stat(config_path)
+    return copy.deepcopy(_parse_sources_config(str(config_path), stat.st_mtime_ns, stat.st_size))
 
 
+@lru_cache(maxsize=4096)
 def extract_repo_info(url: str) -> tuple[str, str]:
     """Extract owner and repo name from GitHub URL."""
     parsed = urlparse(url)
@@ -29,6 +55,7 @@ def extract_repo_info(url: str) -> tuple[str, str]:
     raise ValueError(f"Invalid GitHub URL: {url}")
 
 
+@lru_cache(maxsize=4096)
 def sanitize_filename(name: str) -> str:
     """Sanitize a string to be safe for use as a filename."""
     # Remove or replace invalid characters
@@ -89,3 +116,215 @@ def count_files_by_type(directory: Path) -> dict:
                 ext = file.suffix.lower() or "no_extension"
                 counts[ext] = counts.get(ext, 0) + 1
     return counts
+
+
+def iter_files(directory: Path) -> Iterator[os.DirEntry]:
+    """
+    Yield a DirEntry for every file under a directory.
+
+    Walks with os.scandir, whose entries carry the file type from the
+    directory read, so no per-file stat() is needed to tell files from
+    directories and no Path objects are built. Symlinked directories are
+    not descended into.
+    """
+    stack = [directory]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file():
+                    yield entry
+
+
+def subdir_names(directory: Path) -> set[str]:
+    """Names of the immediate subdirectories of a directory, from one scandir (empty if missing)."""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries if entry.is_dir()}
+    except FileNotFoundError:
+        return set()
+
+
+def discard_dir(path: Path) -> threading.Thread:
+    """
+    Remove a directory tree without making the caller wait for it.
+
+    The directory is renamed to a hidden sibling (an O(1) rename on the same
+    filesystem), so its original path is free immediately, and the tree is
+    deleted on a background thread. The thread is not a daemon: interpreter
+    exit waits for the deletion rather than leaving a half-deleted tree.
+
+    Returns:
+        The thread doing the deletion
+    """
+    trash = path.with_name(f".{path.name}.trash.{os.getpid()}.{time.time_ns()}")
+    os.rename(path, trash)
+    thread = threading.Thread(
+        target=shutil.rmtree,
+        args=(trash,),
+        kwargs={"ignore_errors": True},
+        name=f"discard-{path.name}",
+    )
+    thread.start()
+    return thread
+
+
+def dir_size(directory: Path) -> int:
+    """Total size in bytes of the files under a directory (one stat() per file)."""
+    return sum(entry.stat().st_size for entry in iter_files(directory))
+
+
+def advise_page_cache(directory: Path, hint: str) -> int:
+    """
+    Pass a page cache hint for every file under a directory to the kernel.
+
+    "dontneed" drops the freshly written pages so a finished download does
+    not crowd out other work on a shared host; "willneed" starts reading
+    them in ahead of an immediate consumer. "none" (or a platform without
+    posix_fadvise) is a no-op.
+
+    Returns:
+        Number of files advised
+    """
+    advice = {
+        "willneed": getattr(os, "POSIX_FADV_WILLNEED", None),
+        "dontneed": getattr(os, "POSIX_FADV_DONTNEED", None),
+    }.get(hint)
+    if advice is None or not hasattr(os, "posix_fadvise"):
+        return 0
+
+    advised = 0
+    stack = [directory]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    fd = os.open(entry.path, os.O_RDONLY)
+                    try:
+                        os.posix_fadvise(fd, 0, 0, advice)
+                    finally:
+                        os.close(fd)
+                    advised += 1
+    return advised
+
+
+def write_json(path: Path, data) -> None:
+    """
+    Write data as indented JSON, using orjson when it is installed.
+
+    Values JSON can't represent natively (datetimes, paths, ...) are
+    stringified, matching json.dump(..., default=str). The file is replaced
+    atomically (see write_bytes_atomic).
+    """
+    write_bytes_atomic(path, _encode_json(data))
+
+
+def _encode_json(data) -> bytes:
+    """Encode data as indented JSON bytes (see write_json)."""
+    if orjson is not None:
+        return orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, default=str).encode()
+
+
+def write_bytes_atomic(path: Path, payload: bytes) -> None:
+    """
+    Replace a file's contents atomically.
+
+    The payload is written and fsync'ed to a temporary sibling which is then
+    renamed over ``path``, so a crash leaves either the old file or the
+    complete new one, never a torn write.
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, payload)
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
+
+
+COMPLETION_MARKER = ".download_complete"
+
+# Files the downloaders write next to a dataset's own files
+BOOKKEEPING_FILES = frozenset({COMPLETION_MARKER, "metadata.json"})
+
+
+def iter_dataset_files(dataset_dir: Path) -> Iterator[os.DirEntry]:
+    """Yield a DirEntry for every file of a dataset, skipping top-level bookkeeping files."""
+    root = os.fspath(dataset_dir)
+    for entry in iter_files(dataset_dir):
+        if entry.name in BOOKKEEPING_FILES and os.path.dirname(entry.path) == root:
+            continue
+        yield entry
+
+
+def dataset_file_stats(dataset_dir: Path) -> dict:
+    """Count the files under a dataset directory and sum their sizes in one walk."""
+    file_count = 0
+    total_size = 0
+    for entry in iter_dataset_files(dataset_dir):
+        file_count += 1
+        total_size += entry.stat().st_size
+    return {"file_count": file_count, "total_size": total_size}
+
+
+def write_completion_marker(dataset_dir: Path, stats: Optional[dict] = None) -> dict:
+    """
+    Mark a downloaded dataset directory complete.
+
+    The marker records the file count and total size, so status checks can
+    read them back instead of walking the tree. It is written atomically and
+    should come last, after any metadata, so its presence means the download
+    and its bookkeeping are both complete.
+
+    Args:
+        dataset_dir: Dataset directory
+        stats: Precomputed dataset_file_stats; walked here when omitted
+
+    Returns:
+        The recorded stats (file_count, total_size, completed_at)
+    """
+    stats = dict(stats or dataset_file_stats(dataset_dir))
+    stats["completed_at"] = time.time()
+    write_bytes_atomic(dataset_dir / COMPLETION_MARKER, _encode_json(stats))
+    return stats
+
+
+def read_completion_marker(dataset_dir: Path) -> Optional[dict]:
+    """
+    Read the stats stored in a dataset's completion marker.
+
+    Returns:
+        None if the dataset is not marked complete; an empty dict for
+        markers written before stats were recorded (plain empty files)
+    """
+    try:
+        data = (dataset_dir / COMPLETION_MARKER).read_bytes()
+    except FileNotFoundError:
+        return None
+    try:
+        stats = json.loads(data) if data.strip() else {}
+    except ValueError:
+        return {}
+    return stats if isinstance(stats, dict) else {}
+
+
+def compile_globs(patterns: list[str]) -> re.Pattern:
+    """
+    Compile fnmatch-style globs into one regex.
+
+    ``compile_globs(patterns).match(path)`` is equivalent to
+    ``any(fnmatch.fnmatch(path, p) for p in patterns)`` (case-sensitive),
+    but translates each glob once instead of on every call. Compiled
+    patterns are cached, so repeated pattern lists cost a dict lookup.
+    """
+    return _compile_globs(tuple(patterns))
+
+
+@lru_cache(maxsize=64)
+def _compile_globs(patterns: tuple[str, ...]) -> re.Pattern:
+    return re.compile("|".join(f"(?:{fnmatch.translate(p)})" for p in patterns))
@@ -10,8 +10,9 @@ import asyncio
 import threading
 import time
 from collections import defaultdict
-from contextlib import contextmanager
+from contextlib import asynccontextmanager, contextmanager
 from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
 from typing import Optional
 
 from config.settings import RATE_LIMITS
@@ -33,6 +34,71 @@ class RateLimitState:
 
     timestamps: list = field(default_factory=list)
     lock: threading.Lock = field(default_factory=threading.Lock)
+    blocked_until: float = 0.0  # Set when the service answered 429 Too Many Requests
+
+
+def _parse_retry_after(value) -> Optional[float]:
+    """Parse a Retry-After header (delta seconds or HTTP date) into seconds."""
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        pass
+    try:
+        retry_at = parsedate_to_datetime(str(value))
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+def too_many_requests(exc: BaseException) -> Optional[float]:
+    """
+    Check whether an exception (or one it was raised from) is a 429 response.
+
+    Understands exceptions carrying an HTTP response (requests,
+    huggingface_hub), exceptions with status/headers attributes (the kaggle
+    API client) and failed CLI runs whose stderr mentions 429. A 503 with a
+    Retry-After header is the same request to slow down and counts too.
+
+    Returns:
+        None if it isn't a 429, otherwise the Retry-After delay in seconds
+        (0.0 when the response didn't say)
+    """
+    while exc is not None:
+        response = getattr(exc, "response", None)
+        status = getattr(response, "status_code", None) or getattr(exc, "status", None)
+        headers = getattr(response, "headers", None) or getattr(exc, "headers", None) or {}
+        if status == 429 or (status == 503 and headers.get("Retry-After") is not None):
+            return _parse_retry_after(headers.get("Retry-After")) or 0.0
+        stderr = getattr(exc, "stderr", None)
+        if isinstance(stderr, str) and ("429" in stderr or "Too Many Requests" in stderr):
+            return 0.0
+        exc = exc.__cause__
+    return None
+
+
+def exhausted_budget_wait(headers) -> Optional[float]:
+    """
+    Seconds until a server's advertised request budget resets, once it is spent.
+
+    Reads X-RateLimit-Remaining and X-RateLimit-Reset, the latter either an
+    epoch timestamp or a delay in seconds.
+
+    Returns:
+        None unless the remaining budget is 0 and the reset time is known
+    """
+    try:
+        remaining = int(headers["X-RateLimit-Remaining"])
+        reset = float(headers["X-RateLimit-Reset"])
+    except (KeyError, TypeError, ValueError):
+        return None
+    if remaining > 0:
+        return None
+    # Epoch timestamps are far larger than any sensible delay
+    if reset > 1e9:
+        reset -= time.time()
+    return max(0.0, reset)
 
 
 class RateLimiter:
@@ -47,6 +113,11 @@ class RateLimiter:
             # Make API call
             pass
 
+        # Scoped services ("<service>:<key>") share the service's limit
+        # but each keep their own budget, e.g. one per scraped host
+        with limiter.limit("web_scraper:example.com"):
+            pass
+
         # Check before calling
         if limiter.can_proceed("web_scraper"):
             limiter.record_call("web_scraper")
@@ -82,6 +153,11 @@ class RateLimiter:
 
     def _get_config(self, service: str) -> RateLimitConfig:
         """Get config for a service, using default if not found."""
+        if service not in self._configs and ":" in service:
+            # Scoped service such as "web_scraper:example.com"
+            base = service.split(":", 1)[0]
+            if base in self._configs:
+                return self._configs[base]
         if service not in self._configs:
             # Use web_scraper as default
             log.warning(f"No rate limit config for '{service}', using web_scraper defaults")
@@ -170,20 +246,99 @@ class RateLimiter:
             time.sleep(wait_time)
         return wait_time
 
+    def try_acquire(self, service: str) -> float:
+        """
+        Reserve a call slot if one is free, without blocking.
+
+        The service lock is only held for the check-and-record itself, so
+        any number of threads can hold reserved slots at the same time.
+
+        Args:
+            service: The service name
+
+        Returns:
+            0.0 if a slot was reserved, otherwise seconds until one frees up
+        """
+        config = self._get_config(service)
+        state = self._get_state(service)
+
+        with state.lock:
+            now = time.time()
+            if now < state.blocked_until:
+                return state.blocked_until - now
+            self._cleanup_old_timestamps(state, config)
+            if len(state.timestamps) < config.calls + config.burst:
+                state.timestamps.append(now)
+                return 0.0
+            return max(0.0, (min(state.timestamps) + config.period) - now)
+
+    def acquire(self, service: str) -> float:
+        """
+        Wait for and reserve a call slot in one atomic step.
+
+        The call is recorded when it starts, so concurrent threads can't all
+        pass the check before any of them records, and long-running calls
+        (e.g. file downloads) don't delay the bookkeeping.
+
+        Args:
+            service: The service name
+
+        Returns:
+            Total time waited in seconds
+        """
+        waited = 0.0
+        while True:
+            wait = self.try_acquire(service)
+            if wait == 0.0:
+                return waited
+            log.debug(f"Rate limit: waiting {wait:.2f}s for {service}")
+            time.sleep(wait)
+            waited += wait
+
+    def back_off(self, service: str, retry_after: Optional[float] = None) -> float:
+        """
+        Hold back all calls to a service after it answered 429.
+
+        Args:
+            service: The service name
+            retry_after: Seconds the service asked for; defaults to one
+                call interval (period / calls)
+
+        Returns:
+            Seconds until calls are allowed again
+        """
+        config = self._get_config(service)
+        state = self._get_state(service)
+        if not retry_after:
+            retry_after = config.period / max(1, config.calls)
+
+        with state.lock:
+            state.blocked_until = max(state.blocked_until, time.time() + retry_after)
+        log.warning(f"Rate limited by {service}; pausing calls for {retry_after:.1f}s")
+        return retry_after
+
     @contextmanager
     def limit(self, service: str):
         """
         Context manager for rate-limited operations.
 
+        A slot is reserved on entry (see acquire()); nothing is held while
+        the body runs, so parallel workers proceed concurrently up to the
+        configured rate. If the body raises a 429 error, every caller of
+        the service waits out its Retry-After before the next call.
+
         Usage:
             with limiter.limit("github"):
                 make_api_call()
         """
-        self.wait_if_needed(service)
+        self.acquire(service)
         try:
             yield
-        finally:
-            self.record_call(service)
+        except Exception as exc:
+            retry_after = too_many_requests(exc)
+            if retry_after is not None:
+                self.back_off(service, retry_after)
+            raise
 
     def get_stats(self, service: str) -> dict:
         """
@@ -246,7 +401,6 @@ class AsyncRateLimiter:
 
     def __init__(self, configs: Optional[dict[str, RateLimitConfig]] = None):
         self._sync_limiter = RateLimiter(configs)
-        self._locks: dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
 
     async def can_proceed(self, service: str) -> bool:
         """Check if a call can proceed."""
@@ -268,15 +422,28 @@ class AsyncRateLimiter:
             await asyncio.sleep(wait_time)
         return wait_time
 
-    @contextmanager
+    async def acquire(self, service: str) -> float:
+        """Reserve a call slot, sleeping on the event loop while none is free."""
+        waited = 0.0
+        while True:
+            wait = self._sync_limiter.try_acquire(service)
+            if wait == 0.0:
+                return waited
+            log.debug(f"Rate limit: waiting {wait:.2f}s for {service}")
+            await asyncio.sleep(wait)
+            waited += wait
+
+    @asynccontextmanager
     async def limit(self, service: str):
         """Async context manager for rate-limited operations."""
-        async with self._locks[service]:
-            await self.wait_if_needed(service)
-            try:
-                yield
-            finally:
-                await self.record_call(service)
+        await self.acquire(service)
+        try:
+            yield
+        except Exception as exc:
+            retry_after = too_many_requests(exc)
+            if retry_after is not None:
+                self._sync_limiter.back_off(service, retry_after)
+            raise
 
 
 # Global rate limiter instance
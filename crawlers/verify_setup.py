@@ -13,7 +13,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 from sources.source_registry import SourceRegistry
 from sources.source_types import Priority, SourceType
 from cloners.github_cloner import GitHubCloner
-from config.settings import GITHUB_TOKEN, REPOS_DIR
+from config.settings import GITHUB_TOKEN, REPOS_DIR, ensure_output_dirs
 from utils.logger import log
 
 
@@ -23,6 +23,7 @@ def check_environment():
     print("ENVIRONMENT CHECK")
     print("="*60)
 
+    ensure_output_dirs()
     checks = {
         "REPOS_DIR exists": REPOS_DIR.exists(),
     }
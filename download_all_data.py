@@ -2,22 +2,26 @@
 """
 Master Data Download Script
 
-Downloads all data sources in prioritized order:
+Downloads all data sources:
 1. GitHub repositories (easiest, fastest)
 2. Kaggle datasets (medium, requires credentials)
 3. HuggingFace datasets (large, time-consuming)
 
-This script orchestrates the entire data collection process.
+This script orchestrates the entire data collection process. The phases
+talk to different services with separate rate limits, so they run
+concurrently unless --sequential is given.
 """
 import sys
-import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 from datetime import datetime
 
 # Add crawlers to path
 sys.path.insert(0, str(Path(__file__).parent / "crawlers"))
 
-from config.settings import OUTPUT_DIR
+from config.settings import OUTPUT_DIR, ensure_output_dirs
+from utils.helpers import write_json
 from utils.logger import log
 
 
@@ -32,8 +36,7 @@ def save_master_summary(summary: dict):
     """Save master download summary to file."""
     summary_file = OUTPUT_DIR / "master_download_summary.json"
     summary["timestamp"] = datetime.now().isoformat()
-    with open(summary_file, "w") as f:
-        json.dump(summary, f, indent=2)
+    write_json(summary_file, summary)
     log.success(f"Master summary saved to: {summary_file}")
 
 
@@ -91,25 +94,31 @@ def download_kaggle_datasets(force: bool = False):
     }
 
 
-def download_huggingface_datasets(force: bool = False, streaming: bool = False):
+def confirm_huggingface_download() -> bool:
+    """Ask before the (very large) HuggingFace download; asked before any phase starts."""
+    log.warning("WARNING: The Zellic dataset is VERY LARGE (~50GB+)")
+    log.warning("This will take a significant amount of time...")
+    response = input("Continue with full download? (y/N): ").strip().lower()
+    return response == 'y'
+
+
+def skipped_huggingface_download():
+    """Phase result for a declined HuggingFace download."""
+    log.info("Skipping HuggingFace download")
+    return {
+        "phase": "huggingface",
+        "summary": {"skipped": True},
+        "success": True
+    }
+
+
+def download_huggingface_datasets(force: bool = False):
     """Download HuggingFace datasets."""
     from downloaders.hf_downloader import HuggingFaceDownloader
 
     print_section_header("PHASE 3: HuggingFace Datasets")
     log.info("Downloading HuggingFace datasets")
 
-    if not streaming:
-        log.warning("WARNING: The Zellic dataset is VERY LARGE (~50GB+)")
-        log.warning("This will take a significant amount of time...")
-        response = input("Continue with full download? (y/N): ").strip().lower()
-        if response != 'y':
-            log.info("Skipping HuggingFace download")
-            return {
-                "phase": "huggingface",
-                "summary": {"skipped": True},
-                "success": True
-            }
-
     downloader = HuggingFaceDownloader()
     results = downloader.download_all_defaults(force=force)
 
@@ -138,7 +147,8 @@ def main():
         description="Download all smart contract data sources in prioritized order",
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
-This script downloads data in the following order:
+This script downloads the following, concurrently by default
+(each service keeps its own rate limit):
   1. GitHub repositories (HIGH priority only by default)
   2. Kaggle datasets (requires credentials)
   3. HuggingFace datasets (very large, optional)
@@ -165,6 +175,9 @@ Examples:
 
   # Force re-download everything
   python download_all_data.py --force
+
+  # Run the phases one after another
+  python download_all_data.py --sequential
         """
     )
 
@@ -199,8 +212,14 @@ Examples:
         action="store_true",
         help="Show what would be downloaded without downloading"
     )
+    parser.add_argument(
+        "--sequential",
+        action="store_true",
+        help="Run the download phases one after another instead of concurrently"
+    )
 
     args = parser.parse_args()
+    ensure_output_dirs()
 
     print_section_header("SMART CONTRACT DATA DOWNLOAD - MASTER SCRIPT")
 
@@ -212,56 +231,67 @@ Examples:
         "overall_success": True
     }
 
-    # Phase 1: GitHub repositories
+    # Each phase: (name, callable, warning on partial failure, hint on error)
+    phases = []
+
     if not args.skip_github:
-        try:
-            github_result = download_github_repos(
-                priority=args.github_priority,
-                dry_run=args.dry_run
-            )
-            master_summary["phases"].append(github_result)
-            if not github_result["success"]:
-                master_summary["overall_success"] = False
-                log.warning("Some GitHub repositories failed to download")
-        except Exception as e:
-            log.error(f"GitHub download phase failed: {e}")
-            master_summary["overall_success"] = False
+        phases.append((
+            "GitHub",
+            partial(download_github_repos, priority=args.github_priority, dry_run=args.dry_run),
+            "Some GitHub repositories failed to download",
+            None,
+        ))
     else:
         log.info("Skipping GitHub repositories (--skip-github)")
 
-    # Phase 2: Kaggle datasets
     if not args.skip_kaggle and not args.dry_run:
-        try:
-            kaggle_result = download_kaggle_datasets(force=args.force)
-            master_summary["phases"].append(kaggle_result)
-            if not kaggle_result["success"]:
-                master_summary["overall_success"] = False
-                log.warning("Some Kaggle datasets failed to download")
-        except Exception as e:
-            log.error(f"Kaggle download phase failed: {e}")
-            log.info("Make sure KAGGLE_USERNAME and KAGGLE_KEY are set")
-            master_summary["overall_success"] = False
+        phases.append((
+            "Kaggle",
+            partial(download_kaggle_datasets, force=args.force),
+            "Some Kaggle datasets failed to download",
+            "Make sure KAGGLE_USERNAME and KAGGLE_KEY are set",
+        ))
     elif args.dry_run:
         log.info("Skipping Kaggle datasets (dry run mode)")
     else:
         log.info("Skipping Kaggle datasets (--skip-kaggle)")
 
-    # Phase 3: HuggingFace datasets
     if not args.skip_huggingface and not args.dry_run:
-        try:
-            hf_result = download_huggingface_datasets(force=args.force)
-            master_summary["phases"].append(hf_result)
-            if not hf_result["success"]:
-                master_summary["overall_success"] = False
-                log.warning("Some HuggingFace datasets failed to download")
-        except Exception as e:
-            log.error(f"HuggingFace download phase failed: {e}")
-            master_summary["overall_success"] = False
+        # Prompt now, before other phases start writing to the terminal
+        if confirm_huggingface_download():
+            download_hf = partial(download_huggingface_datasets, force=args.force)
+        else:
+            download_hf = skipped_huggingface_download
+        phases.append((
+            "HuggingFace",
+            download_hf,
+            "Some HuggingFace datasets failed to download",
+            None,
+        ))
     elif args.dry_run:
         log.info("Skipping HuggingFace datasets (dry run mode)")
     else:
         log.info("Skipping HuggingFace datasets (--skip-huggingface)")
 
+    max_workers = 1 if args.sequential else max(1, len(phases))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(run) for _, run, _, _ in phases]
+
+    # Report in phase order regardless of completion order
+    for (name, _, warning, hint), future in zip(phases, futures):
+        try:
+            result = future.result()
+        except Exception as e:
+            log.error(f"{name} download phase failed: {e}")
+            if hint:
+                log.info(hint)
+            master_summary["overall_success"] = False
+            continue
+        master_summary["phases"].append(result)
+        if not result["success"]:
+            master_summary["overall_success"] = False
+            log.warning(warning)
+
     # Final summary
     print_section_header("DOWNLOAD COMPLETE - SUMMARY")
 
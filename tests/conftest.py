@@ -26,6 +26,15 @@ def crawlers_dir(project_root):
     return project_root / "crawlers"
 
 
+@pytest.fixture(autouse=True)
+def reset_rate_limiter():
+    """Start every test with an empty shared rate limiter so budgets don't carry over."""
+    from utils.rate_limiter import get_rate_limiter
+
+    get_rate_limiter().reset()
+    yield
+
+
 @pytest.fixture
 def temp_dir():
     """Create a temporary directory for test outputs."""
@@ -0,0 +1,507 @@
+from __future__ import annotations
+
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin, urlparse
+
+import pytest
+import requests
+from bs4 import BeautifulSoup
+
+from scrapers import audit_scrapers, base_scraper
+from scrapers.audit_scrapers import Code4renaScraper, SherlockScraper, SoloditScraper, _extract_links, _is_same_host
+from scrapers.base_scraper import Anchor, create_session, iter_anchors, resolve_href, url_host
+from utils.rate_limiter import get_rate_limiter
+
+
+LISTING = """
+<html><body>
+  <a href="/reports/2024-01-alpha">Alpha <!-- hidden --> <b> Audit</b><script>x()</script></a>
+  <a href="/reports/2024-02-beta" aria-label="Beta report"></a>
+  <a href="https://other.example/reports/gamma">Gamma</a>
+  <a href="/reports/2024-01-alpha">Alpha again</a>
+  <a name="no-href">Anchor</a>
+  <a href="#top">Top</a>
+</body></html>
+"""
+
+
+def test_iter_anchors_matches_beautifulsoup():
+    soup = BeautifulSoup(LISTING, "lxml")
+    expected = [
+        Anchor(link["href"], link.get_text(strip=True), link.get("aria-label"), link.get("title"))
+        for link in soup.select("a[href]")
+    ]
+
+    assert list(iter_anchors(LISTING)) == expected
+    # lxml calls these documents empty; BeautifulSoup finds no anchors
+    for empty in ("", "<!-- c -->", "<?xml version='1.0'?>"):
+        assert list(iter_anchors(empty)) == []
+
+
+def test_iter_anchors_without_lxml(monkeypatch):
+    expected = list(iter_anchors(LISTING))
+    monkeypatch.setattr(base_scraper, "lxml", None)
+    monkeypatch.setattr(base_scraper, "HTML_PARSER", "html.parser")
+
+    assert list(iter_anchors(LISTING)) == expected
+
+
+def test_iter_anchors_filters_hrefs_by_substring(monkeypatch):
+    html = '<a href="/Issues/1">One</a><a href="/blog">Blog</a><a href="/findings/2">Two</a><a>No href</a>'
+    expected = [Anchor("/Issues/1", "One", None, None), Anchor("/findings/2", "Two", None, None)]
+
+    assert list(iter_anchors(html, href_contains=("/issues/", "/FINDINGS/"))) == expected
+
+    monkeypatch.setattr(base_scraper, "lxml", None)
+    monkeypatch.setattr(base_scraper, "HTML_PARSER", "html.parser")
+    assert list(iter_anchors(html, href_contains=("/issues/", "/FINDINGS/"))) == expected
+
+
+def test_extract_links_filters_and_dedupes():
+    links = _extract_links(LISTING, "https://code4rena.com", include_substrings=["/reports/"])
+
+    assert links == [
+        {"title": "AlphaAudit", "url": "https://code4rena.com/reports/2024-01-alpha"},
+        {"title": "Beta report", "url": "https://code4rena.com/reports/2024-02-beta"},
+    ]
+
+
+def test_get_report_links_reads_html(temp_dir):
+    scraper = Code4renaScraper(output_dir=temp_dir)
+
+    assert scraper._get_report_links(LISTING) == [
+        {"title": "AlphaAudit", "url": "https://code4rena.com/reports/2024-01-alpha"},
+        {"title": "Gamma", "url": "https://other.example/reports/gamma"},
+    ]
+
+
+def test_get_finding_links_matches_case_insensitively(temp_dir):
+    scraper = SoloditScraper(output_dir=temp_dir)
+    html = '<a href="/Issues/1">First issue</a><a href="/blog/x">Blog</a><a href="/issues/1">Dup</a>'
+
+    assert scraper._get_finding_links(html) == [
+        {"title": "First issue", "url": "https://solodit.xyz/Issues/1"},
+        {"title": "Dup", "url": "https://solodit.xyz/issues/1"},
+    ]
+
+
+def test_untitled_link_does_not_hide_a_later_titled_duplicate(temp_dir):
+    scraper = Code4renaScraper(output_dir=temp_dir)
+    html = '<a href="/reports/a"></a><a href="/reports/a">Report A</a><a href="/reports/a">Again</a>'
+
+    assert scraper._get_report_links(html) == [
+        {"title": "Report A", "url": "https://code4rena.com/reports/a"},
+    ]
+
+
+def test_is_same_host():
+    base_url = "https://docs.example/guide"
+
+    assert _is_same_host("https://docs.example/guide/a", base_url)
+    assert _is_same_host("https://docs.example/other", base_url)
+    assert _is_same_host("http://docs.example?x=1", base_url)
+    assert _is_same_host("/relative", base_url)
+    assert not _is_same_host("https://docs.example.evil/guide/a", base_url)
+    assert not _is_same_host("https://other.example/guide/a", base_url)
+
+
+def test_extract_links_applies_exclusions():
+    html = '<a href="/reports/a">A</a><a href="/reports/a/draft">Draft</a><a href="/blog">Blog</a>'
+
+    links = _extract_links(
+        html,
+        "https://code4rena.com",
+        include_substrings=["/reports/", "/findings/"],
+        exclude_substrings=["draft"],
+    )
+
+    assert links == [{"title": "A", "url": "https://code4rena.com/reports/a"}]
+    assert [l["title"] for l in _extract_links(html, "https://code4rena.com")] == ["A", "Draft", "Blog"]
+
+
+def test_scrape_details_fetches_concurrently_in_order(temp_dir, monkeypatch):
+    scraper = Code4renaScraper(output_dir=temp_dir)
+    links = [{"title": f"Report {i}", "url": f"https://code4rena.com/reports/{i}"} for i in range(3)]
+    # All three detail fetches must be in flight together to get past the barrier
+    barrier = threading.Barrier(3, timeout=5)
+
+    def fake_detail(url):
+        barrier.wait()
+        pdf_links = [f"{url}.pdf"] if url.endswith("/1") else []
+        return {"url": url, "pdf_links": pdf_links}
+
+    monkeypatch.setattr(scraper, "scrape_detail_page", fake_detail)
+    monkeypatch.setattr(scraper, "download_pdf", lambda url: temp_dir / "report.pdf")
+
+    details = scraper.scrape_details(links, category="audit")
+
+    assert [d["listing_title"] for d in details] == ["Report 0", "Report 1", "Report 2"]
+    assert all(d["source"] == "code4rena" and d["category"] == "audit" for d in details)
+    assert details[1]["downloaded_pdfs"] == [str(temp_dir / "report.pdf")]
+    assert "downloaded_pdfs" not in details[0]
+
+
+def fake_pdf_response(url, chunks):
+    response = requests.Response()
+    response.url = url
+    response.status_code = 200
+    response.headers["content-type"] = "application/pdf"
+    response.iter_content = lambda chunk_size=1: iter(chunks())
+    return response
+
+
+def test_scrape_details_downloads_a_shared_pdf_once(temp_dir, monkeypatch):
+    scraper = Code4renaScraper(output_dir=temp_dir)
+    links = [{"title": f"Report {i}", "url": f"https://code4rena.com/reports/{i}"} for i in range(2)]
+    pdf_url = "https://code4rena.com/files/report.pdf"
+    barrier = threading.Barrier(2, timeout=5)
+    downloads = []
+
+    def fake_detail(url):
+        barrier.wait()
+        return {"url": url, "pdf_links": [pdf_url]}
+
+    def fake_get(url, stream=False):
+        downloads.append(url)
+        return fake_pdf_response(url, lambda: [b"%PDF-1.7 report"])
+
+    monkeypatch.setattr(scraper, "scrape_detail_page", fake_detail)
+    monkeypatch.setattr(scraper, "_rate_limited_get", fake_get)
+
+    details = scraper.scrape_details(links, category="audit")
+
+    expected = temp_dir / "pdfs" / "report.pdf"
+    assert downloads == [pdf_url]
+    assert [d["downloaded_pdfs"] for d in details] == [[str(expected)], [str(expected)]]
+    assert expected.read_bytes() == b"%PDF-1.7 report"
+
+
+def test_download_pdfs_runs_concurrently_and_keeps_order(temp_dir, monkeypatch):
+    scraper = Code4renaScraper(output_dir=temp_dir)
+    urls = [f"https://code4rena.com/{i}.pdf" for i in range(3)]
+    barrier = threading.Barrier(3, timeout=5)
+
+    def fake_download(url):
+        barrier.wait()
+        return None if url.endswith("1.pdf") else temp_dir / url.rsplit("/", 1)[1]
+
+    monkeypatch.setattr(scraper, "download_pdf", fake_download)
+
+    assert scraper.download_pdfs(urls) == [temp_dir / "0.pdf", None, temp_dir / "2.pdf"]
+
+
+def test_concurrent_pdfs_sharing_a_basename_get_their_own_files(temp_dir, monkeypatch):
+    scraper = Code4renaScraper(output_dir=temp_dir)
+    urls = ["https://code4rena.com/a/report.pdf", "https://code4rena.com/b/report.pdf"]
+    # Both downloads are mid-stream together before either writes its last chunk
+    barrier = threading.Barrier(2, timeout=5)
+
+    def chunks(url):
+        yield f"{url} part 1\n".encode()
+        barrier.wait()
+        yield f"{url} part 2\n".encode()
+
+    monkeypatch.setattr(
+        scraper, "_rate_limited_get", lambda url, stream=False: fake_pdf_response(url, lambda: chunks(url))
+    )
+
+    paths = scraper.download_pdfs(urls)
+
+    assert len(set(paths)) == 2
+    assert paths[0] == temp_dir / "pdfs" / "report.pdf"
+    for url, path in zip(urls, paths):
+        assert path.read_bytes() == f"{url} part 1\n{url} part 2\n".encode()
+    assert sorted(p.name for p in (temp_dir / "pdfs").iterdir()) == sorted(p.name for p in paths)
+
+
+def test_interrupted_pdf_download_keeps_the_previous_file(temp_dir, monkeypatch):
+    scraper = Code4renaScraper(output_dir=temp_dir)
+    url = "https://code4rena.com/reports/report.pdf"
+    existing = temp_dir / "pdfs" / "report.pdf"
+    existing.write_bytes(b"complete pdf")
+
+    def chunks():
+        yield b"partial"
+        raise requests.ConnectionError("connection reset")
+
+    monkeypatch.setattr(scraper, "_rate_limited_get", lambda url, stream=False: fake_pdf_response(url, chunks))
+
+    assert scraper.download_pdf(url) is None
+    assert existing.read_bytes() == b"complete pdf"
+    assert [p.name for p in (temp_dir / "pdfs").iterdir()] == ["report.pdf"]
+
+
+def test_scrapers_can_share_a_pooled_session(temp_dir):
+    session = create_session(pool_size=16)
+    code4rena = Code4renaScraper(output_dir=temp_dir / "c4", session=session)
+    sherlock = SherlockScraper(output_dir=temp_dir / "sherlock", session=session)
+
+    assert code4rena.session is session
+    assert sherlock.session is session
+    assert session.get_adapter("https://code4rena.com")._pool_maxsize == 16
+    assert Code4renaScraper(output_dir=temp_dir / "own").session is not session
+
+
+def test_scrape_all_audits_runs_scrapers_concurrently(temp_dir, monkeypatch):
+    monkeypatch.setattr(audit_scrapers, "REPORTS_DIR", temp_dir)
+    barrier = threading.Barrier(4, timeout=5)
+
+    def fake_scrape(self):
+        # Every scraper must be running at once to get past the barrier
+        barrier.wait()
+        if self.SOURCE == "sherlock":
+            raise RuntimeError("boom")
+        return [{"source": self.SOURCE}]
+
+    for cls in (Code4renaScraper, SherlockScraper, audit_scrapers.CodeHawksScraper, SoloditScraper):
+        monkeypatch.setattr(cls, "scrape", fake_scrape)
+
+    results = audit_scrapers.scrape_all_audits(processes=False)
+
+    assert list(results) == ["code4rena", "sherlock", "codehawks", "solodit"]
+    assert results["sherlock"] == []
+    assert results["solodit"] == [{"source": "solodit"}]
+
+
+def test_scrape_all_audits_runs_each_scraper_in_a_process(monkeypatch):
+    pools = []
+
+    class RecordingPool(ThreadPoolExecutor):
+        def __init__(self, max_workers):
+            pools.append(max_workers)
+            super().__init__(max_workers=max_workers)
+
+    monkeypatch.setattr(audit_scrapers, "ProcessPoolExecutor", RecordingPool)
+    monkeypatch.setattr(audit_scrapers, "_run_scraper", lambda cls: [{"source": cls.SOURCE}])
+
+    results = audit_scrapers.scrape_all_audits()
+
+    assert pools == [4]
+    assert results["codehawks"] == [{"source": "codehawks"}]
+
+
+def test_fetch_reuses_cached_pages_until_they_expire(temp_dir, monkeypatch):
+    scraper = Code4renaScraper(output_dir=temp_dir)
+    fetched = []
+
+    def fake_fetch_page(url, headers=None):
+        fetched.append(url)
+        return f"<html>{len(fetched)}</html>"
+
+    monkeypatch.setattr(scraper, "fetch_page", fake_fetch_page)
+    url = "https://code4rena.com/reports/a"
+
+    assert scraper.fetch(url) == "<html>1</html>"
+    assert scraper.fetch(url) == "<html>1</html>"
+    assert scraper.fetch(url, max_age=0) == "<html>2</html>"
+
+    # Age the cached copy past the listing TTL
+    cache_path = scraper._cache_path(url)
+    old = cache_path.stat().st_mtime - base_scraper.SCRAPER_LISTING_CACHE_TTL - 1
+    os.utime(cache_path, (old, old))
+
+    assert scraper.fetch_listing(url) == "<html>3</html>"
+    assert fetched == [url] * 3
+
+
+def test_iter_listing_pages_fetches_and_parses_each_page_once(temp_dir, monkeypatch):
+    scraper = Code4renaScraper(output_dir=temp_dir)
+    pages = {
+        "https://code4rena.com/reports": '<a href="/reports/a">A</a><a rel="next" href="/reports?page=2">Next</a>',
+        "https://code4rena.com/reports?page=2": '<a href="/reports/b">B</a><link rel="next" href="/reports">',
+    }
+    fetched = []
+
+    def fake_fetch_page(url, headers=None):
+        fetched.append(url)
+        return pages[url]
+
+    monkeypatch.setattr(scraper, "fetch_page", fake_fetch_page)
+    parse_calls = []
+    parse_html = scraper.parse_html
+    monkeypatch.setattr(scraper, "parse_html", lambda html: parse_calls.append(html) or parse_html(html))
+
+    walked = [(url, soup.a["href"]) for url, soup in scraper.iter_listing_pages("https://code4rena.com/reports")]
+
+    assert walked == [
+        ("https://code4rena.com/reports", "/reports/a"),
+        ("https://code4rena.com/reports?page=2", "/reports/b"),
+    ]
+    assert fetched == list(pages)
+    assert len(parse_calls) == 2
+    assert len(list(scraper.raw_dir.glob("listing_*.html"))) == 2
+
+
+def test_run_listing_scrape_limits_dedupes_and_saves(temp_dir, monkeypatch):
+    scraper = SoloditScraper(output_dir=temp_dir)
+    listing = "".join(f'<a href="/issues/{i % 3}">Issue {i}</a>' for i in range(6))
+    monkeypatch.setattr(scraper, "fetch_listing", lambda url, raw_prefix=None: listing)
+    monkeypatch.setattr(scraper, "scrape_detail_page", lambda url: {"url": url, "pdf_links": []})
+    monkeypatch.setattr(SoloditScraper, "LISTING_LIMIT", 2)
+
+    items = scraper.scrape()
+
+    assert [item["url"] for item in items] == ["https://solodit.xyz/issues/0", "https://solodit.xyz/issues/1"]
+    assert all(item["category"] == "audit" for item in items)
+    assert (temp_dir / "solodit_audits.json").exists()
+
+
+def test_run_listing_scrape_does_not_save_when_every_listing_fails(temp_dir, monkeypatch):
+    scraper = Code4renaScraper(output_dir=temp_dir)
+
+    def fail(url, raw_prefix=None):
+        raise RuntimeError("offline")
+
+    monkeypatch.setattr(scraper, "fetch_listing", fail)
+
+    assert scraper.scrape() == []
+    assert not (temp_dir / "code4rena_audits.json").exists()
+
+
+def test_resolve_href_matches_urljoin():
+    hrefs = [
+        "", "/reports/a", "reports/a", "?page=2", "#top", "https://other.example/x?y=1#z",
+        "http://code4rena.com", "//cdn.example/a.js", "../up", "./here", "/a/./b", "/a/../b",
+        "a//b", "/a;params", "/a?", "/a#", " /padded ", "mailto:x@y.z", "HTTPS://Upper.example/",
+        "https://", "https:///path", "/tab\there",
+    ]
+    for base_url in ("https://code4rena.com", "https://docs.example/guide"):
+        for href in hrefs:
+            expected = urljoin(f"{base_url}/", href)
+            assert resolve_href(href, base_url) == expected, href
+            assert url_host(expected) == urlparse(expected).netloc, expected
+
+
+def test_fetch_listing_links_raw_copy_to_cached_page(temp_dir, monkeypatch):
+    scraper = Code4renaScraper(output_dir=temp_dir)
+    monkeypatch.setattr(scraper, "fetch_page", lambda url, headers=None: "<html>é</html>")
+    url = "https://code4rena.com/reports"
+
+    assert scraper.fetch_listing(url, raw_prefix="listing") == "<html>é</html>"
+
+    raw_path = scraper._raw_html_path(url, "listing")
+    assert raw_path.read_text(encoding="utf-8") == "<html>é</html>"
+    assert raw_path.stat().st_ino == scraper._cache_path(url).stat().st_ino
+
+    # Served from the cache, the raw copy is already the cached file
+    assert scraper.fetch_listing(url, raw_prefix="listing") == "<html>é</html>"
+    assert raw_path.stat().st_nlink == 2
+    assert sorted(path.name for path in scraper.raw_dir.iterdir()) == [raw_path.name]
+
+
+def test_fetch_listing_writes_raw_copy_without_cache(temp_dir, monkeypatch):
+    scraper = Code4renaScraper(output_dir=temp_dir)
+    monkeypatch.setattr(base_scraper, "SCRAPER_LISTING_CACHE_TTL", 0)
+    monkeypatch.setattr(scraper, "fetch_page", lambda url, headers=None: "<html>fresh</html>")
+    url = "https://code4rena.com/reports"
+
+    scraper.fetch_listing(url, raw_prefix="listing")
+
+    assert scraper._raw_html_path(url, "listing").read_text(encoding="utf-8") == "<html>fresh</html>"
+    assert not scraper._cache_path(url).exists()
+
+
+def test_save_raw_html_skips_unchanged_content(temp_dir):
+    scraper = Code4renaScraper(output_dir=temp_dir)
+    url = "https://code4rena.com/reports/a"
+    path = scraper.save_raw_html("<html>a</html>", url)
+    os.utime(path, (0, 0))
+
+    assert scraper.save_raw_html("<html>a</html>", url) == path
+    assert path.stat().st_mtime == 0
+
+    scraper.save_raw_html("<html>b</html>", url)
+    assert path.read_text(encoding="utf-8") == "<html>b</html>"
+
+
+def test_save_raw_html_does_not_write_through_a_cache_link(temp_dir, monkeypatch):
+    scraper = Code4renaScraper(output_dir=temp_dir)
+    monkeypatch.setattr(scraper, "fetch_page", lambda url, headers=None: "<html>cached</html>")
+    url = "https://code4rena.com/reports"
+    scraper.fetch_listing(url, raw_prefix="listing")
+
+    scraper.save_raw_html("<html>new</html>", url, prefix="listing")
+
+    assert scraper._cache_path(url).read_text(encoding="utf-8") == "<html>cached</html>"
+    assert scraper._raw_html_path(url, "listing").read_text(encoding="utf-8") == "<html>new</html>"
+
+
+def test_scrape_detail_page_only_walks_anchors_for_pdfs_when_mentioned(temp_dir, monkeypatch):
+    scraper = Code4renaScraper(output_dir=temp_dir)
+    pages = {
+        "https://code4rena.com/reports/a": "<h1>A</h1><a href='/reports/b'>B</a>",
+        "https://code4rena.com/reports/b": "<h1>B</h1><a href='/files/B.PDF'>PDF</a><a href='/files/B.PDF'>Again</a>",
+    }
+    monkeypatch.setattr(scraper, "fetch", lambda url: pages[url])
+    walked = []
+    find_pdf_links = scraper.find_pdf_links
+    monkeypatch.setattr(scraper, "find_pdf_links", lambda soup: walked.append(soup) or find_pdf_links(soup))
+
+    assert scraper.scrape_detail_page("https://code4rena.com/reports/a", save_raw=False)["pdf_links"] == []
+    assert walked == []
+    assert scraper.scrape_detail_page("https://code4rena.com/reports/b", save_raw=False)["pdf_links"] == [
+        "https://code4rena.com/files/B.PDF"
+    ]
+
+
+def test_rate_limited_get_backs_off_per_host(temp_dir, monkeypatch):
+    scraper = Code4renaScraper(output_dir=temp_dir)
+
+    def fake_get(url, headers=None, timeout=None, stream=False):
+        response = requests.Response()
+        response.url = url
+        response.status_code = 429 if "code4rena" in url else 200
+        response.headers["Retry-After"] = "30"
+        return response
+
+    monkeypatch.setattr(scraper.session, "get", fake_get)
+
+    with pytest.raises(requests.HTTPError):
+        scraper._rate_limited_get("https://code4rena.com/reports")
+    assert scraper._rate_limited_get("https://other.example/page").status_code == 200
+
+    limiter = get_rate_limiter()
+    assert 29 < limiter.try_acquire("web_scraper:code4rena.com") <= 30
+    assert limiter.try_acquire("web_scraper:other.example") == 0.0
+
+
+def test_js_error_pages_are_not_cached(temp_dir, monkeypatch):
+    class FakePage:
+        def goto(self, url, **kwargs):
+            return type("Response", (), {"status": 404})()
+
+        def content(self):
+            return "<html>Not found</html>"
+
+    class FakeBrowser:
+        def new_context(self, **kwargs):
+            return self
+
+        def new_page(self):
+            return FakePage()
+
+        def close(self):
+            pass
+
+    class FakePlaywright:
+        chromium = type("Chromium", (), {"launch": staticmethod(lambda **kwargs: FakeBrowser())})
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+    fake_module = type(sys)("playwright.sync_api")
+    fake_module.sync_playwright = FakePlaywright
+    monkeypatch.setitem(sys.modules, "playwright", type(sys)("playwright"))
+    monkeypatch.setitem(sys.modules, "playwright.sync_api", fake_module)
+    scraper = SherlockScraper(output_dir=temp_dir)
+    url = "https://audits.sherlock.xyz/contests/1"
+
+    with pytest.raises(RuntimeError, match="HTTP 404"):
+        scraper.fetch(url)
+    assert not scraper._cache_path(url).exists()
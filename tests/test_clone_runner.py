@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from cloners import github_cloner, runner
+from cloners.github_cloner import RepoInfo
+from sources.source_types import GitHubSource, Priority
+
+
+def make_source(name: str, category: str, priority: Priority) -> GitHubSource:
+    return GitHubSource(
+        name=name,
+        url=f"https://github.com/org/{name}",
+        category=category,
+        data_types=["solidity"],
+        priority=priority,
+    )
+
+
+def test_clone_sources_clones_and_summarizes(temp_dir, monkeypatch, capsys):
+    submitted = []
+
+    def fake_clone_many(self, repos, max_workers=None):
+        submitted.extend(repos)
+        return [
+            RepoInfo(
+                name=url.rsplit("/", 1)[-1],
+                url=url,
+                local_path=Path(temp_dir),
+                category=category,
+                priority=priority,
+                status="cloned" if category == "audit_repos" else "failed",
+                error=None if category == "audit_repos" else "boom",
+            )
+            for url, category, priority in repos
+        ]
+
+    monkeypatch.setattr(github_cloner, "REPOS_DIR", temp_dir)
+    monkeypatch.setattr(runner.GitHubCloner, "clone_many", fake_clone_many)
+    sources = [
+        make_source("a", "audit_repos", Priority.HIGH),
+        make_source("b", "educational", Priority.LOW),
+    ]
+
+    results, summary = runner.clone_sources(sources, title="TEST SUMMARY", breakdown=True)
+
+    assert submitted == [
+        ("https://github.com/org/a", "audit_repos", "high"),
+        ("https://github.com/org/b", "educational", "low"),
+    ]
+    assert [r.status for r in results] == ["cloned", "failed"]
+    assert summary["cloned"] == 1
+    assert summary["failed"] == 1
+
+    output = capsys.readouterr().out
+    assert "TEST SUMMARY" in output
+    assert "By Category:" in output
+    assert "  - b: boom" in output
@@ -0,0 +1,417 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import subprocess
+
+import pytest
+
+from cloners.github_cloner import GitHubCloner, RepoInfo
+
+
+def make_result(url: str, category: str, priority: str, status: str = "cloned") -> RepoInfo:
+    name = url.rstrip("/").rsplit("/", 1)[-1]
+    return RepoInfo(
+        name=name,
+        url=url,
+        local_path=None,
+        category=category,
+        priority=priority,
+        status=status,
+    )
+
+
+def test_clone_many_preserves_submission_order(temp_dir, monkeypatch):
+    cloner = GitHubCloner(output_dir=temp_dir)
+    delays = {"slow": 0.05, "fast": 0.0, "mid": 0.02}
+
+    async def fake_clone(url, category="general", priority="medium", exists=None):
+        await asyncio.sleep(delays[url.rsplit("/", 1)[-1]])
+        return make_result(url, category, priority)
+
+    monkeypatch.setattr(cloner, "clone_repo_async", fake_clone)
+    repos = [
+        ("https://github.com/org/slow", "audit_repos", "high"),
+        ("https://github.com/org/fast", "educational", "low"),
+        ("https://github.com/org/mid", "aggregators", "medium"),
+    ]
+
+    results = cloner.clone_many(repos, max_workers=3)
+
+    assert [r.name for r in results] == ["slow", "fast", "mid"]
+    assert [r.category for r in results] == ["audit_repos", "educational", "aggregators"]
+
+
+def test_clone_many_logs_progress_for_large_batches(temp_dir, monkeypatch):
+    from utils.logger import log
+
+    cloner = GitHubCloner(output_dir=temp_dir)
+    monkeypatch.setattr(GitHubCloner, "PROGRESS_THRESHOLD", 2)
+
+    async def fake_clone(url, category="general", priority="medium", exists=None):
+        return make_result(url, category, priority)
+
+    monkeypatch.setattr(cloner, "clone_repo_async", fake_clone)
+    messages = []
+    sink_id = log.add(lambda m: messages.append(m.record["message"]), level="INFO")
+    try:
+        cloner.clone_many([(f"https://github.com/org/r{i}", "audit_repos", "high") for i in range(3)])
+    finally:
+        log.remove(sink_id)
+
+    assert not any(m.startswith("✓") for m in messages)
+    assert messages[-1] == "Progress: 3/3 repositories (0 failed)"
+
+
+def test_clone_many_checks_existing_clones_with_one_scan(temp_dir, monkeypatch):
+    (temp_dir / "audit_repos" / "present").mkdir(parents=True)
+    (temp_dir / "audit_repos" / "stray-file").write_text("")
+    cloner = GitHubCloner(output_dir=temp_dir)
+    seen = {}
+
+    async def fake_clone(url, category="general", priority="medium", exists=None):
+        seen[url.rsplit("/", 1)[-1]] = exists
+        return make_result(url, category, priority)
+
+    monkeypatch.setattr(cloner, "clone_repo_async", fake_clone)
+    cloner.clone_many([
+        ("https://github.com/org/present", "audit_repos", "high"),
+        ("https://github.com/org/stray-file", "audit_repos", "high"),
+        ("https://github.com/org/missing", "educational", "low"),
+    ])
+
+    assert seen == {"present": True, "stray-file": False, "missing": False}
+
+
+def test_clone_many_handles_empty_input(temp_dir):
+    cloner = GitHubCloner(output_dir=temp_dir)
+    assert cloner.clone_many([]) == []
+
+
+def test_run_git_returns_completed_process(temp_dir):
+    cloner = GitHubCloner(output_dir=temp_dir)
+
+    result = asyncio.run(cloner._run_git(["--version"], timeout=30, capture_stdout=True))
+
+    assert result.returncode == 0
+    assert result.stdout.startswith("git version")
+
+
+def test_run_git_applies_transfer_tuning(temp_dir):
+    cloner = GitHubCloner(output_dir=temp_dir)
+
+    result = asyncio.run(
+        cloner._run_git(["config", "--get", "submodule.fetchJobs"], timeout=30, capture_stdout=True)
+    )
+
+    assert result.stdout.strip() == "8"
+    assert "protocol.version=2" in result.args
+    assert "core.packedGitLimit=128m" in result.args
+    assert cloner._env["GIT_HTTP_LOW_SPEED_TIME"] == "30"
+    assert cloner._env["GIT_TERMINAL_PROMPT"] == "0"
+
+
+def test_run_git_keeps_bounded_stderr_tail(temp_dir, monkeypatch):
+    cloner = GitHubCloner(output_dir=temp_dir)
+    monkeypatch.setattr(GitHubCloner, "STDERR_TAIL_LINES", 3)
+
+    result = asyncio.run(cloner._run_git(["-C", str(temp_dir), "log"], timeout=30))
+
+    assert result.returncode != 0
+    assert result.stdout == ""
+    assert 0 < len(result.stderr.splitlines()) <= 3
+    assert "not a git repository" in result.stderr
+
+
+def test_clone_mode_selects_git_clone_flags(temp_dir, monkeypatch):
+    calls = []
+
+    async def fake_run_git(args, timeout, capture_stdout=False):
+        calls.append(args)
+        return subprocess.CompletedProcess(["git", *args], 0, "", "")
+
+    for mode, expected in [
+        ("partial", ["--filter=blob:none"]),
+        ("shallow", ["--depth", "1"]),
+        ("bare", ["--bare", "--config", "gc.auto=0"]),
+        ("full", []),
+    ]:
+        calls.clear()
+        cloner = GitHubCloner(output_dir=temp_dir / mode, clone_mode=mode)
+        monkeypatch.setattr(cloner, "_run_git", fake_run_git)
+
+        result = cloner.clone_repo("https://github.com/org/repo", category="audit_repos")
+
+        assert result.status == "cloned"
+        assert calls[0][0] == "clone"
+        assert calls[0][1:-2] == expected
+
+
+def test_unknown_clone_mode_is_rejected(temp_dir):
+    with pytest.raises(ValueError):
+        GitHubCloner(output_dir=temp_dir, clone_mode="mirror")
+
+
+def test_get_repo_info_reads_local_clone_without_api(temp_dir, monkeypatch):
+    repo_dir = temp_dir / "audit_repos" / "repo"
+    git = ["git", "-c", "user.name=test", "-c", "user.email=test@example.com"]
+    subprocess.run([*git, "init", "-q", "-b", "main", str(repo_dir)], check=True)
+    subprocess.run(
+        [*git, "-C", str(repo_dir), "commit", "-q", "--allow-empty", "-m", "init"],
+        check=True,
+    )
+    head = subprocess.run(
+        ["git", "-C", str(repo_dir), "rev-parse", "HEAD"],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.strip()
+
+    cloner = GitHubCloner(output_dir=temp_dir)
+
+    def fail_api_call(*args, **kwargs):
+        raise AssertionError("GitHub API should not be called for local clones")
+
+    monkeypatch.setattr(cloner, "_rate_limited_call", fail_api_call)
+    try:
+        first = cloner.get_repo_info("https://github.com/org/repo", category="audit_repos")
+        second = cloner.get_repo_info("https://github.com/org/repo", category="audit_repos")
+    finally:
+        cloner.close()
+
+    assert first == second
+    assert first["full_name"] == "org/repo"
+    assert first["head_sha"] == head
+    assert first["default_branch"] == "main"
+    assert "last_updated" in first
+
+
+def test_local_repo_info_of_a_worktree_is_empty_not_an_error(temp_dir):
+    main = temp_dir / "main"
+    init_upstream(main)
+    worktree = temp_dir / "worktree"
+    subprocess.run(["git", "-C", str(main), "worktree", "add", "-q", str(worktree)], check=True)
+    assert (worktree / ".git").is_file()
+
+    cloner = GitHubCloner(output_dir=temp_dir)
+    try:
+        assert cloner._local_repo_info(worktree) == {}
+    finally:
+        cloner.close()
+
+
+class FakeRequester:
+    def __init__(self):
+        self.calls = []
+
+    def requestJsonAndCheck(self, verb, url, headers=None):
+        self.calls.append((verb, url, headers))
+        if headers and headers.get("If-None-Match") == '"abc"':
+            return {"ETag": '"abc"'}, None
+        return {"ETag": '"abc"'}, {
+            "name": "repo",
+            "full_name": "org/repo",
+            "description": "test repo",
+            "stargazers_count": 3,
+            "updated_at": "2024-01-02T03:04:05Z",
+            "default_branch": "main",
+            "size": 42,
+        }
+
+
+def test_get_repo_info_revalidates_with_etag(temp_dir):
+    cache_file = temp_dir / "gh_cache.json"
+    cloner = GitHubCloner(output_dir=temp_dir, api_cache_file=cache_file)
+    requester = FakeRequester()
+    cloner.github = type("FakeGithub", (), {"requester": requester})()
+
+    first = cloner.get_repo_info("https://github.com/org/repo")
+
+    reloaded = GitHubCloner(output_dir=temp_dir, api_cache_file=cache_file)
+    reloaded.github = cloner.github
+    second = reloaded.get_repo_info("https://github.com/org/repo")
+
+    assert first == second
+    assert first["stars"] == 3
+    assert first["last_updated"] == "2024-01-02T03:04:05+00:00"
+    assert requester.calls[0][2] is None
+    assert requester.calls[1][2] == {"If-None-Match": '"abc"'}
+
+
+def test_interrupted_api_cache_save_keeps_previous_cache(temp_dir, monkeypatch):
+    cache_file = temp_dir / "gh_cache.json"
+    cloner = GitHubCloner(output_dir=temp_dir, api_cache_file=cache_file)
+    cloner.github = type("FakeGithub", (), {"requester": FakeRequester()})()
+    cloner.get_repo_info("https://github.com/org/repo")
+    saved = cache_file.read_text()
+
+    def interrupted_write(fd, payload):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "write", interrupted_write)
+    cloner._api_cache["org/other"] = {"etag": '"def"', "info": {}}
+    cloner._save_api_cache()
+    monkeypatch.undo()
+
+    assert cache_file.read_text() == saved
+    assert "org/repo" in GitHubCloner(output_dir=temp_dir, api_cache_file=cache_file)._api_cache
+
+
+def test_low_rate_limit_budget_waits_for_reset(temp_dir, monkeypatch):
+    import cloners.github_cloner as github_cloner
+
+    sleeps = []
+    monkeypatch.setattr(github_cloner.time, "time", lambda: 1000.0)
+    monkeypatch.setattr(github_cloner.time, "sleep", sleeps.append)
+    cloner = GitHubCloner(output_dir=temp_dir)
+
+    cloner._respect_rate_limit_headers({"X-RateLimit-Remaining": "500", "X-RateLimit-Reset": "1060"})
+    cloner._respect_rate_limit_headers({"X-RateLimit-Remaining": "2", "X-RateLimit-Reset": "1060"})
+
+    assert sleeps == [60.0]
+
+
+def init_upstream(path):
+    git = ["git", "-c", "user.name=test", "-c", "user.email=test@example.com"]
+    subprocess.run([*git, "init", "-q", "-b", "main", str(path)], check=True)
+    (path / "Vault.sol").write_text("contract Vault {}\n")
+    subprocess.run([*git, "-C", str(path), "add", "."], check=True)
+    subprocess.run([*git, "-C", str(path), "commit", "-q", "-m", "init"], check=True)
+
+
+def test_reference_cache_clone_is_dissociated(temp_dir):
+    upstream = temp_dir / "upstream"
+    init_upstream(upstream)
+    url = f"file://{upstream}"
+    owner, repo_name = upstream.parts[1], upstream.parts[2]
+
+    cloner = GitHubCloner(output_dir=temp_dir / "repos", reference_cache=True)
+    result = cloner.clone_repo(url, category="audit_repos")
+
+    assert result.status == "cloned", result.error
+    assert (result.local_path / "Vault.sol").exists()
+    cache_path = cloner._reference_cache_path(owner)
+    cached_refs = subprocess.run(
+        ["git", "-C", str(cache_path), "for-each-ref", "--format=%(refname)"],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.split()
+    assert f"refs/remotes/{repo_name}/main" in cached_refs
+    assert not (result.local_path / ".git" / "objects" / "info" / "alternates").exists()
+
+
+def test_status_summary_counts_by_category_and_priority(temp_dir):
+    cloner = GitHubCloner(output_dir=temp_dir)
+    results = [
+        make_result("https://github.com/org/a", "audit_repos", "high"),
+        make_result("https://github.com/org/b", "educational", "low", status="updated"),
+        make_result("https://github.com/org/c", "audit_repos", "low", status="failed"),
+    ]
+    results[2].error = "boom"
+
+    summary = cloner.get_status_summary(results)
+
+    assert summary == {
+        "total": 3,
+        "cloned": 1,
+        "updated": 1,
+        "cached": 0,
+        "failed": 1,
+        "by_category": {
+            "audit_repos": {"success": 1, "failed": 1},
+            "educational": {"success": 1, "failed": 0},
+        },
+        "by_priority": {
+            "high": {"success": 1, "failed": 0},
+            "low": {"success": 1, "failed": 1},
+        },
+        "errors": [{"repo": "c", "error": "boom"}],
+    }
+
+
+@pytest.mark.parametrize("mode", ["partial", "shallow"])
+def test_update_repo_fetches_and_resets_to_upstream(temp_dir, mode):
+    upstream = temp_dir / "upstream"
+    init_upstream(upstream)
+    url = f"file://{upstream}"
+
+    cloner = GitHubCloner(output_dir=temp_dir / "repos", clone_mode=mode)
+    cloned = cloner.clone_repo(url, category="audit_repos")
+    assert cloned.status == "cloned", cloned.error
+
+    git = ["git", "-c", "user.name=test", "-c", "user.email=test@example.com"]
+    (upstream / "Token.sol").write_text("contract Token {}\n")
+    subprocess.run([*git, "-C", str(upstream), "add", "."], check=True)
+    subprocess.run([*git, "-C", str(upstream), "commit", "-q", "-m", "add token"], check=True)
+
+    updated = cloner.update_repo(url, category="audit_repos")
+
+    assert updated.status == "updated", updated.error
+    assert (updated.local_path / "Token.sol").exists()
+
+
+def test_recently_fetched_clone_is_reported_as_cached(temp_dir):
+    upstream = temp_dir / "upstream"
+    init_upstream(upstream)
+    url = f"file://{upstream}"
+
+    cloner = GitHubCloner(output_dir=temp_dir / "repos", refresh_ttl={"high": 3600, "low": 0})
+    try:
+        cloned = cloner.clone_repo(url, category="audit_repos", priority="high")
+        cached = cloner.clone_repo(url, category="audit_repos", priority="high")
+        stale = cloner.clone_repo(url, category="audit_repos", priority="low")
+        entry = cloner.manifest.get(url)
+    finally:
+        cloner.close()
+
+    assert cloned.status == "cloned", cloned.error
+    assert cached.status == "cached"
+    assert stale.status == "updated", stale.error
+    assert entry["status"] == "updated"
+    assert len(entry["sha"]) == 40
+
+
+def test_category_policy_clones_bare_and_exports_on_demand(temp_dir):
+    upstream = temp_dir / "upstream"
+    init_upstream(upstream)
+    url = f"file://{upstream}"
+
+    cloner = GitHubCloner(
+        output_dir=temp_dir / "repos",
+        clone_policy={"vulnerability_datasets": "bare", "educational": "full"},
+    )
+    bare = cloner.clone_repo(url, category="vulnerability_datasets")
+    full = cloner.clone_repo(url, category="educational")
+
+    assert bare.status == "cloned", bare.error
+    assert bare.local_path.suffix == ".git"
+    assert (bare.local_path / "HEAD").is_file()
+    assert not (bare.local_path / "Vault.sol").exists()
+    assert (full.local_path / "Vault.sol").exists()
+
+    exported = cloner.export_worktree(bare.local_path, temp_dir / "export")
+    assert (exported / "Vault.sol").read_text() == "contract Vault {}\n"
+
+    refreshed = cloner.update_repo(url, category="vulnerability_datasets")
+    assert refreshed.status == "updated", refreshed.error
+
+
+def test_bare_clone_keeps_every_object_locally(temp_dir):
+    upstream = temp_dir / "upstream"
+    init_upstream(upstream)
+    subprocess.run(["git", "-C", str(upstream), "config", "uploadpack.allowFilter", "true"], check=True)
+    url = f"file://{upstream}"
+
+    cloner = GitHubCloner(output_dir=temp_dir / "repos", clone_mode="bare")
+    result = cloner.clone_repo(url, category="vulnerability_datasets")
+    objects = subprocess.run(
+        ["git", "-C", str(result.local_path), "rev-list", "--objects", "--missing=print", "HEAD"],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.splitlines()
+
+    assert result.status == "cloned", result.error
+    assert objects
+    assert not [line for line in objects if line.startswith("?")]
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import fnmatch
+import json
+import os
+
+import pytest
+
+from utils import helpers
+from utils.helpers import dir_size
+
+
+def test_dir_size_sums_nested_files(temp_dir):
+    (temp_dir / "data" / "train").mkdir(parents=True)
+    (temp_dir / "README.md").write_bytes(b"x" * 10)
+    (temp_dir / "data" / "a.parquet").write_bytes(b"x" * 100)
+    (temp_dir / "data" / "train" / "b.parquet").write_bytes(b"x" * 1000)
+    os.symlink(temp_dir / "data", temp_dir / "data-link")
+
+    assert dir_size(temp_dir) == 1110
+    assert dir_size(temp_dir / "data") == 1100
+
+
+def test_iter_files_skips_directories_and_symlinked_dirs(temp_dir):
+    (temp_dir / "data" / "train").mkdir(parents=True)
+    (temp_dir / "README.md").write_text("card")
+    (temp_dir / "data" / "train" / "b.parquet").write_bytes(b"x")
+    os.symlink(temp_dir / "data", temp_dir / "data-link")
+
+    names = sorted(os.path.relpath(entry.path, temp_dir) for entry in helpers.iter_files(temp_dir))
+
+    assert names == ["README.md", os.path.join("data", "train", "b.parquet")]
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_write_json_stringifies_unsupported_values(temp_dir, monkeypatch, use_orjson):
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(helpers, "orjson", None)
+    path = temp_dir / "metadata.json"
+
+    helpers.write_json(path, {"id": "org/contracts", "path": temp_dir, "tags": ["a"], "size": 3})
+
+    assert json.loads(path.read_text()) == {
+        "id": "org/contracts",
+        "path": str(temp_dir),
+        "tags": ["a"],
+        "size": 3,
+    }
+
+
+def test_compile_globs_matches_like_fnmatch():
+    patterns = ["*.parquet", "README*", "data/*.json"]
+    paths = ["data/train-0.parquet", "README.md", "data/info.json", "info.json", "train.csv"]
+
+    matcher = helpers.compile_globs(patterns)
+
+    assert [p for p in paths if matcher.match(p)] == [
+        p for p in paths if any(fnmatch.fnmatchcase(p, pattern) for pattern in patterns)
+    ]
+    assert [p for p in paths if matcher.match(p)] == ["data/train-0.parquet", "README.md", "data/info.json"]
+
+
+def test_advise_page_cache_visits_every_file(temp_dir, monkeypatch):
+    if not hasattr(os, "posix_fadvise"):
+        pytest.skip("posix_fadvise not available")
+    (temp_dir / "train").mkdir()
+    (temp_dir / "README.md").write_text("card")
+    (temp_dir / "train" / "data.arrow").write_bytes(b"x" * 10)
+    advised = []
+    real_fadvise = os.posix_fadvise
+
+    def record(fd, offset, length, advice):
+        advised.append(advice)
+        real_fadvise(fd, offset, length, advice)
+
+    monkeypatch.setattr(os, "posix_fadvise", record)
+
+    assert helpers.advise_page_cache(temp_dir, "dontneed") == 2
+    assert advised == [os.POSIX_FADV_DONTNEED] * 2
+    assert helpers.advise_page_cache(temp_dir, "none") == 0
+
+
+def test_load_sources_config_reparses_only_when_file_changes(temp_dir, monkeypatch):
+    config_path = temp_dir / "sources.yaml"
+    config_path.write_text("github_repos: {}\n")
+    parsed = []
+    real_safe_load = helpers.yaml.safe_load
+
+    def counting_safe_load(stream):
+        parsed.append(stream.name)
+        return real_safe_load(stream)
+
+    monkeypatch.setattr(helpers.yaml, "safe_load", counting_safe_load)
+
+    first = helpers.load_sources_config(config_path)
+    first["github_repos"]["mutated"] = []
+    assert helpers.load_sources_config(config_path) == {"github_repos": {}}
+    assert len(parsed) == 1
+
+    config_path.write_text("github_repos: {}\nweb_scrapers: {}\n")
+    stamp = config_path.stat().st_mtime + 10
+    os.utime(config_path, (stamp, stamp))
+    assert "web_scrapers" in helpers.load_sources_config(config_path)
+    assert len(parsed) == 2
+
+
+def test_compile_globs_reuses_compiled_pattern():
+    assert helpers.compile_globs(["*.parquet", "README*"]) is helpers.compile_globs(["*.parquet", "README*"])
+
+
+def test_completion_marker_records_file_stats(temp_dir):
+    (temp_dir / "data").mkdir()
+    (temp_dir / "data" / "train.parquet").write_bytes(b"x" * 100)
+    (temp_dir / "README.md").write_bytes(b"x" * 10)
+
+    assert helpers.read_completion_marker(temp_dir) is None
+
+    stats = helpers.write_completion_marker(temp_dir)
+    # Rewriting the marker must not count the marker itself
+    stats = helpers.write_completion_marker(temp_dir)
+
+    assert stats["file_count"] == 2
+    assert stats["total_size"] == 110
+    assert helpers.read_completion_marker(temp_dir) == stats
+
+
+def test_read_completion_marker_accepts_legacy_empty_marker(temp_dir):
+    (temp_dir / helpers.COMPLETION_MARKER).touch()
+
+    assert helpers.read_completion_marker(temp_dir) == {}
+
+
+def test_write_bytes_atomic_replaces_without_leftovers(temp_dir):
+    path = temp_dir / "marker"
+    path.write_bytes(b"old")
+
+    helpers.write_bytes_atomic(path, b"new")
+
+    assert path.read_bytes() == b"new"
+    assert sorted(p.name for p in temp_dir.iterdir()) == ["marker"]
+
+
+def test_discard_dir_frees_path_before_deleting(temp_dir):
+    target = temp_dir / "org_contracts"
+    (target / "data").mkdir(parents=True)
+    (target / "data" / "train.parquet").write_bytes(b"x" * 10)
+
+    thread = helpers.discard_dir(target)
+    target.mkdir()
+    thread.join(timeout=5)
+
+    assert target.exists() and not any(target.iterdir())
+    assert sorted(p.name for p in temp_dir.iterdir()) == ["org_contracts"]
@@ -0,0 +1,537 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from downloaders import hf_downloader
+from downloaders.hf_downloader import HuggingFaceDownloader
+
+
+DATASETS = [
+    {
+        "dataset_id": "org/contracts",
+        "description": "test contracts",
+        "priority": "high",
+        "config": None,
+        "split": None,
+    }
+]
+
+
+def test_fast_transfer_enabled_when_hf_transfer_installed(temp_dir, monkeypatch):
+    monkeypatch.delenv("HF_HUB_ENABLE_HF_TRANSFER", raising=False)
+    monkeypatch.delenv("HF_XET_HIGH_PERFORMANCE", raising=False)
+    monkeypatch.setattr(hf_downloader.importlib.util, "find_spec", lambda name: object())
+
+    HuggingFaceDownloader(output_dir=temp_dir, datasets=DATASETS)
+
+    assert os.environ["HF_HUB_ENABLE_HF_TRANSFER"] == "1"
+    assert os.environ["HF_XET_HIGH_PERFORMANCE"] == "1"
+
+
+def test_fast_transfer_respects_opt_out(temp_dir, monkeypatch):
+    monkeypatch.delenv("HF_HUB_ENABLE_HF_TRANSFER", raising=False)
+    monkeypatch.setenv("HF_XET_HIGH_PERFORMANCE", "0")
+    monkeypatch.setattr(hf_downloader.importlib.util, "find_spec", lambda name: None)
+
+    HuggingFaceDownloader(output_dir=temp_dir, datasets=DATASETS)
+    HuggingFaceDownloader(output_dir=temp_dir, datasets=DATASETS, enable_hf_transfer=False)
+
+    assert "HF_HUB_ENABLE_HF_TRANSFER" not in os.environ
+    assert os.environ["HF_XET_HIGH_PERFORMANCE"] == "0"
+
+
+def test_fast_transfer_request_dropped_when_package_missing(temp_dir, monkeypatch):
+    monkeypatch.setenv("HF_HUB_ENABLE_HF_TRANSFER", "1")
+    monkeypatch.setattr(hf_downloader.importlib.util, "find_spec", lambda name: None)
+
+    HuggingFaceDownloader(output_dir=temp_dir, datasets=DATASETS)
+
+    assert "HF_HUB_ENABLE_HF_TRANSFER" not in os.environ
+
+
+def test_download_dataset_files_uses_one_snapshot_call(temp_dir, monkeypatch):
+    calls = []
+
+    def fake_snapshot_download(repo_id, **kwargs):
+        calls.append((repo_id, kwargs))
+        local_dir = Path(kwargs["local_dir"])
+        for name in ["data/train-0.parquet", "data/train-1.parquet", ".cache/huggingface/x.lock", "notes.txt"]:
+            path = local_dir / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(b"PAR1")
+        return str(local_dir)
+
+    downloader = HuggingFaceDownloader(output_dir=temp_dir, datasets=DATASETS, download_workers=4)
+    monkeypatch.setattr(downloader, "_get_hub_library", lambda: (None, fake_snapshot_download))
+    acquired = []
+    monkeypatch.setattr(downloader.rate_limiter, "acquire", acquired.append)
+
+    dataset_dir = downloader.download_dataset_files("org/contracts", patterns=["*.parquet"], force=True)
+
+    assert acquired == ["huggingface"]
+    assert calls == [(
+        "org/contracts",
+        {
+            "repo_type": "dataset",
+            "allow_patterns": ["*.parquet"],
+            "local_dir": str(dataset_dir),
+            "max_workers": 4,
+            "force_download": True,
+            "token": downloader.token,
+        },
+    )]
+    assert (dataset_dir / "data" / "train-1.parquet").exists()
+
+    downloader.download_dataset_files("org/contracts", patterns=["*.json"], max_workers=16)
+    assert calls[-1][1]["max_workers"] == 16
+
+
+def test_get_status_prefers_size_recorded_in_metadata(temp_dir, monkeypatch):
+    downloader = HuggingFaceDownloader(output_dir=temp_dir, datasets=DATASETS)
+    monkeypatch.setattr(downloader, "get_dataset_info", lambda dataset_id: {"id": dataset_id})
+    dataset_dir = temp_dir / "org_contracts"
+    dataset_dir.mkdir()
+    (dataset_dir / "train.parquet").write_bytes(b"x" * 2048)
+    marker_file = dataset_dir / ".download_complete"
+    marker_file.touch()
+    downloader._save_metadata("org/contracts", dataset_dir, None, None)
+
+    metadata = json.loads((dataset_dir / "metadata.json").read_text())
+    assert metadata["total_bytes"] == 2048
+
+    # Served from metadata.json: new files don't show up until the next download
+    (dataset_dir / "extra.bin").write_bytes(b"x" * 1024)
+    assert downloader.get_status()["org/contracts"]["size_bytes"] == 2048
+
+    # A newer completion marker invalidates the cached size
+    stamp = (dataset_dir / "metadata.json").stat().st_mtime + 10
+    os.utime(marker_file, (stamp, stamp))
+    assert downloader.get_status()["org/contracts"]["size_bytes"] > 3072
+
+
+def test_download_dataset_raw_skips_arrow_conversion(temp_dir, monkeypatch):
+    downloader = HuggingFaceDownloader(output_dir=temp_dir, datasets=DATASETS)
+    requested = []
+
+    def fake_download_files(dataset_id, patterns=None, force=False):
+        requested.append((dataset_id, patterns, force))
+        (temp_dir / "org_contracts" / "train.parquet").write_bytes(b"PAR1")
+
+    def fail_datasets():
+        raise AssertionError("raw downloads must not load the datasets library")
+
+    monkeypatch.setattr(downloader, "download_dataset_files", fake_download_files)
+    monkeypatch.setattr(downloader, "_get_datasets_library", fail_datasets)
+    monkeypatch.setattr(downloader, "get_dataset_info", lambda dataset_id: {"id": dataset_id})
+
+    dataset_dir = downloader.download_dataset("org/contracts")
+
+    assert requested == [("org/contracts", HuggingFaceDownloader.RAW_PATTERNS, False)]
+    assert (dataset_dir / ".download_complete").exists()
+    assert json.loads((dataset_dir / "metadata.json").read_text())["total_bytes"] == 4
+
+
+def test_raw_download_without_parquet_is_not_marked_complete(temp_dir, monkeypatch):
+    downloader = HuggingFaceDownloader(output_dir=temp_dir, datasets=DATASETS)
+
+    def fake_download_files(dataset_id, patterns=None, force=False):
+        (temp_dir / "org_contracts" / "README.md").write_text("sources only")
+
+    monkeypatch.setattr(downloader, "download_dataset_files", fake_download_files)
+
+    with pytest.raises(RuntimeError, match="No parquet files"):
+        downloader.download_dataset("org/contracts")
+    assert not (temp_dir / "org_contracts" / ".download_complete").exists()
+
+
+def test_load_dataset_reads_raw_parquet_layout(temp_dir, monkeypatch):
+    downloader = HuggingFaceDownloader(output_dir=temp_dir, datasets=DATASETS)
+    data_dir = temp_dir / "org_contracts" / "data"
+    data_dir.mkdir(parents=True)
+    (data_dir / "train-00000-of-00001.parquet").write_bytes(b"PAR1")
+    loaded = []
+
+    def fail_load_from_disk(path):
+        raise AssertionError("raw parquet shards are not save_to_disk output")
+
+    fake_datasets = SimpleNamespace(
+        load_from_disk=fail_load_from_disk,
+        load_dataset=lambda path, **kwargs: loaded.append(path) or "dataset",
+    )
+    monkeypatch.setattr(downloader, "_get_datasets_library", lambda: fake_datasets)
+
+    assert downloader.load_dataset("org/contracts") == "dataset"
+    assert loaded == [str(temp_dir / "org_contracts")]
+
+
+def test_load_dataset_reads_saved_dataset(temp_dir, monkeypatch):
+    downloader = HuggingFaceDownloader(output_dir=temp_dir, datasets=DATASETS)
+    data_dir = temp_dir / "org_contracts" / "data"
+    data_dir.mkdir(parents=True)
+    (data_dir / "dataset_dict.json").write_text("{}")
+    fake_datasets = SimpleNamespace(load_from_disk=lambda path: ("saved", path))
+    monkeypatch.setattr(downloader, "_get_datasets_library", lambda: fake_datasets)
+
+    assert downloader.load_dataset("org/contracts") == ("saved", str(data_dir))
+
+
+class FakeSplit:
+    def __init__(self, rows):
+        self.rows = rows
+        self.saved = None
+
+    def __len__(self):
+        return self.rows
+
+    def save_to_disk(self, path, max_shard_size=None, num_proc=None):
+        self.saved = (path, num_proc)
+        self.max_shard_size = max_shard_size
+
+
+def test_large_splits_are_saved_with_worker_processes(temp_dir, monkeypatch):
+    monkeypatch.setattr(hf_downloader, "HF_SAVE_NUM_PROC", 4)
+    downloader = HuggingFaceDownloader(output_dir=temp_dir, datasets=DATASETS)
+    small = FakeSplit(10)
+    large = FakeSplit(HuggingFaceDownloader.PARALLEL_SAVE_MIN_ROWS)
+
+    downloader._save_to_disk(small, temp_dir / "test")
+    downloader._save_to_disk(large, temp_dir / "train")
+
+    assert small.saved == (str(temp_dir / "test"), None)
+    assert large.saved == (str(temp_dir / "train"), 4)
+
+
+def test_saved_shards_are_capped_at_configured_size(temp_dir, monkeypatch):
+    monkeypatch.setattr(hf_downloader, "HF_MAX_SHARD_SIZE", "2GB")
+    downloader = HuggingFaceDownloader(output_dir=temp_dir, datasets=DATASETS)
+    split = FakeSplit(10)
+
+    downloader._save_to_disk(split, temp_dir / "train")
+
+    assert split.max_shard_size == "2GB"
+
+
+def test_metadata_calls_share_one_api_client(temp_dir, monkeypatch):
+    created = []
+
+    class FakeHfApi:
+        def __init__(self, token=None):
+            created.append(self)
+
+        def list_repo_tree(self, repo_id, recursive=False, repo_type=None):
+            return [
+                SimpleNamespace(path="data"),
+                SimpleNamespace(path="README.md", size=12),
+                SimpleNamespace(path="data/train.parquet", size=2048),
+            ]
+
+        def dataset_info(self, repo_id):
+            return SimpleNamespace(
+                id=repo_id, author="org", sha="abc", last_modified=None, private=False,
+                downloads=1, likes=2, tags=["solidity"], card_data=None,
+            )
+
+    downloader = HuggingFaceDownloader(output_dir=temp_dir, datasets=DATASETS)
+    monkeypatch.setattr(downloader, "_get_hub_library", lambda: (FakeHfApi, None))
+
+    assert downloader.list_dataset_files("org/contracts") == ["README.md", "data/train.parquet"]
+    assert downloader.list_dataset_file_sizes("org/contracts") == {
+        "README.md": 12,
+        "data/train.parquet": 2048,
+    }
+    assert downloader.get_dataset_info("org/contracts")["sha"] == "abc"
+    downloader.get_dataset_info("org/other")
+
+    assert len(created) == 1
+
+
+def test_dataset_info_revalidates_on_hubs_without_expand(temp_dir, monkeypatch):
+    calls = []
+
+    class OldHfApi:
+        def __init__(self, token=None):
+            pass
+
+        def dataset_info(self, repo_id):
+            calls.append(repo_id)
+            return SimpleNamespace(
+                id=repo_id, author="org", sha="abc", last_modified=None, private=False,
+                downloads=1, likes=0, tags=[], card_data=None,
+            )
+
+    downloader = HuggingFaceDownloader(output_dir=temp_dir, datasets=DATASETS)
+    monkeypatch.setattr(downloader, "_get_hub_library", lambda: (OldHfApi, None))
+    first = downloader.get_dataset_info("org/contracts")
+
+    monkeypatch.setattr(hf_downloader, "HF_INFO_CACHE_TTL", 0)
+    assert downloader.get_dataset_info("org/contracts") == first
+    assert calls == ["org/contracts", "org/contracts"]
+
+
+def test_dataset_info_is_cached_and_revalidated_by_sha(temp_dir, monkeypatch):
+    calls = []
+    current_sha = {"value": "abc"}
+
+    class FakeHfApi:
+        def __init__(self, token=None):
+            pass
+
+        def dataset_info(self, repo_id, expand=None):
+            calls.append(expand)
+            return SimpleNamespace(
+                id=repo_id, author="org", sha=current_sha["value"], last_modified=None,
+                private=False, downloads=len(calls), likes=0, tags=[], card_data=None,
+            )
+
+    downloader = HuggingFaceDownloader(output_dir=temp_dir, datasets=DATASETS)
+    monkeypatch.setattr(downloader, "_get_hub_library", lambda: (FakeHfApi, None))
+
+    first = downloader.get_dataset_info("org/contracts")
+    assert downloader.get_dataset_info("org/contracts") == first
+    assert calls == [None]
+
+    # Expired entry with an unchanged sha only costs a sha-only request
+    monkeypatch.setattr(hf_downloader, "HF_INFO_CACHE_TTL", 0)
+    assert downloader.get_dataset_info("org/contracts") == first
+    assert calls == [None, ["sha"]]
+
+    current_sha["value"] = "def"
+    refreshed = downloader.get_dataset_info("org/contracts")
+    assert refreshed["sha"] == "def"
+    assert calls == [None, ["sha"], ["sha"], None]
+
+
+    # Invalidation forces a full fetch even within the TTL
+    monkeypatch.setattr(hf_downloader, "HF_INFO_CACHE_TTL", 3600)
+    downloader.invalidate_info_cache("org/contracts")
+    downloader.get_dataset_info("org/contracts")
+    assert calls[-1] is None and len(calls) == 5
+    downloader.invalidate_info_cache()
+    assert not downloader.info_cache_dir.exists()
+
+
+def test_dataset_dict_splits_are_saved_concurrently(temp_dir, monkeypatch):
+    barrier = threading.Barrier(2, timeout=5)
+
+    class BlockingSplit(FakeSplit):
+        def save_to_disk(self, path, max_shard_size=None, num_proc=None):
+            # Both splits must be writing at the same time to get past the barrier
+            barrier.wait()
+            super().save_to_disk(path, max_shard_size, num_proc)
+
+    class FakeDatasetDict(dict):
+        pass
+
+    large = HuggingFaceDownloader.PARALLEL_SAVE_MIN_ROWS
+    splits = FakeDatasetDict(train=BlockingSplit(large), test=BlockingSplit(2))
+    fake_datasets = SimpleNamespace(
+        DatasetDict=FakeDatasetDict,
+        load_dataset=lambda *args, **kwargs: splits,
+    )
+    monkeypatch.setattr(hf_downloader, "HF_SAVE_NUM_PROC", 4)
+    downloader = HuggingFaceDownloader(output_dir=temp_dir, datasets=DATASETS)
+    monkeypatch.setattr(downloader, "_get_datasets_library", lambda: fake_datasets)
+    monkeypatch.setattr(downloader, "get_dataset_info", lambda dataset_id: {"id": dataset_id})
+
+    dataset_dir = downloader.download_dataset("org/contracts", config="default", raw=False)
+
+    # Two splits share the 4-process budget
+    assert splits["train"].saved == (str(dataset_dir / "train"), 2)
+    assert splits["test"].saved == (str(dataset_dir / "test"), None)
+    assert (dataset_dir / ".download_complete").exists()
+
+
+class FakeIterableSplit:
+    features = None
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    def iter(self, batch_size):
+        for start in range(0, len(self.rows), batch_size):
+            chunk = self.rows[start:start + batch_size]
+            yield {key: [row[key] for row in chunk] for key in chunk[0]}
+
+
+def test_split_selection_is_streamed_to_parquet(temp_dir, monkeypatch):
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    class FakeIterableDatasetDict(dict):
+        pass
+
+    rows = [{"address": f"0x{i:040x}", "source": f"contract C{i} {{}}"} for i in range(5)]
+    requested = {}
+
+    def fake_load_dataset(dataset_id, **kwargs):
+        requested.update(kwargs)
+        return FakeIterableSplit(rows)
+
+    fake_datasets = SimpleNamespace(
+        IterableDatasetDict=FakeIterableDatasetDict,
+        load_dataset=fake_load_dataset,
+    )
+    downloader = HuggingFaceDownloader(output_dir=temp_dir, datasets=DATASETS)
+    monkeypatch.setattr(HuggingFaceDownloader, "STREAM_BATCH_SIZE", 2)
+    monkeypatch.setattr(downloader, "_get_datasets_library", lambda: fake_datasets)
+    monkeypatch.setattr(downloader, "get_dataset_info", lambda dataset_id: {"id": dataset_id})
+
+    dataset_dir = downloader.download_dataset("org/contracts", split="train")
+
+    assert requested["streaming"] is True
+    table = pq.read_table(dataset_dir / "train.parquet")
+    assert table.to_pylist() == rows
+    assert not (dataset_dir / "train.parquet.partial").exists()
+    assert (dataset_dir / ".download_complete").exists()
+
+
+def test_safe_name_flattens_and_caches_dataset_ids():
+    HuggingFaceDownloader._safe_name.cache_clear()
+
+    assert HuggingFaceDownloader._safe_name("org/contracts") == "org_contracts"
+    assert HuggingFaceDownloader._safe_name("org/contracts") == "org_contracts"
+    assert HuggingFaceDownloader._safe_name.cache_info().hits == 1
+
+
+def test_finished_download_records_size_in_marker(temp_dir, monkeypatch):
+    downloader = HuggingFaceDownloader(output_dir=temp_dir, datasets=DATASETS)
+    monkeypatch.setattr(downloader, "get_dataset_info", lambda dataset_id: {"id": dataset_id})
+    dataset_dir = temp_dir / "org_contracts"
+    dataset_dir.mkdir()
+    (dataset_dir / "train.parquet").write_bytes(b"x" * 512)
+
+    downloader._finish_download("org/contracts", dataset_dir, None, None)
+
+    marker = json.loads((dataset_dir / ".download_complete").read_text())
+    assert marker["total_size"] == 512
+    assert json.loads((dataset_dir / "metadata.json").read_text())["total_bytes"] == 512
+
+    monkeypatch.setattr(hf_downloader, "dir_size", lambda directory: 0)
+    monkeypatch.setattr(downloader, "_cached_size", lambda *args: 0)
+    assert downloader.get_status()["org/contracts"]["size_bytes"] == 512
+
+
+def test_get_status_skips_incomplete_downloads(temp_dir):
+    downloader = HuggingFaceDownloader(output_dir=temp_dir, datasets=DATASETS)
+    dataset_dir = temp_dir / "org_contracts"
+    dataset_dir.mkdir()
+    (dataset_dir / "partial.parquet").write_bytes(b"x" * 10)
+
+    status = downloader.get_status()["org/contracts"]
+
+    assert status["downloaded"] is False
+    assert status["path"] is None
+    assert "size_bytes" not in status
+
+
+def test_download_dataset_returns_early_without_creating_directories(temp_dir, monkeypatch):
+    downloader = HuggingFaceDownloader(output_dir=temp_dir, datasets=DATASETS)
+    dataset_dir = temp_dir / "org_contracts"
+    dataset_dir.mkdir()
+    (dataset_dir / ".download_complete").touch()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("download path should not be reached")
+
+    monkeypatch.setattr(hf_downloader, "ensure_dir", fail)
+    monkeypatch.setattr(downloader, "_download_raw", fail)
+
+    assert downloader.download_dataset("org/contracts") == dataset_dir
+
+
+def test_download_all_defaults_runs_datasets_concurrently(temp_dir, monkeypatch):
+    datasets = [
+        {**DATASETS[0], "dataset_id": dataset_id}
+        for dataset_id in ("org/first", "org/broken", "org/second")
+    ]
+    downloader = HuggingFaceDownloader(output_dir=temp_dir, datasets=datasets)
+    barrier = threading.Barrier(3, timeout=5)
+
+    def fake_download(dataset_id, config=None, split=None, force=False):
+        # All three downloads must be in flight together to get past the barrier
+        barrier.wait()
+        if dataset_id == "org/broken":
+            raise RuntimeError("boom")
+        return temp_dir / dataset_id
+
+    monkeypatch.setattr(downloader, "download_dataset", fake_download)
+
+    results = downloader.download_all_defaults()
+
+    assert list(results) == ["org/first", "org/broken", "org/second"]
+    assert results["org/first"] == temp_dir / "org/first"
+    assert results["org/broken"] is None
+
+
+def test_symlinks_flag_probe_is_shared_across_instances(temp_dir, monkeypatch):
+    calls = []
+
+    def fake_run(cmd, **kwargs):
+        calls.append(cmd)
+        return SimpleNamespace(stdout="  --local-dir-use-symlinks  ...", stderr="")
+
+    hf_downloader._probe_symlinks_flag.cache_clear()
+    monkeypatch.setattr(hf_downloader.subprocess, "run", fake_run)
+    first = HuggingFaceDownloader(output_dir=temp_dir, datasets=DATASETS)
+    second = HuggingFaceDownloader(output_dir=temp_dir, datasets=DATASETS)
+    first.hf_cli = second.hf_cli = "/usr/bin/hf"
+
+    assert first._cli_supports_local_dir_use_symlinks()
+    assert second._cli_supports_local_dir_use_symlinks()
+    assert calls == [["/usr/bin/hf", "download", "--help"]]
+    hf_downloader._probe_symlinks_flag.cache_clear()
+
+
+def test_cli_download_uses_configured_workers(temp_dir, monkeypatch):
+    commands = []
+    downloader = HuggingFaceDownloader(output_dir=temp_dir, datasets=DATASETS, download_workers=12)
+    monkeypatch.setattr(downloader, "_cli_supports_local_dir_use_symlinks", lambda: False)
+    monkeypatch.setattr(downloader, "_run_hf", lambda cmd, **kwargs: commands.append(cmd))
+    monkeypatch.setattr(downloader, "get_dataset_info", lambda dataset_id: {"id": dataset_id})
+
+    dataset_dir = temp_dir / "org_contracts"
+    dataset_dir.mkdir()
+
+    downloader._download_via_cli("org/contracts", dataset_dir, None, None)
+
+    assert commands[0][commands[0].index("--max-workers") + 1] == "12"
+
+
+def test_cli_lookup_happens_once_per_process(temp_dir, monkeypatch):
+    lookups = []
+
+    def fake_which(name):
+        lookups.append(name)
+        return "/usr/bin/hf" if name == "hf" else None
+
+    hf_downloader._locate_hf_cli.cache_clear()
+    monkeypatch.setattr(hf_downloader.shutil, "which", fake_which)
+
+    first = HuggingFaceDownloader(output_dir=temp_dir, datasets=DATASETS)
+    second = HuggingFaceDownloader(output_dir=temp_dir, datasets=DATASETS)
+
+    assert first.hf_cli == second.hf_cli == "/usr/bin/hf"
+    assert lookups == ["hf"]
+    hf_downloader._locate_hf_cli.cache_clear()
+
+
+def test_run_hf_inherits_environment_unless_it_needs_changes(temp_dir, monkeypatch):
+    envs = []
+    downloader = HuggingFaceDownloader(output_dir=temp_dir, datasets=DATASETS, token="hf_test")
+    downloader.hf_cli = "/usr/bin/hf"
+    monkeypatch.setenv("HF_TOKEN", "hf_test")
+    monkeypatch.setenv("HUGGINGFACE_HUB_TOKEN", "hf_test")
+    monkeypatch.setattr(hf_downloader.subprocess, "run", lambda cmd, **kwargs: envs.append(kwargs["env"]))
+
+    downloader._run_hf(["version"])
+    downloader._run_hf(["download"], extra_env={"HF_HUB_DISABLE_SYMLINKS": "1"})
+
+    assert envs[0] is None
+    assert envs[1]["HF_HUB_DISABLE_SYMLINKS"] == "1"
+    assert envs[1]["HF_TOKEN"] == "hf_test"
+    assert "HF_HUB_DISABLE_SYMLINKS" not in os.environ
@@ -0,0 +1,363 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+import zipfile
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from downloaders import kaggle_downloader
+from downloaders.kaggle_downloader import KaggleDownloader
+
+
+DATASETS = [
+    {
+        "dataset_id": "owner/vulns",
+        "description": "test vulnerabilities",
+        "priority": "high",
+    }
+]
+
+
+def write_zip(path, members: dict[str, bytes]) -> None:
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        for name, data in members.items():
+            zf.writestr(name, data)
+
+
+def test_download_dataset_extracts_archives_itself(temp_dir, monkeypatch):
+    downloader = KaggleDownloader(output_dir=temp_dir, datasets=DATASETS)
+    commands = []
+
+    def fake_run(args, capture_output=True):
+        commands.append(args)
+        dataset_dir = temp_dir / "owner_vulns"
+        write_zip(dataset_dir / "vulns.zip", {
+            "contracts/a.sol": b"contract A {}",
+            "labels.json": b"[]",
+            "../escape.txt": b"nope",
+        })
+
+    monkeypatch.setattr(downloader, "_run_kaggle", fake_run)
+
+    dataset_dir = downloader.download_dataset("owner/vulns")
+
+    assert "--unzip" not in commands[0]
+    assert (dataset_dir / "contracts" / "a.sol").read_bytes() == b"contract A {}"
+    assert (dataset_dir / "labels.json").exists()
+    assert not (temp_dir / "escape.txt").exists()
+    assert not (dataset_dir / "vulns.zip").exists()
+    assert (dataset_dir / ".download_complete").exists()
+    metadata = json.loads((dataset_dir / "metadata.json").read_text())
+    assert metadata["file_count"] == 2
+    marker = json.loads((dataset_dir / ".download_complete").read_text())
+    assert marker["file_count"] == 2
+    assert marker["total_size"] == metadata["total_size"]
+    # Metadata is written before the marker, so a marker always implies it
+    assert (dataset_dir / "metadata.json").stat().st_mtime_ns <= (dataset_dir / ".download_complete").stat().st_mtime_ns
+
+
+class FakeKaggleApi:
+    def __init__(self):
+        self.calls = []
+
+    def dataset_download_files(self, dataset_id, path, unzip, quiet):
+        self.calls.append((dataset_id, path, unzip))
+        write_zip(Path(path) / "vulns.zip", {"a.sol": b"contract A {}"})
+
+    def dataset_list(self, search):
+        self.calls.append(("list", search))
+        return [
+            SimpleNamespace(
+                ref="owner/vulns",
+                title="Vulns",
+                totalBytes=1024,
+                lastUpdated="2024-01-01",
+                downloadCount=7,
+            )
+        ]
+
+
+def test_download_dataset_uses_api_in_process(temp_dir, monkeypatch):
+    downloader = KaggleDownloader(output_dir=temp_dir, datasets=DATASETS)
+    api = FakeKaggleApi()
+    downloader.api = api
+
+    def fail(args, capture_output=True):
+        raise AssertionError("the CLI should not run when the API is available")
+
+    monkeypatch.setattr(downloader, "_run_kaggle", fail)
+
+    dataset_dir = downloader.download_dataset("owner/vulns")
+    datasets = downloader.list_datasets("vulns")
+
+    assert api.calls[0] == ("owner/vulns", str(dataset_dir), False)
+    assert (dataset_dir / "a.sol").read_bytes() == b"contract A {}"
+    assert not (dataset_dir / "vulns.zip").exists()
+    assert datasets == [{
+        "id": "owner/vulns",
+        "title": "Vulns",
+        "size": 1024,
+        "last_updated": "2024-01-01",
+        "download_count": 7,
+    }]
+
+
+def test_download_dataset_builds_metadata_from_extraction(temp_dir, monkeypatch):
+    downloader = KaggleDownloader(output_dir=temp_dir, datasets=DATASETS)
+    downloader.api = FakeKaggleApi()
+
+    def fail(dataset_dir):
+        raise AssertionError("a freshly extracted dataset should not be walked again")
+
+    monkeypatch.setattr(kaggle_downloader, "_list_files", fail)
+
+    dataset_dir = downloader.download_dataset("owner/vulns")
+
+    metadata = json.loads((dataset_dir / "metadata.json").read_text())
+    assert metadata["files"] == [{"name": "a.sol", "size": len(b"contract A {}")}]
+    assert kaggle_downloader.read_completion_marker(dataset_dir)["file_count"] == 1
+
+
+def fake_cli(temp_dir, script: str) -> str:
+    path = temp_dir / "kaggle"
+    path.write_text("#!/bin/sh\n" + script)
+    path.chmod(0o755)
+    return str(path)
+
+
+def test_list_datasets_streams_cli_rows(temp_dir):
+    downloader = KaggleDownloader(output_dir=temp_dir, datasets=DATASETS)
+    downloader.api = None
+    downloader.kaggle_cli = fake_cli(temp_dir, """
+echo "ref                 title   size"
+echo "------------------  ------  ----"
+echo "owner/one           One     1MB"
+echo "owner/two           Two     2MB"
+echo "owner/three         Three   3MB"
+""")
+
+    assert [d["id"] for d in downloader.list_datasets("x")] == ["owner/one", "owner/two", "owner/three"]
+    assert [d["id"] for d in downloader.list_datasets("x", max_results=1)] == ["owner/one"]
+
+
+def test_list_datasets_cli_failure_keeps_stderr(temp_dir):
+    downloader = KaggleDownloader(output_dir=temp_dir, datasets=DATASETS)
+    downloader.api = None
+    downloader.kaggle_cli = fake_cli(temp_dir, 'echo "429 - Too Many Requests" >&2\nexit 1\n')
+
+    with pytest.raises(RuntimeError) as excinfo:
+        downloader.list_datasets("x")
+
+    assert "Too Many Requests" in excinfo.value.__cause__.stderr
+
+
+def test_list_datasets_survives_stderr_larger_than_a_pipe_buffer(temp_dir):
+    downloader = KaggleDownloader(output_dir=temp_dir, datasets=DATASETS)
+    downloader.api = None
+    # Written before any stdout; a stderr pipe read only at EOF would deadlock here
+    downloader.kaggle_cli = fake_cli(temp_dir, """
+head -c 262144 /dev/zero | tr '\\0' 'w' >&2
+echo "ref                 title   size"
+echo "------------------  ------  ----"
+echo "owner/one           One     1MB"
+""")
+
+    assert [d["id"] for d in downloader.list_datasets("x")] == ["owner/one"]
+
+
+def test_extract_members_uses_large_reads(temp_dir, monkeypatch):
+    zip_path = temp_dir / "data.zip"
+    write_zip(zip_path, {"data.json": b"x" * 10})
+    lengths = []
+    real_copy = kaggle_downloader.shutil.copyfileobj
+
+    def record(src, dst, length=0):
+        lengths.append(length)
+        real_copy(src, dst, length)
+
+    monkeypatch.setattr(kaggle_downloader.shutil, "copyfileobj", record)
+
+    assert kaggle_downloader._extract_members(zip_path, ["data.json"], temp_dir / "out") == [("data.json", 10)]
+    assert lengths == [kaggle_downloader.EXTRACT_BUFFER_SIZE]
+
+
+@pytest.mark.skipif(not hasattr(os, "copy_file_range"), reason="needs os.copy_file_range")
+def test_extract_members_copies_stored_members_in_kernel(temp_dir, monkeypatch):
+    zip_path = temp_dir / "data.zip"
+    members = {"stored/a.sol": b"contract A {}" * 100, "b.sol": b""}
+    with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_STORED) as zf:
+        for name, data in members.items():
+            zf.writestr(name, data)
+    copies = []
+    real_copy = os.copy_file_range
+
+    def record(src, dst, count, offset_src=None, offset_dst=None):
+        copies.append(count)
+        return real_copy(src, dst, count, offset_src, offset_dst)
+
+    monkeypatch.setattr(kaggle_downloader.os, "copy_file_range", record)
+
+    out_dir = temp_dir / "out"
+    assert len(kaggle_downloader._extract_members(zip_path, list(members), out_dir)) == 2
+    for name, data in members.items():
+        assert (out_dir / name).read_bytes() == data
+    assert copies == [len(members["stored/a.sol"])]
+
+
+def test_large_archives_are_extracted_by_worker_processes(temp_dir, monkeypatch):
+    monkeypatch.setattr(kaggle_downloader, "KAGGLE_EXTRACT_WORKERS", 2)
+    monkeypatch.setattr(KaggleDownloader, "PARALLEL_EXTRACT_MIN_MEMBERS", 2)
+    downloader = KaggleDownloader(output_dir=temp_dir, datasets=DATASETS)
+    dataset_dir = temp_dir / "owner_vulns"
+    dataset_dir.mkdir()
+    members = {f"contracts/c{i}.sol": f"contract C{i} {{}}".encode() for i in range(5)}
+    write_zip(dataset_dir / "vulns.zip", members)
+
+    extracted = downloader._extract_archives(dataset_dir)
+    assert extracted == {name: len(data) for name, data in members.items()}
+    for name, data in members.items():
+        assert (dataset_dir / name).read_bytes() == data
+    assert not (dataset_dir / "vulns.zip").exists()
+
+
+def test_archives_with_few_large_members_are_extracted_in_parallel(temp_dir, monkeypatch):
+    monkeypatch.setattr(kaggle_downloader, "KAGGLE_EXTRACT_WORKERS", 2)
+    monkeypatch.setattr(KaggleDownloader, "PARALLEL_EXTRACT_MIN_MEMBERS", 1000)
+    monkeypatch.setattr(KaggleDownloader, "PARALLEL_EXTRACT_MIN_BYTES", 1000)
+    pools = []
+
+    class RecordingPool(kaggle_downloader.ProcessPoolExecutor):
+        def __init__(self, max_workers):
+            pools.append(max_workers)
+            super().__init__(max_workers=max_workers)
+
+    monkeypatch.setattr(kaggle_downloader, "ProcessPoolExecutor", RecordingPool)
+    downloader = KaggleDownloader(output_dir=temp_dir, datasets=DATASETS)
+    dataset_dir = temp_dir / "owner_vulns"
+    dataset_dir.mkdir()
+    members = {"big.csv": b"a" * 800, "bigger.csv": b"b" * 900}
+    write_zip(dataset_dir / "vulns.zip", members)
+
+    assert downloader._extract_archives(dataset_dir) == {"big.csv": 800, "bigger.csv": 900}
+    assert pools == [2]
+
+
+def test_download_all_defaults_runs_datasets_concurrently(temp_dir, monkeypatch):
+    datasets = [{**DATASETS[0], "dataset_id": f"owner/set-{i}"} for i in range(3)]
+    downloader = KaggleDownloader(output_dir=temp_dir, datasets=datasets)
+    barrier = threading.Barrier(3, timeout=5)
+
+    def fake_download(dataset_id, force=False):
+        # All three downloads must be in flight together to get past the barrier
+        barrier.wait()
+        if dataset_id == "owner/set-1":
+            raise RuntimeError("boom")
+        return temp_dir / dataset_id
+
+    monkeypatch.setattr(downloader, "download_dataset", fake_download)
+
+    results = downloader.download_all_defaults()
+
+    assert list(results) == ["owner/set-0", "owner/set-1", "owner/set-2"]
+    assert results["owner/set-1"] is None
+    assert results["owner/set-2"] == temp_dir / "owner/set-2"
+
+
+def test_get_status_reads_file_count_from_marker(temp_dir, monkeypatch):
+    downloader = KaggleDownloader(output_dir=temp_dir, datasets=DATASETS)
+    dataset_dir = temp_dir / "owner_vulns"
+    dataset_dir.mkdir()
+    (dataset_dir / "a.sol").write_text("contract A {}")
+    (dataset_dir / "b.sol").write_text("contract B {}")
+    kaggle_downloader.write_completion_marker(dataset_dir)
+
+    def fail(directory):
+        raise AssertionError("status should not walk a completed download")
+
+    monkeypatch.setattr(kaggle_downloader, "dataset_file_stats", fail)
+
+    status = downloader.get_status()["owner/vulns"]
+
+    assert status["downloaded"] is True
+    assert status["file_count"] == 2
+
+
+def test_get_status_skips_missing_datasets_without_reading_markers(temp_dir, monkeypatch):
+    downloader = KaggleDownloader(output_dir=temp_dir, datasets=DATASETS)
+    reads = []
+    monkeypatch.setattr(kaggle_downloader, "read_completion_marker", reads.append)
+
+    status = downloader.get_status()["owner/vulns"]
+
+    assert reads == []
+    assert status["downloaded"] is False
+    assert status["path"] is None
+    assert "file_count" not in status
+
+
+def test_get_dataset_info_skips_bookkeeping_files(temp_dir):
+    downloader = KaggleDownloader(output_dir=temp_dir, datasets=DATASETS)
+    dataset_dir = temp_dir / "owner_vulns"
+    (dataset_dir / "nested").mkdir(parents=True)
+    (dataset_dir / "a.sol").write_text("contract A {}")
+    (dataset_dir / "nested" / "metadata.json").write_text("{}")
+    (dataset_dir / "metadata.json").write_text("{}")
+    kaggle_downloader.write_completion_marker(dataset_dir)
+
+    info = downloader.get_dataset_info("owner/vulns")
+
+    assert sorted(f["name"] for f in info["files"]) == ["a.sol", "nested/metadata.json"]
+    assert info["file_count"] == 2
+    assert kaggle_downloader.read_completion_marker(dataset_dir)["file_count"] == 2
+
+
+def test_get_dataset_info_caches_completed_listing(temp_dir, monkeypatch):
+    downloader = KaggleDownloader(output_dir=temp_dir, datasets=DATASETS)
+    dataset_dir = temp_dir / "owner_vulns"
+    dataset_dir.mkdir()
+    (dataset_dir / "a.sol").write_text("contract A {}")
+    kaggle_downloader.write_completion_marker(dataset_dir)
+    kaggle_downloader._list_completed_files.cache_clear()
+
+    first = downloader.get_dataset_info("owner/vulns")
+    monkeypatch.setattr(kaggle_downloader, "iter_dataset_files", lambda directory: iter(()))
+    second = downloader.get_dataset_info("owner/vulns")
+
+    assert second == first
+    assert second["file_count"] == 1
+
+    # Rewriting the marker (a new download) invalidates the cached listing
+    marker = dataset_dir / kaggle_downloader.COMPLETION_MARKER
+    stat = marker.stat()
+    os.utime(marker, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+    assert downloader.get_dataset_info("owner/vulns")["file_count"] == 0
+
+
+def test_download_all_defaults_honours_max_workers(temp_dir, monkeypatch):
+    datasets = [{**DATASETS[0], "dataset_id": f"owner/set-{i}"} for i in range(3)]
+    downloader = KaggleDownloader(output_dir=temp_dir, datasets=datasets)
+    lock = threading.Lock()
+    active = []
+    peak = []
+
+    def fake_download(dataset_id, force=False):
+        with lock:
+            active.append(dataset_id)
+            peak.append(len(active))
+        time.sleep(0.05)
+        with lock:
+            active.remove(dataset_id)
+        return temp_dir / dataset_id
+
+    monkeypatch.setattr(downloader, "download_dataset", fake_download)
+
+    results = downloader.download_all_defaults(max_workers=1)
+
+    assert max(peak) == 1
+    assert all(path is not None for path in results.values())
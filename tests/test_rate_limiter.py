@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import asyncio
+import subprocess
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from utils.rate_limiter import (
+    AsyncRateLimiter,
+    RateLimitConfig,
+    RateLimiter,
+    exhausted_budget_wait,
+    too_many_requests,
+)
+
+
+def test_acquire_reserves_slots_atomically_across_threads():
+    limiter = RateLimiter(configs={"test": RateLimitConfig(calls=5, period=60)})
+    barrier = threading.Barrier(5)
+
+    def worker():
+        barrier.wait()
+        limiter.acquire("test")
+
+    threads = [threading.Thread(target=worker) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats = limiter.get_stats("test")
+    assert stats["calls_made"] == 5
+    assert stats["calls_remaining"] == 0
+    assert not limiter.can_proceed("test")
+
+
+def test_limit_does_not_serialize_concurrent_calls():
+    limiter = RateLimiter(configs={"test": RateLimitConfig(calls=3, period=60)})
+    # Every worker must be inside limit() at once to get past the barrier
+    barrier = threading.Barrier(3, timeout=5)
+    errors = []
+
+    def worker():
+        try:
+            with limiter.limit("test"):
+                barrier.wait()
+        except threading.BrokenBarrierError as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=worker) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert limiter.get_stats("test")["calls_made"] == 3
+
+
+def test_try_acquire_reports_wait_when_exhausted():
+    limiter = RateLimiter(configs={"test": RateLimitConfig(calls=1, period=60)})
+
+    assert limiter.try_acquire("test") == 0.0
+    assert 0.0 < limiter.try_acquire("test") <= 60
+    assert limiter.get_stats("test")["calls_made"] == 1
+
+
+def test_async_limit_allows_concurrent_bodies():
+    limiter = AsyncRateLimiter(configs={"test": RateLimitConfig(calls=2, period=60)})
+
+    async def main():
+        barrier = asyncio.Barrier(2)
+
+        async def call():
+            async with limiter.limit("test"):
+                await asyncio.wait_for(barrier.wait(), timeout=5)
+
+        await asyncio.gather(call(), call())
+
+    asyncio.run(main())
+
+    assert not limiter._sync_limiter.can_proceed("test")
+
+
+class HTTPError(Exception):
+    def __init__(self, status_code, headers=None):
+        super().__init__(f"HTTP {status_code}")
+        self.response = SimpleNamespace(status_code=status_code, headers=headers or {})
+
+
+def test_too_many_requests_reads_retry_after():
+    cli_error = subprocess.CalledProcessError(1, ["kaggle"], stderr="429 - Too Many Requests")
+    try:
+        raise RuntimeError("Kaggle CLI command failed") from cli_error
+    except RuntimeError as exc:
+        wrapped = exc
+
+    assert too_many_requests(HTTPError(429, {"Retry-After": "7"})) == 7.0
+    assert too_many_requests(HTTPError(429)) == 0.0
+    assert too_many_requests(HTTPError(500)) is None
+    assert too_many_requests(wrapped) == 0.0
+    assert too_many_requests(ValueError("nope")) is None
+    assert too_many_requests(HTTPError(503, {"Retry-After": "5"})) == 5.0
+    assert too_many_requests(HTTPError(503)) is None
+
+
+def test_exhausted_budget_wait_reads_rate_limit_headers():
+    assert exhausted_budget_wait({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "20"}) == 20.0
+    reset_at = str(int(time.time()) + 60)
+    assert 58 < exhausted_budget_wait({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": reset_at}) <= 60
+    assert exhausted_budget_wait({"X-RateLimit-Remaining": "3", "X-RateLimit-Reset": "20"}) is None
+    assert exhausted_budget_wait({"X-RateLimit-Remaining": "0"}) is None
+    assert exhausted_budget_wait({}) is None
+
+
+def test_scoped_services_share_a_limit_but_not_a_budget():
+    limiter = RateLimiter(configs={"web": RateLimitConfig(calls=2, period=60)})
+
+    for _ in range(2):
+        limiter.acquire("web:a.example")
+    limiter.back_off("web:a.example", 30)
+
+    assert limiter.get_stats("web:a.example")["max_calls"] == 2
+    assert limiter.try_acquire("web:a.example") > 0
+    assert limiter.try_acquire("web:b.example") == 0.0
+
+
+def test_limit_backs_off_after_429():
+    limiter = RateLimiter(configs={"test": RateLimitConfig(calls=10, period=60)})
+
+    with pytest.raises(HTTPError):
+        with limiter.limit("test"):
+            raise HTTPError(429, {"Retry-After": "30"})
+
+    # Slots are free, but the service asked callers to hold off
+    assert limiter.get_stats("test")["calls_remaining"] == 9
+    assert 29 < limiter.try_acquire("test") <= 30
+    assert limiter.get_stats("test")["calls_made"] == 1
+
+
+def test_back_off_defaults_to_one_call_interval():
+    limiter = RateLimiter(configs={"test": RateLimitConfig(calls=5, period=60)})
+
+    assert limiter.back_off("test") == 12.0
+    assert 11 < limiter.try_acquire("test") <= 12
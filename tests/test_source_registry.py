@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import yaml
+
+from sources.source_registry import SourceRegistry
+from sources.source_types import Priority
+
+
+def make_registry(temp_dir, config: dict) -> SourceRegistry:
+    config_path = temp_dir / "sources.yaml"
+    config_path.write_text(yaml.safe_dump(config, sort_keys=False))
+    return SourceRegistry(config_path)
+
+
+def test_iter_github_sources_filters_categories_and_priority(temp_dir, sample_sources_config):
+    sample_sources_config["github_repos"]["other_repos"] = [
+        {"name": "Other High", "url": "https://github.com/org/high", "priority": "high"},
+        {"name": "Other Low", "url": "https://github.com/org/low", "priority": "low"},
+    ]
+    registry = make_registry(temp_dir, sample_sources_config)
+
+    all_sources = list(registry.iter_github_sources())
+    high_sources = list(registry.iter_github_sources(priority=Priority.HIGH))
+    other_sources = list(registry.iter_github_sources(categories=["other_repos"]))
+
+    assert [s.name for s in all_sources] == ["Test Repo", "Other High", "Other Low"]
+    assert [s.name for s in high_sources] == ["Test Repo", "Other High"]
+    assert [s.name for s in other_sources] == ["Other High", "Other Low"]
+    assert list(registry.iter_github_sources(categories=[])) == []
+
+    requested = registry.iter_github_sources(categories=["other_repos", "missing", "test_repos", "other_repos"])
+    assert [s.name for s in requested] == ["Other High", "Other Low", "Test Repo"]